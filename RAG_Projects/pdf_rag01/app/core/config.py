@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,16 +18,63 @@ class Settings(BaseSettings):
     PORT: int
     
 
-    pinecone_api_key: str = Field(alias="PINECONE_API_KEY")
-    pinecone_index_name: str = Field(alias="PINECONE_INDEX_NAME")
-    pinecone_cloud: str = Field(alias="PINECONE_CLOUD")
-    pinecone_region: str = Field(alias="PINECONE_REGION")
+    # "pinecone" or "local".
+    vector_store: str = Field(
+        default="pinecone",
+        alias="VECTOR_STORE",
+    )
+
+    # Only required when VECTOR_STORE=pinecone.
+    pinecone_api_key: str | None = Field(default=None, alias="PINECONE_API_KEY")
+    pinecone_index_name: str | None = Field(default=None, alias="PINECONE_INDEX_NAME")
+    pinecone_cloud: str | None = Field(default=None, alias="PINECONE_CLOUD")
+    pinecone_region: str | None = Field(default=None, alias="PINECONE_REGION")
+
+    # Set to an empty value to keep the local vector store in memory only.
+    local_vector_store_path: str | None = Field(
+        default=".cache/vector_store",
+        alias="LOCAL_VECTOR_STORE_PATH",
+    )
+
+    # Namespaces with at least this many vectors use an IVF index.
+    # 0 disables IVF and always searches exhaustively.
+    local_vector_store_ivf_min_vectors: int = Field(
+        default=50_000,
+        alias="LOCAL_VECTOR_STORE_IVF_MIN_VECTORS",
+    )
+
+    local_vector_store_ivf_probes: int = Field(
+        default=32,
+        alias="LOCAL_VECTOR_STORE_IVF_PROBES",
+    )
+
+    # Changes are written to disk this long after a write. Set to an
+    # empty value to save only on shutdown.
+    local_vector_store_autosave_seconds: float | None = Field(
+        default=5.0,
+        alias="LOCAL_VECTOR_STORE_AUTOSAVE_SECONDS",
+    )
 
     vector_db_batch_size: int = Field(
                 default=100,
                 alias="VECTOR_DB_BATCH_SIZE",
             )
 
+    vector_db_upsert_concurrency: int = Field(
+        default=4,
+        alias="VECTOR_DB_UPSERT_CONCURRENCY",
+    )
+
+    vector_db_upsert_max_retries: int = Field(
+        default=3,
+        alias="VECTOR_DB_UPSERT_MAX_RETRIES",
+    )
+
+    vector_db_upsert_retry_backoff_seconds: float = Field(
+        default=0.5,
+        alias="VECTOR_DB_UPSERT_RETRY_BACKOFF_SECONDS",
+    )
+
     embedding_model: str = Field(alias="EMBEDDING_MODEL")
     embedding_dimension: int = Field(alias="EMBEDDING_DIMENSION")
 
@@ -44,6 +91,44 @@ class Settings(BaseSettings):
         alias="NORMALIZE_EMBEDDINGS",
     )
 
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        alias="EMBEDDING_CACHE_ENABLED",
+    )
+
+    embedding_cache_max_entries: int = Field(
+        default=10_000,
+        alias="EMBEDDING_CACHE_MAX_ENTRIES",
+    )
+
+    # Set to an empty value to keep the cache in memory only.
+    embedding_cache_path: str | None = Field(
+        default=".cache/embeddings.sqlite3",
+        alias="EMBEDDING_CACHE_PATH",
+    )
+
+    # Coalesce concurrent single-query embed() calls into one model call.
+    embedding_micro_batching_enabled: bool = Field(
+        default=True,
+        alias="EMBEDDING_MICRO_BATCHING_ENABLED",
+    )
+
+    embedding_micro_batch_max_size: int = Field(
+        default=32,
+        alias="EMBEDDING_MICRO_BATCH_MAX_SIZE",
+    )
+
+    # How long the first query in a batch waits for others to join.
+    embedding_micro_batch_max_wait_ms: float = Field(
+        default=2.0,
+        alias="EMBEDDING_MICRO_BATCH_MAX_WAIT_MS",
+    )
+
+    embedding_micro_batch_max_queue: int = Field(
+        default=1024,
+        alias="EMBEDDING_MICRO_BATCH_MAX_QUEUE",
+    )
+
     similarity_metric: str = Field(alias="SIMILARITY_METRIC")
 
     document_loader: str = Field(
@@ -51,11 +136,232 @@ class Settings(BaseSettings):
     alias="DOCUMENT_LOADER",
     )
 
+    # Process pool size for PDF partitioning. 1 keeps parsing in a thread.
+    document_loader_workers: int = Field(
+        default=1,
+        alias="DOCUMENT_LOADER_WORKERS",
+    )
+
+    document_loader_pages_per_shard: int = Field(
+        default=16,
+        alias="DOCUMENT_LOADER_PAGES_PER_SHARD",
+    )
+
+    ingestion_streaming_enabled: bool = Field(
+        default=False,
+        alias="INGESTION_STREAMING_ENABLED",
+    )
+
+    ingestion_pages_per_window: int = Field(
+        default=10,
+        alias="INGESTION_PAGES_PER_WINDOW",
+    )
+
+    # Max items waiting between two streaming stages.
+    ingestion_queue_size: int = Field(
+        default=4,
+        alias="INGESTION_QUEUE_SIZE",
+    )
+
+    ingestion_upsert_workers: int = Field(
+        default=2,
+        alias="INGESTION_UPSERT_WORKERS",
+    )
+
+    # Set to an empty value to disable dedup and incremental re-ingestion.
+    document_registry_path: str | None = Field(
+        default=".cache/documents.sqlite3",
+        alias="DOCUMENT_REGISTRY_PATH",
+    )
+
+    ingestion_job_workers: int = Field(
+        default=2,
+        alias="INGESTION_JOB_WORKERS",
+    )
+
+    # Set to persist jobs in SQLite and resume them after a restart.
+    ingestion_job_store_path: str | None = Field(
+        default=None,
+        alias="INGESTION_JOB_STORE_PATH",
+    )
+
+    ingestion_upload_dir: str = Field(
+        default=".cache/uploads",
+        alias="INGESTION_UPLOAD_DIR",
+    )
+
+    ingestion_upload_chunk_bytes: int = Field(
+        default=1024 * 1024,
+        alias="INGESTION_UPLOAD_CHUNK_BYTES",
+    )
+
+    # Concurrent vector searches per /retrieval/search/batch request.
+    retrieval_batch_concurrency: int = Field(
+        default=8,
+        alias="RETRIEVAL_BATCH_CONCURRENCY",
+    )
+
+    retrieval_batch_max_queries: int = Field(
+        default=256,
+        alias="RETRIEVAL_BATCH_MAX_QUERIES",
+    )
+
+    # "none" keeps vector order, "cross_encoder" reranks with RERANKER_MODEL.
+    reranker: str = Field(
+        default="none",
+        alias="RERANKER",
+    )
+
+    reranker_model: str = Field(
+        default="cross-encoder/ms-marco-MiniLM-L-6-v2",
+        alias="RERANKER_MODEL",
+    )
+
+    # Token cap for each (query, chunk) pair fed to the cross-encoder.
+    reranker_max_tokens: int = Field(
+        default=512,
+        alias="RERANKER_MAX_TOKENS",
+    )
+
+    reranker_batch_size: int = Field(
+        default=32,
+        alias="RERANKER_BATCH_SIZE",
+    )
+
+    # Keep vector order when scoring takes longer. Empty means no limit.
+    reranker_latency_budget_ms: float | None = Field(
+        default=None,
+        alias="RERANKER_LATENCY_BUDGET_MS",
+    )
+
+    reranker_cache_max_entries: int = Field(
+        default=10_000,
+        alias="RERANKER_CACHE_MAX_ENTRIES",
+    )
+
+    # Candidates fetched per modality for convex / RRF fusion, as a
+    # multiple of top_k.
+    retrieval_fusion_over_fetch: int = Field(
+        default=4,
+        alias="RETRIEVAL_FUSION_OVER_FETCH",
+    )
+
+    retrieval_rrf_k: int = Field(
+        default=60,
+        alias="RETRIEVAL_RRF_K",
+    )
+
+    # Candidates fetched for MMR selection, as a multiple of top_k.
+    retrieval_mmr_over_fetch: int = Field(
+        default=4,
+        alias="RETRIEVAL_MMR_OVER_FETCH",
+    )
+
+    retrieval_cache_enabled: bool = Field(
+        default=True,
+        alias="RETRIEVAL_CACHE_ENABLED",
+    )
+
+    retrieval_cache_max_entries: int = Field(
+        default=1024,
+        alias="RETRIEVAL_CACHE_MAX_ENTRIES",
+    )
+
+    retrieval_cache_ttl_seconds: float = Field(
+        default=300.0,
+        alias="RETRIEVAL_CACHE_TTL_SECONDS",
+    )
+
+    # Cosine similarity for reusing a near-duplicate query's results.
+    # Set to an empty value to use exact matches only.
+    retrieval_cache_similarity_threshold: float | None = Field(
+        default=0.95,
+        alias="RETRIEVAL_CACHE_SIMILARITY_THRESHOLD",
+    )
+
+    # Embed small child chunks and return their parent sections.
+    hierarchical_chunking_enabled: bool = Field(
+        default=False,
+        alias="HIERARCHICAL_CHUNKING_ENABLED",
+    )
+
+    child_chunk_tokens: int = Field(
+        default=128,
+        alias="CHILD_CHUNK_TOKENS",
+    )
+
+    # Children are cut on sentence boundaries; trailing sentences of a
+    # child are repeated in the next one up to this many tokens.
+    child_chunk_overlap_tokens: int = Field(
+        default=16,
+        alias="CHILD_CHUNK_OVERLAP_TOKENS",
+    )
+
+    # Where parent chunks live. Set to an empty value to disable
+    # hierarchical chunking and parent resolution.
+    parent_chunk_store_path: str | None = Field(
+        default=".cache/parent_chunks.sqlite3",
+        alias="PARENT_CHUNK_STORE_PATH",
+    )
+
+    # Chunks whose word shingles overlap at least this much (estimated
+    # Jaccard similarity) with an earlier chunk are embedded once. Set
+    # to an empty value to disable deduplication.
+    near_duplicate_threshold: float | None = Field(
+        default=0.85,
+        alias="NEAR_DUPLICATE_THRESHOLD",
+    )
+
+    # OpenAI-compatible chat completions endpoint used for generation.
+    grok_api_key: str | None = Field(
+        default=None,
+        alias="GROK_API_KEY",
+    )
+
+    grok_base_url: str = Field(
+        default="https://api.x.ai/v1",
+        alias="GROK_BASE_URL",
+    )
+
+    grok_model: str = Field(
+        default="grok-3-mini",
+        alias="GROK_MODEL",
+    )
+
+    # Idle provider connections are kept this long; a warm-up is only
+    # sent when the pool may have gone cold.
+    grok_keepalive_seconds: float = Field(
+        default=60.0,
+        alias="GROK_KEEPALIVE_SECONDS",
+    )
+
     max_chunk_tokens: int = 512
     chunk_overlap_tokens: int = 50
 
+    # Trailing sentences repeated at the start of the next window when a
+    # chunk is split, within chunk_overlap_tokens.
+    chunk_overlap_sentences: int = 1
+
     tokenizer_encoding: str = "cl100k_base"
 
+    @field_validator(
+        "reranker_latency_budget_ms",
+        "retrieval_cache_similarity_threshold",
+        "local_vector_store_autosave_seconds",
+        "near_duplicate_threshold",
+        mode="before",
+    )
+    @classmethod
+    def _empty_to_none(cls, value: object) -> object:
+        """
+        Optional numbers set to an empty value (or "none") are unset.
+        """
+
+        if isinstance(value, str) and value.strip().lower() in ("", "none"):
+            return None
+
+        return value
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -18,4 +18,11 @@ class PromptType(StrEnum):
 
 class PromptStatus(StrEnum):
     ACTIVE = "active"
-    DEPRECATED = "deprecated"
\ No newline at end of file
+    DEPRECATED = "deprecated"
+
+
+class GenerationEventType(StrEnum):
+    RETRIEVAL = "retrieval"
+    TOKEN = "token"
+    DONE = "done"
+    ERROR = "error"
\ No newline at end of file
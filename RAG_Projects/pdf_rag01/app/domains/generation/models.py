@@ -4,9 +4,10 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.domains.generation.enums import (
+    GenerationEventType,
     MessageRole,
     PromptStatus,
     PromptType,
@@ -83,7 +84,8 @@ class TokenizedMessage(BaseModel):
 
 
 class ContextWindow(BaseModel):
-    messages: list[ChatMessage]
+    context: str
+    history: list[ChatMessage]
     token_budget: TokenBudget
     token_usage: TokenUsage
 
@@ -129,7 +131,8 @@ class PromptVariables(BaseModel):
 class GenerationRequest(BaseModel):
     query: str
 
-    retrieval_context: str
+    # Unused by the pipeline, which retrieves the context itself.
+    retrieval_context: str | None = None
 
     conversation_history: list[ChatMessage] = Field(default_factory=list)
 
@@ -137,6 +140,21 @@ class GenerationRequest(BaseModel):
 
     prompt_version: str = "latest"
 
+    top_k: int = Field(default=5, ge=1, le=100)
+
+    namespace: str | None = None
+
+    max_context_tokens: int = 8192
+
+    reserved_response_tokens: int = 1024
+
+    max_response_tokens: int = 1024
+
+    temperature: float = 0.2
+
+    # Stream the answer as Server-Sent Events.
+    stream: bool = False
+
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 class ContextChunk(BaseModel):
@@ -158,6 +176,21 @@ class TokenizedContextChunk(BaseModel):
 
     token_count: int
 
+
+class RetrievalContext(BaseModel):
+    results: list[ContextChunk]
+
+    total_results: int = 0
+
+class TimingSpan(BaseModel):
+    stage: str
+
+    # Offset from the start of the request.
+    start_ms: float
+
+    duration_ms: float
+
+
 class GenerationResult(BaseModel):
     answer: str
 
@@ -165,6 +198,8 @@ class GenerationResult(BaseModel):
 
     usage: UsageMetrics | None = None
 
+    timings: list[TimingSpan] = Field(default_factory=list)
+
     raw_response: str | None = None
 
 class LLMRequest(BaseModel):
@@ -188,4 +223,21 @@ class LLMResponse(BaseModel):
 
     usage: UsageMetrics | None = None
 
-    raw_response: dict[str, Any] | None = None
\ No newline at end of file
+    raw_response: dict[str, Any] | None = None
+
+
+class LLMStreamChunk(BaseModel):
+    # Text added by this chunk.
+    content: str = ""
+
+    # Set on the last content chunk.
+    finish_reason: str | None = None
+
+    # Sent by the provider after the last content chunk.
+    usage: UsageMetrics | None = None
+
+
+class GenerationStreamEvent(BaseModel):
+    event: GenerationEventType
+
+    data: dict[str, Any] = Field(default_factory=dict)
\ No newline at end of file
@@ -1,8 +1,14 @@
+import json
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
-from .models import GenerationRequest, GenerationResult
+from app.rag_services.generation.dependency import get_generation_service
+
+from .enums import GenerationEventType
+from .models import GenerationRequest, GenerationResult, GenerationStreamEvent
 from .services import GenerationService
 
 router = APIRouter(
@@ -11,7 +17,20 @@ router = APIRouter(
 )
 
 
-@router.post("")
+@router.post(
+    "",
+    response_model=GenerationResult,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"text/event-stream": {}},
+            "description": (
+                "With `stream: true`, Server-Sent Events: one `retrieval` "
+                "event, `token` events as the answer is generated, then "
+                "`done` (or `error`)."
+            ),
+        },
+    },
+)
 async def query(
     request: GenerationRequest,
     service: GenerationService = Depends(
@@ -19,6 +38,53 @@ async def query(
     ),
 ):
 
+    if request.stream:
+        return StreamingResponse(
+            _to_server_sent_events(
+                service.stream(request)
+            ),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                # Stops reverse proxies from buffering the stream.
+                "X-Accel-Buffering": "no",
+            },
+        )
+
     return await service.generate(
         request
-    )
\ No newline at end of file
+    )
+
+
+async def _to_server_sent_events(
+    events: AsyncIterator[GenerationStreamEvent],
+) -> AsyncIterator[str]:
+    """
+    Frame events as SSE. Once streaming has started the status code is
+    already sent, so failures are reported as an `error` event.
+    """
+
+    try:
+        async for event in events:
+            yield _frame(event)
+
+    except Exception as exc:
+        logger.exception(
+            f"Streaming generation failed: {exc}"
+        )
+
+        yield _frame(
+            GenerationStreamEvent(
+                event=GenerationEventType.ERROR,
+                data={"detail": "Generation failed."},
+            )
+        )
+
+
+def _frame(
+    event: GenerationStreamEvent,
+) -> str:
+    return (
+        f"event: {event.event.value}\n"
+        f"data: {json.dumps(event.data, default=str)}\n\n"
+    )
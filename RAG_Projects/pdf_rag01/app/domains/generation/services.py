@@ -1,6 +1,11 @@
+from collections.abc import AsyncIterator
 
 from app.rag_services.generation.content_window.interfaces.pipeline import GenerationPipeline
-from app.domains.generation.models import GenerationRequest, GenerationResult
+from app.domains.generation.models import (
+    GenerationRequest,
+    GenerationResult,
+    GenerationStreamEvent,
+)
 
 class GenerationService:
 
@@ -13,8 +18,17 @@ class GenerationService:
     async def generate(
         self,
         request: GenerationRequest,
-    ):
+    ) -> GenerationResult:
 
         return await self._pipeline.generate(
             request
-        )
\ No newline at end of file
+        )
+
+    def stream(
+        self,
+        request: GenerationRequest,
+    ) -> AsyncIterator[GenerationStreamEvent]:
+
+        return self._pipeline.stream(
+            request
+        )
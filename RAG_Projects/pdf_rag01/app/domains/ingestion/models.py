@@ -1,9 +1,16 @@
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict
 
+from app.rag_services.ingestion.jobs.models import IngestionJob, JobStatus
+from app.rag_services.ingestion.models.ingestion_progress import (
+    IngestionStage,
+)
+
 
 class UploadResponse(BaseModel):
     """
-    Response returned after successful document ingestion.
+    Response returned once an upload has been queued for ingestion.
     """
 
     model_config = ConfigDict(
@@ -13,12 +20,68 @@ class UploadResponse(BaseModel):
 
     message: str
 
-    document_id: str
+    job_id: str
 
     filename: str
 
-    chunk_count: int
+    status: JobStatus
+
+
+class IngestionJobResponse(BaseModel):
+    """
+    Status and progress of an ingestion job.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    job_id: str
+
+    filename: str
+
+    status: JobStatus
+
+    stage: IngestionStage
+
+    chunks_embedded: int
+
+    vectors_upserted: int
+
+    document_id: str | None = None
+
+    chunk_count: int | None = None
+
+    vector_count: int | None = None
+
+    processing_time_ms: float | None = None
+
+    error: str | None = None
+
+    created_at: datetime
+
+    updated_at: datetime
 
-    vector_count: int
+    @classmethod
+    def from_job(
+        cls,
+        job: IngestionJob,
+    ) -> "IngestionJobResponse":
+        result = job.result
 
-    processing_time_ms: float
\ No newline at end of file
+        return cls(
+            job_id=job.job_id,
+            filename=job.filename,
+            status=job.status,
+            stage=job.stage,
+            chunks_embedded=job.chunks_embedded,
+            vectors_upserted=job.vectors_upserted,
+            document_id=result.document_id if result else None,
+            chunk_count=result.chunk_count if result else None,
+            vector_count=result.vector_count if result else None,
+            processing_time_ms=result.processing_time_ms if result else None,
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
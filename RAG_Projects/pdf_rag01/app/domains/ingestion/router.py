@@ -1,16 +1,18 @@
+from contextlib import suppress
 from pathlib import Path
-import tempfile
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from loguru import logger
 
-from app.domains.ingestion.services import get_document_ingestion_pipeline
-
-from app.rag_services.ingestion.pipeline.document_ingestion_pipeline import (
-    DocumentIngestionPipeline,
+from app.core.config import get_settings
+from app.domains.ingestion.services import save_upload
+from app.infrastructure.embeddings.providers import get_ingestion_job_queue
+from app.rag_services.ingestion.jobs.ingestion_job_queue import (
+    IngestionJobQueue,
 )
 
-from app.domains.ingestion.models import UploadResponse
+from app.domains.ingestion.models import IngestionJobResponse, UploadResponse
 
 router = APIRouter(
     prefix="/documents",
@@ -20,15 +22,28 @@ router = APIRouter(
 @router.post(
     "/upload",
     response_model=UploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def upload_document(
     file: UploadFile = File(...),
-    pipeline: DocumentIngestionPipeline = Depends(
-        get_document_ingestion_pipeline,
+    document_id: str | None = Form(
+        default=None,
+        min_length=1,
+        max_length=128,
+    ),
+    job_queue: IngestionJobQueue = Depends(
+        get_ingestion_job_queue,
     ),
 ) -> UploadResponse:
     """
-    Upload and ingest a PDF document.
+    Upload a PDF document and queue it for ingestion.
+
+    Pass the `document_id` of an ingested document to upload a new
+    revision of it; only its changed chunks are re-embedded and chunks
+    that disappeared are deleted. Without it the file is ingested as a
+    new document, whatever its filename.
+
+    Poll GET /documents/jobs/{job_id} for progress.
     """
 
     if file.content_type != "application/pdf":
@@ -40,48 +55,80 @@ async def upload_document(
     logger.info(
         f"Uploading '{file.filename}'."
     )
-    temp_path: Path | None = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf",
-            delete=False,
-        ) as tmp:
-
-            contents = await file.read()
 
-            tmp.write(contents)
+    settings = get_settings()
 
-            temp_path = Path(tmp.name)
+    job_id = str(uuid4())
 
-        result = await pipeline.ingest(
-            temp_path,
-        )
+    # One directory per job keeps the original filename.
+    upload_path = (
+        Path(settings.ingestion_upload_dir)
+        / job_id
+        / Path(file.filename or "document.pdf").name
+    )
 
-        logger.info(
-            f"Successfully ingested '{file.filename}'."
+    try:
+        size = await save_upload(
+            file,
+            upload_path,
+            chunk_size=settings.ingestion_upload_chunk_bytes,
         )
 
-        return UploadResponse(
-            message="Document ingested successfully.",
-            document_id=result.document_id,
-            filename=result.filename,
-            chunk_count=result.chunk_count,
-            vector_count=result.vector_count,
-            processing_time_ms=result.processing_time_ms,
+        job = await job_queue.submit(
+            filename=file.filename,
+            file_path=upload_path,
+            job_id=job_id,
+            document_id=document_id,
         )
 
     except Exception as exc:
 
         logger.exception(
-            f"Failed to ingest '{file.filename}'."
+            f"Failed to queue '{file.filename}'."
         )
 
+        upload_path.unlink(missing_ok=True)
+
+        with suppress(OSError):
+            upload_path.parent.rmdir()
+
         raise HTTPException(
             status_code=500,
             detail=str(exc),
         )
 
-    finally:
+    logger.info(
+        f"Queued '{file.filename}' ({size} bytes) as job '{job.job_id}'."
+    )
+
+    return UploadResponse(
+        message="Document queued for ingestion.",
+        job_id=job.job_id,
+        filename=job.filename,
+        status=job.status,
+    )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=IngestionJobResponse,
+)
+async def get_ingestion_job(
+    job_id: str,
+    job_queue: IngestionJobQueue = Depends(
+        get_ingestion_job_queue,
+    ),
+) -> IngestionJobResponse:
+    """
+    Return the status and progress of an ingestion job.
+    """
+
+    job = await job_queue.get(job_id)
+
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Ingestion job '{job_id}' not found.",
+        )
 
-        if temp_path and temp_path.exists():
-            temp_path.unlink(missing_ok=True)
\ No newline at end of file
+    return IngestionJobResponse.from_job(job)
@@ -1,6 +1,15 @@
+import asyncio
+from pathlib import Path
+
+from fastapi import UploadFile
+
+from app.core.config import get_settings
 from app.rag_services.ingestion.pipeline.document_ingestion_pipeline import (
     DocumentIngestionPipeline,
 )
+from app.rag_services.ingestion.pipeline.streaming_ingestion_pipeline import (
+    StreamingDocumentIngestionPipeline,
+)
 
 # import all implementations
 from app.rag_services.ingestion.loaders.unstructured_document_loader import (
@@ -16,11 +25,14 @@ from app.rag_services.ingestion.chunkers.semantic_element_chunker import (
 from app.rag_services.ingestion.chunkers.token_aware_chunker import (
     TokenAwareChunker,
 )
+from app.rag_services.ingestion.chunkers.parent_child_chunker import (
+    ParentChildChunker,
+)
 from app.rag_services.ingestion.enrichers.default_chunk_enricher import (
     DefaultChunkEnricher,
 )
-from app.rag_services.ingestion.splitters.token_splitter import (
-    TokenSplitter,
+from app.rag_services.ingestion.splitters.sentence_splitter import (
+    SentenceSplitter,
 )
 from app.rag_services.ingestion.tokenizers.tiktoken_token_counter import (
     TiktokenTokenCounter,
@@ -32,7 +44,7 @@ from app.infrastructure.embeddings.vector_document_builder import (
 from app.infrastructure.embeddings.dense.sentence_transformer import SentenceTransformerDenseEmbedder
 from app.infrastructure.embeddings.sparse.fastembed_sparse import FastEmbedSparseEmbedder
 
-from app.infrastructure.embeddings.providers import get_dense_embedder, get_sparse_embedder
+from app.infrastructure.embeddings.providers import get_dense_embedder, get_sparse_embedder, get_vector_repository, get_partition_executor, get_document_registry, get_parent_chunk_store
 
 from app.rag_services.ingestion.filters.document_filter_pipeline import DefaultDocumentFilterPipeline
 from app.rag_services.ingestion.filters.blank_element_filter import BlankElementFilter
@@ -40,19 +52,23 @@ from app.rag_services.ingestion.filters.header_footer_filter import HeaderFooter
 from app.rag_services.ingestion.filters.front_matter_filter import FrontMatterFilter 
 from app.rag_services.ingestion.filters.page_number_filter import PageNumberFilter
 from app.rag_services.ingestion.filters.table_of_content_filter import TableOfContentsFilter 
-from app.infrastructure.vector_db.pinecone_repository import (
-    PineconeRepository,
-)
+from app.rag_services.ingestion.filters.boilerplate_repetition_filter import BoilerplateRepetitionFilter
 
 
 
 
 
-def get_document_ingestion_pipeline() -> DocumentIngestionPipeline:
+def get_document_ingestion_pipeline() -> (
+    DocumentIngestionPipeline | StreamingDocumentIngestionPipeline
+):
     """
     Dependency provider.
+
+    Returns the streaming pipeline when INGESTION_STREAMING_ENABLED is set.
     """
 
+    settings = get_settings()
+
     token_counter = TiktokenTokenCounter()
 
     filter_pipeline = DefaultDocumentFilterPipeline(
@@ -62,28 +78,95 @@ def get_document_ingestion_pipeline() -> DocumentIngestionPipeline:
                 PageNumberFilter(),
                 TableOfContentsFilter(),
                 FrontMatterFilter(),
-                # BoilerplateRepetitionFilter(),
+                BoilerplateRepetitionFilter(),
             ]
         )
 
     chunker = TokenAwareChunker(
         chunker=SemanticElementChunker(),
         token_counter=token_counter,
-        splitter=TokenSplitter(
+        splitter=SentenceSplitter(
             token_counter=token_counter,
         ),
     )
 
+    parent_store = None
+
+    if settings.hierarchical_chunking_enabled:
+        parent_store = get_parent_chunk_store()
+
+        if parent_store is not None:
+            chunker = ParentChildChunker(
+                chunker=chunker,
+                token_counter=token_counter,
+                splitter=SentenceSplitter(
+                    token_counter=token_counter,
+                    max_tokens=settings.child_chunk_tokens,
+                    overlap_tokens=settings.child_chunk_overlap_tokens,
+                ),
+                child_chunk_tokens=settings.child_chunk_tokens,
+            )
+
+    loader = UnstructuredDocumentLoader(
+        executor=get_partition_executor(),
+        pages_per_shard=settings.document_loader_pages_per_shard,
+        max_workers=settings.document_loader_workers,
+    )
+
+    vector_document_builder = VectorDocumentBuilder(
+        dense_embedder=get_dense_embedder(),
+        sparse_embedder=get_sparse_embedder(),
+    )
+
+    if settings.ingestion_streaming_enabled:
+        return StreamingDocumentIngestionPipeline(
+            loader=loader,
+            preprocessor=DefaultDocumentPreprocessor(),
+            filter_pipeline=filter_pipeline,
+            chunker=chunker,
+            enricher=DefaultChunkEnricher(),
+            vector_document_builder=vector_document_builder,
+            repository=get_vector_repository(),
+            registry=get_document_registry(),
+            parent_store=parent_store,
+            pages_per_window=settings.ingestion_pages_per_window,
+            embedding_batch_size=settings.embedding_batch_size,
+            queue_size=settings.ingestion_queue_size,
+            upsert_workers=settings.ingestion_upsert_workers,
+            near_duplicate_threshold=settings.near_duplicate_threshold,
+        )
 
     return DocumentIngestionPipeline(
-        loader=UnstructuredDocumentLoader(),
+        loader=loader,
         preprocessor=DefaultDocumentPreprocessor(),
         filter_pipeline=filter_pipeline,
         chunker=chunker,
         enricher=DefaultChunkEnricher(),
-        vector_document_builder=VectorDocumentBuilder(
-            dense_embedder=get_dense_embedder(),
-            sparse_embedder=get_sparse_embedder(),
-        ),
-        repository=PineconeRepository(),
-    )
\ No newline at end of file
+        vector_document_builder=vector_document_builder,
+        repository=get_vector_repository(),
+        registry=get_document_registry(),
+        parent_store=parent_store,
+        near_duplicate_threshold=settings.near_duplicate_threshold,
+    )
+
+async def save_upload(
+    file: UploadFile,
+    destination: Path,
+    chunk_size: int,
+) -> int:
+    """
+    Stream an upload to disk chunk by chunk.
+
+    Returns the number of bytes written.
+    """
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+
+    written = 0
+
+    with destination.open("wb") as output:
+        while chunk := await file.read(chunk_size):
+            await asyncio.to_thread(output.write, chunk)
+            written += len(chunk)
+
+    return written
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.rag_services.retrieval.models.fusion import FusionMode
+
 
 class RetrievalRequestBody(BaseModel):
     """
@@ -23,6 +25,31 @@ class RetrievalRequestBody(BaseModel):
         description="Maximum number of chunks to retrieve.",
     )
 
+    fusion_mode: FusionMode = Field(
+        default=FusionMode.NATIVE,
+        description=(
+            "native, convex, rrf, dense or sparse. "
+            "native lets the vector store combine both vectors."
+        ),
+    )
+
+    alpha: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Dense weight for convex and RRF fusion.",
+    )
+
+    mmr_lambda: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Set to return diverse chunks instead of near-duplicates. "
+            "1 favours relevance, 0 favours diversity."
+        ),
+    )
+
 
 class RetrievalResponse(BaseModel):
     """
@@ -33,4 +60,31 @@ class RetrievalResponse(BaseModel):
 
     chunk_ids: list[str]
 
-    total_chunks: int
\ No newline at end of file
+    total_chunks: int
+
+class BatchRetrievalRequestBody(BaseModel):
+    """
+    HTTP request model for retrieving many queries at once.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    queries: list[RetrievalRequestBody] = Field(
+        ...,
+        min_length=1,
+        description="Queries to retrieve, answered in order.",
+    )
+
+
+class BatchRetrievalResponse(BaseModel):
+    """
+    HTTP response model for batch retrieval.
+
+    `results[i]` answers `queries[i]`.
+    """
+
+    results: list[RetrievalResponse]
+
+    total_queries: int
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from loguru import logger
 
 from .models import (
+    BatchRetrievalRequestBody,
+    BatchRetrievalResponse,
     RetrievalRequestBody,
     RetrievalResponse,
 )
+from app.core.config import get_settings
 from app.domains.retrieval.services import RetrievalService
 from app.rag_services.dependencies.retrieval import get_retrieval_service
 
@@ -39,4 +42,45 @@ async def search_documents(
         "Retrieval completed successfully."
     )
 
-    return response
\ No newline at end of file
+    return response
+
+
+@router.post(
+    "/search/batch",
+    response_model=BatchRetrievalResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def search_documents_batch(
+    request: BatchRetrievalRequestBody,
+    retrieval_service: RetrievalService = Depends(
+        get_retrieval_service,
+    ),
+) -> BatchRetrievalResponse:
+    """
+    Retrieve chunks for many queries in one call.
+
+    Queries are embedded together and searched concurrently.
+    """
+
+    max_queries = get_settings().retrieval_batch_max_queries
+
+    if len(request.queries) > max_queries:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {max_queries} queries are allowed per batch.",
+        )
+
+    logger.info(
+        f"Received batch retrieval request for "
+        f"{len(request.queries)} queries."
+    )
+
+    response = await retrieval_service.retrieve_batch(
+        request,
+    )
+
+    logger.success(
+        "Batch retrieval completed successfully."
+    )
+
+    return response
@@ -1,13 +1,21 @@
 from loguru import logger
 
+from app.rag_services.retrieval.interfaces.context_builder import (
+    ContextBuilder,
+)
 from app.rag_services.retrieval.models.retrieval_request import (
     RetrievalRequest,
 )
+from app.rag_services.retrieval.models.retrieval_result import (
+    RetrievalContext,
+)
 from app.rag_services.retrieval.pipeline.retrieval_pipeline import (
     RetrievalPipeline,
 )
 
 from .models import (
+    BatchRetrievalRequestBody,
+    BatchRetrievalResponse,
     RetrievalRequestBody,
     RetrievalResponse,
 )
@@ -18,8 +26,12 @@ class RetrievalService:
     def __init__(
         self,
         retrieval_pipeline: RetrievalPipeline,
+        context_builder: ContextBuilder,
+        batch_concurrency: int = 8,
     ) -> None:
         self._pipeline = retrieval_pipeline
+        self._context_builder = context_builder
+        self._batch_concurrency = batch_concurrency
 
     async def retrieve(
         self,
@@ -30,19 +42,73 @@ class RetrievalService:
             f"Received retrieval request: '{request.query}'"
         )
 
-        llm_context = await self._pipeline.retrieve(
-            RetrievalRequest(
-                query=request.query,
-                top_k=request.top_k,
-            )
+        retrieval_context = await self._pipeline.retrieve(
+            _to_retrieval_request(request)
         )
 
+        response = await self._to_response(retrieval_context)
+
         logger.success(
-            f"Successfully retrieved {llm_context.total_chunks} chunks."
+            f"Successfully retrieved {response.total_chunks} chunks."
+        )
+
+        return response
+
+    async def retrieve_batch(
+        self,
+        request: BatchRetrievalRequestBody,
+    ) -> BatchRetrievalResponse:
+
+        logger.info(
+            f"Received batch retrieval request with "
+            f"{len(request.queries)} queries."
+        )
+
+        retrieval_contexts = await self._pipeline.retrieve_batch(
+            [
+                _to_retrieval_request(query)
+                for query in request.queries
+            ],
+            max_concurrency=self._batch_concurrency,
+        )
+
+        results = [
+            await self._to_response(retrieval_context)
+            for retrieval_context in retrieval_contexts
+        ]
+
+        logger.success(
+            f"Successfully answered {len(results)} retrieval queries."
+        )
+
+        return BatchRetrievalResponse(
+            results=results,
+            total_queries=len(results),
+        )
+
+    async def _to_response(
+        self,
+        retrieval_context: RetrievalContext,
+    ) -> RetrievalResponse:
+
+        llm_context = await self._context_builder.build(
+            retrieval_context.results
         )
 
         return RetrievalResponse(
             context=llm_context.context,
             chunk_ids=llm_context.chunk_ids,
             total_chunks=llm_context.total_chunks,
-        )
\ No newline at end of file
+        )
+
+
+def _to_retrieval_request(
+    request: RetrievalRequestBody,
+) -> RetrievalRequest:
+    return RetrievalRequest(
+        query=request.query,
+        top_k=request.top_k,
+        fusion_mode=request.fusion_mode,
+        alpha=request.alpha,
+        mmr_lambda=request.mmr_lambda,
+    )
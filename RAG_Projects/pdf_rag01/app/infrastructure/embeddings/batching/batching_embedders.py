@@ -0,0 +1,132 @@
+"""
+Micro-batching decorators for dense and sparse embedders.
+
+Responsibilities:
+- Wrap another embedder.
+- Route single-text `embed()` calls through a MicroBatcher so
+  concurrent queries share one model call.
+- Pass `embed_batch()` / `embed_matrix()` straight through; those
+  callers already batch.
+
+Wrap these around the cached embedders so cache hits are served inside
+the coalesced batch without reaching the model.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.infrastructure.embeddings.batching.micro_batcher import (
+    MicroBatcher,
+    MicroBatcherStats,
+)
+from app.infrastructure.embeddings.interfaces.dense_embedder import (
+    DenseEmbedder,
+)
+from app.infrastructure.embeddings.interfaces.sparse_embedder import (
+    SparseEmbedder,
+)
+from app.infrastructure.vector_db.models import DenseVector, SparseVector
+
+
+class BatchingDenseEmbedder(DenseEmbedder):
+    """
+    Dense embedder decorator that coalesces concurrent embed() calls.
+    """
+
+    def __init__(
+        self,
+        embedder: DenseEmbedder,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        max_queue_size: int = 1024,
+    ) -> None:
+        self._embedder = embedder
+
+        self._batcher: MicroBatcher[str, DenseVector] = MicroBatcher(
+            name="dense",
+            handler=embedder.embed_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+        )
+
+    @property
+    def model_name(self) -> str:
+        return self._embedder.model_name
+
+    @property
+    def normalize_embeddings(self) -> bool:
+        return self._embedder.normalize_embeddings
+
+    def stats(self) -> MicroBatcherStats:
+        return self._batcher.stats()
+
+    async def close(self) -> None:
+        await self._batcher.close()
+
+    async def embed(
+        self,
+        text: str,
+    ) -> DenseVector:
+        return await self._batcher.submit(text)
+
+    async def embed_batch(
+        self,
+        texts: list[str],
+    ) -> list[DenseVector]:
+        return await self._embedder.embed_batch(texts)
+
+    async def embed_matrix(
+        self,
+        texts: list[str],
+    ) -> np.ndarray:
+        return await self._embedder.embed_matrix(texts)
+
+    async def dimension(self) -> int:
+        return await self._embedder.dimension()
+
+
+class BatchingSparseEmbedder(SparseEmbedder):
+    """
+    Sparse embedder decorator that coalesces concurrent embed() calls.
+    """
+
+    def __init__(
+        self,
+        embedder: SparseEmbedder,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        max_queue_size: int = 1024,
+    ) -> None:
+        self._embedder = embedder
+
+        self._batcher: MicroBatcher[str, SparseVector] = MicroBatcher(
+            name="sparse",
+            handler=embedder.embed_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+        )
+
+    @property
+    def model_name(self) -> str:
+        return self._embedder.model_name
+
+    def stats(self) -> MicroBatcherStats:
+        return self._batcher.stats()
+
+    async def close(self) -> None:
+        await self._batcher.close()
+
+    async def embed(
+        self,
+        text: str,
+    ) -> SparseVector:
+        return await self._batcher.submit(text)
+
+    async def embed_batch(
+        self,
+        texts: list[str],
+    ) -> list[SparseVector]:
+        return await self._embedder.embed_batch(texts)
@@ -0,0 +1,249 @@
+"""
+Request-coalescing micro-batcher.
+
+Responsibilities:
+- Accept single items from many concurrent callers.
+- Collect them for up to `max_wait_ms` or `max_batch_size` items.
+- Run one batched handler call and resolve each caller's future.
+- Apply backpressure once `max_queue_size` items are waiting.
+- Track batch sizes, queue depth and queueing delay.
+
+Only one batch runs at a time. Items that arrive while a batch is
+running are collected into the next one, so batches grow with load
+instead of competing for the thread pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from loguru import logger
+from pydantic import BaseModel, computed_field
+
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+class MicroBatcherStats(BaseModel):
+    """
+    Snapshot of the micro-batcher counters.
+    """
+
+    batches: int = 0
+
+    items: int = 0
+
+    largest_batch: int = 0
+
+    queue_depth: int = 0
+
+    max_queue_depth: int = 0
+
+    total_wait_ms: float = 0.0
+
+    @computed_field
+    @property
+    def average_batch_size(self) -> float:
+        if not self.batches:
+            return 0.0
+        return self.items / self.batches
+
+    @computed_field
+    @property
+    def average_wait_ms(self) -> float:
+        if not self.items:
+            return 0.0
+        return self.total_wait_ms / self.items
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """
+    Coalesces concurrent single-item calls into batched handler calls.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[list[ItemT]], Awaitable[list[ResultT]]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        max_queue_size: int = 1024,
+    ) -> None:
+
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+
+        self._name = name
+        self._handler = handler
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._max_queue_size = max_queue_size
+
+        # Created lazily so the batcher binds to the running event loop.
+        self._queue: asyncio.Queue[_Pending[ItemT, ResultT]] | None = None
+        self._runner: asyncio.Task | None = None
+
+        self._batches = 0
+        self._items = 0
+        self._largest_batch = 0
+        self._max_queue_depth = 0
+        self._total_wait = 0.0
+
+    async def submit(
+        self,
+        item: ItemT,
+    ) -> ResultT:
+        """
+        Queue one item and wait for its result.
+        """
+
+        queue = self._ensure_started()
+
+        pending = _Pending(
+            item=item,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.perf_counter(),
+        )
+
+        await queue.put(pending)
+
+        self._max_queue_depth = max(self._max_queue_depth, queue.qsize())
+
+        return await pending.future
+
+    def stats(self) -> MicroBatcherStats:
+        """
+        Return the current batch and queue counters.
+        """
+
+        return MicroBatcherStats(
+            batches=self._batches,
+            items=self._items,
+            largest_batch=self._largest_batch,
+            queue_depth=self._queue.qsize() if self._queue else 0,
+            max_queue_depth=self._max_queue_depth,
+            total_wait_ms=self._total_wait * 1000,
+        )
+
+    async def close(self) -> None:
+        """
+        Stop the runner and fail items that are still waiting.
+        """
+
+        if self._runner is not None:
+            self._runner.cancel()
+
+            await asyncio.gather(
+                self._runner,
+                return_exceptions=True,
+            )
+
+            self._runner = None
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if not pending.future.done():
+                    pending.future.set_exception(
+                        RuntimeError(f"Micro-batcher '{self._name}' closed.")
+                    )
+
+    def _ensure_started(self) -> asyncio.Queue[_Pending[ItemT, ResultT]]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(
+                self._run(self._queue),
+                name=f"micro-batcher-{self._name}",
+            )
+
+        return self._queue
+
+    async def _run(
+        self,
+        queue: asyncio.Queue[_Pending[ItemT, ResultT]],
+    ) -> None:
+        while True:
+
+            batch = [await queue.get()]
+
+            deadline = asyncio.get_running_loop().time() + self._max_wait
+
+            while len(batch) < self._max_batch_size:
+
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        batch.append(await queue.get())
+                except TimeoutError:
+                    break
+
+            await self._dispatch(batch)
+
+    async def _dispatch(
+        self,
+        batch: list[_Pending[ItemT, ResultT]],
+    ) -> None:
+
+        # Callers that gave up (cancelled) are dropped before the call.
+        batch = [pending for pending in batch if not pending.future.done()]
+
+        if not batch:
+            return
+
+        started_at = time.perf_counter()
+
+        self._batches += 1
+        self._items += len(batch)
+        self._largest_batch = max(self._largest_batch, len(batch))
+        self._total_wait += sum(
+            started_at - pending.enqueued_at
+            for pending in batch
+        )
+
+        try:
+            results = await self._handler(
+                [pending.item for pending in batch]
+            )
+
+        except asyncio.CancelledError:
+            for pending in batch:
+                pending.future.cancel()
+            raise
+
+        except Exception as exc:
+            logger.exception(
+                f"Micro-batcher '{self._name}' failed a batch of "
+                f"{len(batch)} items: {exc}"
+            )
+
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+
+            return
+
+        for pending, result in zip(batch, results, strict=True):
+            if not pending.future.done():
+                pending.future.set_result(result)
+
+        logger.debug(
+            f"Micro-batcher '{self._name}' ran a batch of {len(batch)} items "
+            f"in {(time.perf_counter() - started_at) * 1000:.1f} ms."
+        )
+
+
+@dataclass(slots=True)
+class _Pending(Generic[ItemT, ResultT]):
+    item: ItemT
+    future: asyncio.Future[ResultT]
+    enqueued_at: float
@@ -0,0 +1,241 @@
+"""
+Caching decorators for dense and sparse embedders.
+
+Responsibilities:
+- Wrap another embedder.
+- Look every text up in the EmbeddingCache first.
+- Send only cache misses (deduplicated) to the wrapped model.
+- Store newly generated embeddings back into the cache.
+
+Vectors are stored as packed float32 / int32 arrays.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+import numpy as np
+from loguru import logger
+
+from app.infrastructure.embeddings.cache.embedding_cache import (
+    EmbeddingCache,
+    EmbeddingCacheStats,
+)
+from app.infrastructure.embeddings.interfaces.dense_embedder import (
+    DenseEmbedder,
+)
+from app.infrastructure.embeddings.interfaces.sparse_embedder import (
+    SparseEmbedder,
+)
+from app.infrastructure.vector_db.models import DenseVector, SparseVector
+
+
+def _encode_sparse(vector: SparseVector) -> bytes:
+    # Layout: [int32 indices][float32 values], both of equal length.
+    return (
+        array("i", vector.indices).tobytes()
+        + array("f", vector.values).tobytes()
+    )
+
+
+def _decode_sparse(payload: bytes) -> SparseVector:
+    half = len(payload) // 2
+    indices = array("i")
+    indices.frombytes(payload[:half])
+    values = array("f")
+    values.frombytes(payload[half:])
+    return SparseVector(
+        indices=indices.tolist(),
+        values=values.tolist(),
+    )
+
+
+class CachedDenseEmbedder(DenseEmbedder):
+    """
+    Dense embedder decorator backed by an EmbeddingCache.
+    """
+
+    def __init__(
+        self,
+        embedder: DenseEmbedder,
+        cache: EmbeddingCache,
+    ) -> None:
+        self._embedder = embedder
+        self._cache = cache
+
+    @property
+    def model_name(self) -> str:
+        return self._embedder.model_name
+
+    @property
+    def normalize_embeddings(self) -> bool:
+        return self._embedder.normalize_embeddings
+
+    def stats(self) -> EmbeddingCacheStats:
+        return self._cache.stats()
+
+    async def embed(
+        self,
+        text: str,
+    ) -> DenseVector:
+
+        vectors = await self.embed_batch([text])
+
+        return vectors[0]
+
+    async def embed_batch(
+        self,
+        texts: list[str],
+    ) -> list[DenseVector]:
+
+        embeddings = await self.embed_matrix(texts)
+
+        return [
+            DenseVector(values=embedding.tolist())
+            for embedding in embeddings
+        ]
+
+    async def embed_matrix(
+        self,
+        texts: list[str],
+    ) -> np.ndarray:
+
+        if not texts:
+            return np.empty(
+                (0, await self.dimension()),
+                dtype=np.float32,
+            )
+
+        keys = [
+            EmbeddingCache.make_key(
+                self.model_name,
+                self.normalize_embeddings,
+                text,
+            )
+            for text in texts
+        ]
+
+        cached = await self._cache.get_many(keys)
+
+        misses = _unique_misses(keys, texts, cached)
+
+        rows: dict[str, np.ndarray] = {
+            key: np.frombuffer(payload, dtype=np.float32)
+            for key, payload in cached.items()
+        }
+
+        if misses:
+            logger.debug(
+                f"Dense embedding cache: {len(texts) - len(misses)} hits, "
+                f"{len(misses)} texts sent to the model."
+            )
+
+            embeddings = await self._embedder.embed_matrix(
+                list(misses.values())
+            )
+
+            await self._cache.set_many(
+                {
+                    key: embedding.tobytes()
+                    for key, embedding in zip(misses, embeddings, strict=True)
+                }
+            )
+
+            rows.update(zip(misses, embeddings, strict=True))
+
+        # Assemble into a single contiguous matrix in request order.
+        return np.stack(
+            [rows[key] for key in keys]
+        ).astype(np.float32, copy=False)
+
+    async def dimension(self) -> int:
+        return await self._embedder.dimension()
+
+
+class CachedSparseEmbedder(SparseEmbedder):
+    """
+    Sparse embedder decorator backed by an EmbeddingCache.
+    """
+
+    def __init__(
+        self,
+        embedder: SparseEmbedder,
+        cache: EmbeddingCache,
+    ) -> None:
+        self._embedder = embedder
+        self._cache = cache
+
+    @property
+    def model_name(self) -> str:
+        return self._embedder.model_name
+
+    def stats(self) -> EmbeddingCacheStats:
+        return self._cache.stats()
+
+    async def embed(
+        self,
+        text: str,
+    ) -> SparseVector:
+
+        vectors = await self.embed_batch([text])
+
+        return vectors[0]
+
+    async def embed_batch(
+        self,
+        texts: list[str],
+    ) -> list[SparseVector]:
+
+        keys = [
+            EmbeddingCache.make_key(
+                self.model_name,
+                False,
+                text,
+            )
+            for text in texts
+        ]
+
+        cached = await self._cache.get_many(keys)
+
+        misses = _unique_misses(keys, texts, cached)
+
+        if misses:
+            logger.debug(
+                f"Sparse embedding cache: {len(texts) - len(misses)} hits, "
+                f"{len(misses)} texts sent to the model."
+            )
+
+            vectors = await self._embedder.embed_batch(
+                list(misses.values())
+            )
+
+            fresh = {
+                key: _encode_sparse(vector)
+                for key, vector in zip(misses, vectors, strict=True)
+            }
+
+            await self._cache.set_many(fresh)
+            cached = {**cached, **fresh}
+
+        return [
+            _decode_sparse(cached[key])
+            for key in keys
+        ]
+
+
+def _unique_misses(
+    keys: list[str],
+    texts: list[str],
+    cached: dict[str, bytes],
+) -> dict[str, str]:
+    """
+    Map every missing key to its text, keeping only the first occurrence.
+    """
+
+    misses: dict[str, str] = {}
+
+    for key, text in zip(keys, texts, strict=True):
+        if key not in cached and key not in misses:
+            misses[key] = text
+
+    return misses
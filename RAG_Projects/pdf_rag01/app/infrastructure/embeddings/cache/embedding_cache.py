@@ -0,0 +1,226 @@
+"""
+Two-tier embedding cache.
+
+Responsibilities:
+- Keep recently used embeddings in an in-process LRU.
+- Persist embeddings to an on-disk SQLite store so they survive restarts.
+- Build cache keys from (model name, normalize flag, sha256 of text).
+- Track hit / miss counters.
+
+The cache stores opaque bytes. Serialization of dense and sparse vectors
+belongs to the cached embedders.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel, computed_field
+
+
+class EmbeddingCacheStats(BaseModel):
+    """
+    Snapshot of the embedding cache counters.
+    """
+
+    memory_hits: int = 0
+
+    disk_hits: int = 0
+
+    misses: int = 0
+
+    memory_entries: int = 0
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        if not lookups:
+            return 0.0
+        return (self.memory_hits + self.disk_hits) / lookups
+
+
+class EmbeddingCache:
+    """
+    In-process LRU backed by an optional SQLite store.
+    """
+
+    def __init__(
+        self,
+        max_memory_entries: int = 10_000,
+        sqlite_path: Path | None = None,
+    ) -> None:
+
+        self._max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+        self._connection: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+
+        if sqlite_path is not None:
+            self._connection = self._open(sqlite_path)
+
+        logger.info(
+            f"Initialized embedding cache "
+            f"(memory_entries={max_memory_entries}, sqlite='{sqlite_path}')."
+        )
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        normalize: bool,
+        text: str,
+    ) -> str:
+        """
+        Build the cache key for a text embedded by a given model.
+        """
+
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        return f"{model_name}|{int(normalize)}|{digest}"
+
+    async def get_many(
+        self,
+        keys: list[str],
+    ) -> dict[str, bytes]:
+        """
+        Return cached values for the given keys. Missing keys are omitted.
+        """
+
+        found: dict[str, bytes] = {}
+        disk_lookup: list[str] = []
+
+        for key in keys:
+            value = self._memory.get(key)
+            if value is None:
+                disk_lookup.append(key)
+                continue
+            self._memory.move_to_end(key)
+            found[key] = value
+            self._memory_hits += 1
+
+        if disk_lookup and self._connection is not None:
+            disk_values = await asyncio.to_thread(
+                self._read,
+                disk_lookup,
+            )
+            self._disk_hits += len(disk_values)
+            for key, value in disk_values.items():
+                self._remember(key, value)
+            found.update(disk_values)
+
+        self._misses += len(keys) - len(found)
+
+        return found
+
+    async def set_many(
+        self,
+        items: dict[str, bytes],
+    ) -> None:
+        """
+        Store values in both tiers.
+        """
+
+        if not items:
+            return
+
+        for key, value in items.items():
+            self._remember(key, value)
+
+        if self._connection is not None:
+            await asyncio.to_thread(
+                self._write,
+                items,
+            )
+
+    def stats(self) -> EmbeddingCacheStats:
+        """
+        Return the current hit / miss counters.
+        """
+
+        return EmbeddingCacheStats(
+            memory_hits=self._memory_hits,
+            disk_hits=self._disk_hits,
+            misses=self._misses,
+            memory_entries=len(self._memory),
+        )
+
+    def close(self) -> None:
+        """
+        Close the SQLite connection.
+        """
+
+        if self._connection is not None:
+            with self._db_lock:
+                self._connection.close()
+            self._connection = None
+
+    def _remember(
+        self,
+        key: str,
+        value: bytes,
+    ) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _open(sqlite_path: Path) -> sqlite3.Connection:
+        sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(
+            sqlite_path,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, "
+            "value BLOB NOT NULL)"
+        )
+        connection.commit()
+
+        return connection
+
+    def _read(
+        self,
+        keys: list[str],
+    ) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+
+        with self._db_lock:
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(keys), 500):
+                part = keys[start:start + 500]
+                placeholders = ",".join("?" * len(part))
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM embeddings "
+                    f"WHERE key IN ({placeholders})",
+                    part,
+                )
+                found.update(rows)
+
+        return found
+
+    def _write(
+        self,
+        items: dict[str, bytes],
+    ) -> None:
+        with self._db_lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, value) VALUES (?, ?)",
+                items.items(),
+            )
+            self._connection.commit()
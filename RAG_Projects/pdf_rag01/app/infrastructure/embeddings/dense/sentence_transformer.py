@@ -4,6 +4,7 @@ SentenceTransformer dense embedding provider.
 
 import asyncio
 
+import numpy as np
 from loguru import logger
 from sentence_transformers import SentenceTransformer
 
@@ -25,6 +26,9 @@ class SentenceTransformerDenseEmbedder(DenseEmbedder):
             f"Loading dense embedding model '{settings.embedding_model}'."
         )
 
+        self._model_name = settings.embedding_model
+        self._normalize_embeddings = settings.normalize_embeddings
+
         self._model = SentenceTransformer(
             settings.embedding_model,
         )
@@ -33,6 +37,14 @@ class SentenceTransformerDenseEmbedder(DenseEmbedder):
             "Dense embedding model loaded successfully."
         )
 
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def normalize_embeddings(self) -> bool:
+        return self._normalize_embeddings
+
     async def embed(
         self,
         text: str,
@@ -47,7 +59,7 @@ class SentenceTransformerDenseEmbedder(DenseEmbedder):
             embedding = await asyncio.to_thread(
                 self._model.encode,
                 text,
-                normalize_embeddings=True,
+                normalize_embeddings=self._normalize_embeddings,
                 convert_to_numpy=True,
             )
 
@@ -70,6 +82,24 @@ class SentenceTransformerDenseEmbedder(DenseEmbedder):
         texts: list[str],
     ) -> list[DenseVector]:
 
+        embeddings = await self.embed_matrix(texts)
+
+        return [
+            DenseVector(values=embedding.tolist())
+            for embedding in embeddings
+        ]
+
+    async def embed_matrix(
+        self,
+        texts: list[str],
+    ) -> np.ndarray:
+
+        if not texts:
+            return np.empty(
+                (0, await self.dimension()),
+                dtype=np.float32,
+            )
+
         try:
 
             logger.info(
@@ -79,14 +109,14 @@ class SentenceTransformerDenseEmbedder(DenseEmbedder):
             embeddings = await asyncio.to_thread(
                 self._model.encode,
                 texts,
-                normalize_embeddings=True,
+                normalize_embeddings=self._normalize_embeddings,
                 convert_to_numpy=True,
             )
 
-            return [
-                DenseVector(values=embedding.tolist())
-                for embedding in embeddings
-            ]
+            return np.ascontiguousarray(
+                embeddings,
+                dtype=np.float32,
+            )
 
         except Exception as exc:
 
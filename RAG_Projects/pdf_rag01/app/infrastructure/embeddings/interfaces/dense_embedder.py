@@ -4,6 +4,8 @@ Abstract interface for dense embedding providers.
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from app.infrastructure.vector_db.models import DenseVector
 
 
@@ -12,6 +14,20 @@ class DenseEmbedder(ABC):
     Base interface for all dense embedding providers.
     """
 
+    @property
+    @abstractmethod
+    def model_name(self) -> str:
+        """
+        Return the name of the underlying embedding model.
+        """
+
+    @property
+    @abstractmethod
+    def normalize_embeddings(self) -> bool:
+        """
+        Return whether embeddings are L2-normalized.
+        """
+
     @abstractmethod
     async def embed(
         self,
@@ -30,6 +46,16 @@ class DenseEmbedder(ABC):
         Generate embeddings for multiple texts.
         """
 
+    @abstractmethod
+    async def embed_matrix(
+        self,
+        texts: list[str],
+    ) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts as one C-contiguous
+        float32 matrix of shape (len(texts), dimension).
+        """
+
     @abstractmethod
     async def dimension(self) -> int:
         """
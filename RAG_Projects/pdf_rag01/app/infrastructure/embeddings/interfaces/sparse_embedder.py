@@ -12,6 +12,13 @@ class SparseEmbedder(ABC):
     Base interface for sparse embedding providers.
     """
 
+    @property
+    @abstractmethod
+    def model_name(self) -> str:
+        """
+        Return the name of the underlying embedding model.
+        """
+
     @abstractmethod
     async def embed(
         self,
@@ -2,14 +2,44 @@
 Embedding mappers.
 """
 
+from typing import Any
+
+import numpy as np
+
 from app.infrastructure.vector_db.models import (
     DenseVector,
     SparseVector,
     VectorDocument,
+    VectorDocumentBatch,
 )
 from app.schemas.chunk.chunk import Chunk
 
 
+def build_vector_metadata(chunk: Chunk) -> dict[str, Any]:
+    """
+    Build the vector metadata stored alongside a chunk embedding.
+    """
+
+    metadata = {
+        "document_id": chunk.document_id,
+        "text": chunk.text,
+        **chunk.metadata.model_dump(exclude_none=True),
+    }
+
+    # Vector stores reject null metadata values.
+    if chunk.parent_chunk_id is not None:
+        metadata["parent_chunk_id"] = chunk.parent_chunk_id
+
+    # Pinecone metadata lists may only hold strings.
+    if "duplicate_page_numbers" in metadata:
+        metadata["duplicate_page_numbers"] = [
+            str(page_number)
+            for page_number in metadata["duplicate_page_numbers"]
+        ]
+
+    return metadata
+
+
 def create_vector_document(
     chunk: Chunk,
     dense_vector: DenseVector,
@@ -23,9 +53,24 @@ def create_vector_document(
         id=chunk.chunk_id,
         dense_vector=dense_vector,
         sparse_vector=sparse_vector,
-        metadata={
-            "document_id": chunk.document_id,
-            "text": chunk.text,
-            **chunk.metadata.model_dump(exclude_none=True),
-        },
+        metadata=build_vector_metadata(chunk),
+    )
+
+
+def create_vector_document_batch(
+    chunks: list[Chunk],
+    dense_matrix: np.ndarray,
+    sparse_vectors: list[SparseVector],
+) -> VectorDocumentBatch:
+    """
+    Convert chunks and their embeddings into a columnar VectorDocumentBatch.
+
+    Row `i` of `dense_matrix` must belong to `chunks[i]`.
+    """
+
+    return VectorDocumentBatch(
+        ids=[chunk.chunk_id for chunk in chunks],
+        metadata=[build_vector_metadata(chunk) for chunk in chunks],
+        dense_matrix=dense_matrix,
+        sparse_vectors=sparse_vectors,
     )
\ No newline at end of file
@@ -13,11 +13,20 @@ from app.infrastructure.embeddings.sparse.fastembed_sparse import (
 
 
 
+from concurrent.futures import Executor
 from dataclasses import dataclass
 
 from app.infrastructure.vector_db.base import VectorStoreRepository
+from app.infrastructure.embeddings.cache.embedding_cache import EmbeddingCache
 from app.infrastructure.embeddings.interfaces.dense_embedder import DenseEmbedder
 from app.infrastructure.embeddings.interfaces.sparse_embedder import SparseEmbedder
+from app.infrastructure.llm.interfaces.client import LLMClient
+from app.infrastructure.prompts.interfaces.registry import PromptRegistry
+from app.rag_services.ingestion.jobs.ingestion_job_queue import IngestionJobQueue
+from app.rag_services.ingestion.interfaces.document_registry import DocumentRegistry
+from app.rag_services.ingestion.interfaces.parent_chunk_store import ParentChunkStore
+from app.rag_services.retrieval.cache.retrieval_cache import RetrievalCache
+from app.rag_services.retrieval.interfaces.reranker import Reranker
 
 
 @dataclass
@@ -25,10 +34,15 @@ class AppState:
     dense_embedder: DenseEmbedder | None = None
     sparse_embedder: SparseEmbedder | None = None
     vector_repository: VectorStoreRepository | None = None
-
-    # Future
-    # cross_encoder: CrossEncoder | None = None
-    # llm_client: LLMClient | None = None
+    embedding_cache: EmbeddingCache | None = None
+    partition_executor: Executor | None = None
+    ingestion_jobs: IngestionJobQueue | None = None
+    document_registry: DocumentRegistry | None = None
+    parent_chunk_store: ParentChunkStore | None = None
+    retrieval_cache: RetrievalCache | None = None
+    reranker: Reranker | None = None
+    prompt_registry: PromptRegistry | None = None
+    llm_client: LLMClient | None = None
 
 state = AppState()
 
@@ -45,6 +59,50 @@ def get_sparse_embedder() -> SparseEmbedder:
     return state.sparse_embedder
 
 
+def get_embedding_cache() -> EmbeddingCache | None:
+    return state.embedding_cache
+
+
+def get_partition_executor() -> Executor | None:
+    return state.partition_executor
+
+
+def get_document_registry() -> DocumentRegistry | None:
+    return state.document_registry
+
+
+def get_parent_chunk_store() -> ParentChunkStore | None:
+    return state.parent_chunk_store
+
+
+def get_retrieval_cache() -> RetrievalCache | None:
+    return state.retrieval_cache
+
+
+def get_configured_reranker() -> Reranker | None:
+    return state.reranker
+
+
+def get_prompt_registry() -> PromptRegistry:
+    if state.prompt_registry is None:
+        raise RuntimeError("Prompt registry has not been initialized.")
+    return state.prompt_registry
+
+
+def get_llm_client() -> LLMClient:
+    if state.llm_client is None:
+        raise RuntimeError(
+            "LLM client has not been initialized; set GROK_API_KEY."
+        )
+    return state.llm_client
+
+
+def get_ingestion_job_queue() -> IngestionJobQueue:
+    if state.ingestion_jobs is None:
+        raise RuntimeError("Ingestion job queue has not been initialized.")
+    return state.ingestion_jobs
+
+
 def get_vector_repository() -> VectorStoreRepository:
     if state.vector_repository is None:
         raise RuntimeError("Vector repository has not been initialized.")
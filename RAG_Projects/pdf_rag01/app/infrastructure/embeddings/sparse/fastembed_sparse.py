@@ -25,6 +25,8 @@ class FastEmbedSparseEmbedder(SparseEmbedder):
             f"Loading sparse embedding model '{settings.sparse_embedding_model}'."
         )
 
+        self._model_name = settings.sparse_embedding_model
+
         self._model = SparseTextEmbedding(
             model_name=settings.sparse_embedding_model,
         )
@@ -33,6 +35,10 @@ class FastEmbedSparseEmbedder(SparseEmbedder):
             "Sparse embedding model loaded successfully."
         )
 
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
     async def embed(
         self,
         text: str,
@@ -17,9 +17,11 @@ from app.infrastructure.embeddings.interfaces.sparse_embedder import (
 )
 from app.infrastructure.embeddings.mapper import (
     create_vector_document,
+    create_vector_document_batch,
 )
 from app.infrastructure.vector_db.models import (
     VectorDocument,
+    VectorDocumentBatch,
 )
 from app.schemas.chunk.chunk import Chunk
 
@@ -78,27 +80,34 @@ class VectorDocumentBuilder:
     async def build_batch(
         self,
         chunks: list[Chunk],
-    ) -> list[VectorDocument]:
+    ) -> VectorDocumentBatch:
         """
-        Build VectorDocuments for multiple chunks.
+        Build a columnar VectorDocumentBatch for multiple chunks.
+
+        Dense embeddings stay in a single float32 matrix; no per-value
+        Python objects are created here.
         """
 
         if not chunks:
             logger.warning(
                 "No chunks provided for VectorDocument generation."
             )
-            return []
+            return VectorDocumentBatch(
+                ids=[],
+                metadata=[],
+                sparse_vectors=[],
+            )
 
         logger.info(
             f"Building {len(chunks)} VectorDocuments."
         )
 
         texts = [
-            chunk.text
+            chunk.indexed_text or chunk.text
             for chunk in chunks
         ]
 
-        dense_task = self._dense_embedder.embed_batch(
+        dense_task = self._dense_embedder.embed_matrix(
             texts,
         )
 
@@ -106,27 +115,19 @@ class VectorDocumentBuilder:
             texts,
         )
 
-        dense_vectors, sparse_vectors = await asyncio.gather(
+        dense_matrix, sparse_vectors = await asyncio.gather(
             dense_task,
             sparse_task,
         )
 
-        documents = [
-            create_vector_document(
-                chunk=chunk,
-                dense_vector=dense_vector,
-                sparse_vector=sparse_vector,
-            )
-            for chunk, dense_vector, sparse_vector in zip(
-                chunks,
-                dense_vectors,
-                sparse_vectors,
-                strict=True,
-            )
-        ]
+        batch = create_vector_document_batch(
+            chunks=chunks,
+            dense_matrix=dense_matrix,
+            sparse_vectors=sparse_vectors,
+        )
 
         logger.success(
-            f"Successfully built {len(documents)} VectorDocuments."
+            f"Successfully built {len(batch)} VectorDocuments."
         )
 
-        return documents
\ No newline at end of file
+        return batch
@@ -1,26 +1,61 @@
 from __future__ import annotations
 
-from openai import AsyncOpenAI
+import importlib.util
+import time
+from collections.abc import AsyncIterator
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from loguru import logger
 
-from app.core.config import settings
-from app.infrastructure.llm.interfaces.client import LLMClient
-from app.infrastructure.llm.models import (
+from app.core.config import get_settings
+from app.domains.generation.models import (
     LLMRequest,
     LLMResponse,
+    LLMStreamChunk,
+    UsageMetrics,
 )
+from app.infrastructure.llm.interfaces.client import LLMClient
 
 
 class GrokClient(LLMClient):
 
     def __init__(self) -> None:
 
+        settings = get_settings()
+
         self._client = AsyncOpenAI(
             api_key=settings.grok_api_key,
             base_url=settings.grok_base_url,
+            http_client=_http_client(settings.grok_keepalive_seconds),
         )
 
         self._model = settings.grok_model
+        self._keepalive_seconds = settings.grok_keepalive_seconds
+        self._last_used_at: float | None = None
+
+    async def warm_up(self) -> None:
+
+        if (
+            self._last_used_at is not None
+            and time.monotonic() - self._last_used_at
+            < self._keepalive_seconds
+        ):
+            return
+
+        self._last_used_at = time.monotonic()
+
+        # The cheapest authenticated call; it leaves a TLS connection
+        # in the pool for the completion request to reuse.
+        try:
+            await self._client.models.list()
+
+            logger.debug("LLM connection warmed up.")
+
+        except Exception as exc:
+            logger.warning(
+                f"LLM connection warm-up failed: {exc}"
+            )
 
     async def generate(
         self,
@@ -31,27 +66,17 @@ class GrokClient(LLMClient):
             f"Generating response using model '{self._model}'."
         )
 
+        self._last_used_at = time.monotonic()
+
         try:
 
             response = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {
-                        "role": message.role.value,
-                        "content": message.content,
-                    }
-                    for message in request.messages
-                ],
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
-                top_p=request.top_p,
-                stream=request.stream,
+                **self._completion_arguments(request),
+                stream=False,
             )
 
             choice = response.choices[0]
 
-            usage = response.usage
-
             logger.success(
                 "LLM response generated successfully."
             )
@@ -59,9 +84,7 @@ class GrokClient(LLMClient):
             return LLMResponse(
                 content=choice.message.content or "",
                 finish_reason=choice.finish_reason,
-                prompt_tokens=usage.prompt_tokens if usage else 0,
-                completion_tokens=usage.completion_tokens if usage else 0,
-                total_tokens=usage.total_tokens if usage else 0,
+                usage=_usage(response.usage),
                 raw_response=response.model_dump(),
             )
 
@@ -71,4 +94,118 @@ class GrokClient(LLMClient):
                 f"Failed to generate response: {exc}"
             )
 
-            raise
\ No newline at end of file
+            raise
+
+    async def stream(
+        self,
+        request: LLMRequest,
+    ) -> AsyncIterator[LLMStreamChunk]:
+
+        logger.info(
+            f"Streaming response using model '{self._model}'."
+        )
+
+        self._last_used_at = time.monotonic()
+
+        try:
+
+            response = await self._client.chat.completions.create(
+                **self._completion_arguments(request),
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+
+        except Exception as exc:
+
+            logger.exception(
+                f"Failed to start streaming response: {exc}"
+            )
+
+            raise
+
+        # Closing the response also stops generation upstream when the
+        # caller stops iterating (e.g. the HTTP client disconnected).
+        try:
+            async for chunk in response:
+
+                if chunk.usage is not None and not chunk.choices:
+                    yield LLMStreamChunk(usage=_usage(chunk.usage))
+                    continue
+
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+
+                if choice.delta.content or choice.finish_reason:
+                    yield LLMStreamChunk(
+                        content=choice.delta.content or "",
+                        finish_reason=choice.finish_reason,
+                        usage=_usage(chunk.usage),
+                    )
+
+        except Exception as exc:
+
+            logger.exception(
+                f"LLM stream failed: {exc}"
+            )
+
+            raise
+
+        finally:
+            await response.close()
+
+        logger.success(
+            "LLM response streamed successfully."
+        )
+
+    def _completion_arguments(
+        self,
+        request: LLMRequest,
+    ) -> dict:
+        return {
+            "model": self._model,
+            "messages": [
+                {
+                    "role": message.role.value,
+                    "content": message.content,
+                }
+                for message in request.messages
+            ],
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+            "top_p": request.top_p,
+        }
+
+
+def _http_client(keepalive_seconds: float) -> httpx.AsyncClient:
+
+    # HTTP/2 multiplexes concurrent completions over one connection, but
+    # needs the optional `h2` package.
+    http2 = importlib.util.find_spec("h2") is not None
+
+    if not http2:
+        logger.warning(
+            "Package 'h2' is not installed; using HTTP/1.1 keep-alive "
+            "connections for the LLM provider."
+        )
+
+    return DefaultAsyncHttpxClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=keepalive_seconds,
+        ),
+    )
+
+
+def _usage(usage) -> UsageMetrics | None:
+    if usage is None:
+        return None
+
+    return UsageMetrics(
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        total_tokens=usage.total_tokens,
+    )
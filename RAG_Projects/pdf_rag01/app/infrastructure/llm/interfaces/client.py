@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app.domains.generation.models import (
     LLMRequest,
     LLMResponse,
+    LLMStreamChunk,
 )
 
 
@@ -13,4 +15,22 @@ class LLMClient(ABC):
         self,
         request: LLMRequest,
     ) -> LLMResponse:
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    def stream(
+        self,
+        request: LLMRequest,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Yield the completion as it is generated.
+
+        The last chunk carries the usage, when the provider reports it.
+        """
+        ...
+
+    async def warm_up(self) -> None:
+        """
+        Open (or keep alive) the connection to the provider ahead of a
+        request. Must never raise.
+        """
@@ -0,0 +1,141 @@
+"""
+Compiled prompt templates.
+
+Responsibilities:
+- Parse a `str.format` template once into literal / field segments.
+- Reject what the renderer cannot fill: positional fields (`{}`,
+  `{0}`), attribute or index lookups (`{a.b}`, `{a[0]}`) and nested
+  fields inside a format spec.
+- Render from the segment list, without parsing the template again.
+- Return templates without fields (typically system prompts) as a
+  precomputed string.
+
+`compile_template` is memoized by template source. The registry
+compiles every template when it is registered, so the renderer only
+ever hits the cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import lru_cache
+from string import Formatter
+
+
+# (literal text, field name, format spec, conversion)
+Segment = tuple[str, str | None, str, str | None]
+
+
+_CONVERSIONS = {
+    "r": repr,
+    "s": str,
+    "a": ascii,
+}
+
+
+class CompiledTemplate:
+    """
+    A template parsed into segments, with its field names.
+    """
+
+    __slots__ = ("source", "fields", "_segments", "_static_text")
+
+    def __init__(
+        self,
+        source: str,
+        segments: tuple[Segment, ...],
+    ) -> None:
+
+        self.source = source
+        self.fields = frozenset(
+            field
+            for _, field, _, _ in segments
+            if field is not None
+        )
+
+        self._segments = segments
+
+        # Nothing to substitute: render once, here.
+        self._static_text = (
+            "".join(literal for literal, _, _, _ in segments)
+            if not self.fields
+            else None
+        )
+
+    @property
+    def is_static(self) -> bool:
+        return self._static_text is not None
+
+    def render(
+        self,
+        values: Mapping[str, object],
+    ) -> str:
+
+        if self._static_text is not None:
+            return self._static_text
+
+        missing = self.fields - values.keys()
+
+        if missing:
+            raise ValueError(
+                f"Missing prompt variables: {sorted(missing)}"
+            )
+
+        parts: list[str] = []
+
+        for literal, field, format_spec, conversion in self._segments:
+
+            if literal:
+                parts.append(literal)
+
+            if field is None:
+                continue
+
+            value = values[field]
+
+            if conversion is not None:
+                value = _CONVERSIONS[conversion](value)
+
+            parts.append(format(value, format_spec))
+
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def compile_template(source: str) -> CompiledTemplate:
+    """
+    Parse and validate `source`. Raises ValueError for malformed
+    templates and fields the renderer cannot fill.
+    """
+
+    segments: list[Segment] = []
+
+    for literal, field, format_spec, conversion in Formatter().parse(source):
+
+        if field is None:
+            segments.append((literal, None, "", None))
+            continue
+
+        if not field.isidentifier():
+            raise ValueError(
+                f"Unsupported prompt field '{{{field}}}'; "
+                "use named fields such as '{query}'."
+            )
+
+        if format_spec and "{" in format_spec:
+            raise ValueError(
+                f"Nested fields in the format spec of '{{{field}}}' "
+                "are not supported."
+            )
+
+        if conversion is not None and conversion not in _CONVERSIONS:
+            raise ValueError(
+                f"Unknown conversion '!{conversion}' in '{{{field}}}'."
+            )
+
+        segments.append((literal, field, format_spec or "", conversion))
+
+    return CompiledTemplate(
+        source=source,
+        segments=tuple(segments),
+    )
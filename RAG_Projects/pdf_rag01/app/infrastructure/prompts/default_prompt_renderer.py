@@ -0,0 +1,54 @@
+from loguru import logger
+
+from app.domains.generation.models import (
+    PromptTemplate,
+    RenderedPrompt,
+    PromptVariables
+)
+from app.infrastructure.prompts.compiled_template import compile_template
+from app.infrastructure.prompts.interfaces.renderer import PromptRenderer
+
+
+class DefaultPromptRenderer(PromptRenderer):
+    """
+    Renders prompts from their compiled form.
+
+    Templates are parsed and validated once (at registration); here
+    they are only looked up and filled in. A system prompt without
+    fields is returned as the string computed when it was compiled.
+    """
+
+    async def render(
+        self,
+        prompt: PromptTemplate,
+        variables: PromptVariables,
+    ) -> RenderedPrompt:
+
+        system_template = compile_template(prompt.system_template)
+        user_template = compile_template(prompt.user_template)
+
+        logger.debug(
+            f"Rendering prompt '{prompt.name}' "
+            f"version '{prompt.version}'"
+        )
+
+        values = _values(variables)
+
+        return RenderedPrompt(
+            system_prompt=system_template.render(values),
+            user_prompt=user_template.render(values),
+        )
+
+
+def _values(variables: PromptVariables) -> dict[str, object]:
+    """
+    Template values. Metadata entries fill extra fields such as
+    `{answer}`, but never shadow the standard variables.
+    """
+
+    return {
+        **variables.metadata,
+        "query": variables.query,
+        "context": variables.context,
+        "history": variables.history,
+    }
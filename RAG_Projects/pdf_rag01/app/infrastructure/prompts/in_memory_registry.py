@@ -3,21 +3,49 @@ from collections import defaultdict
 from loguru import logger
 
 from app.domains.generation.models import PromptTemplate
+from app.infrastructure.prompts.compiled_template import compile_template
+from app.infrastructure.prompts.interfaces.registry import PromptRegistry
 
 
 class InMemoryPromptRegistry(PromptRegistry):
+    """
+    Prompt templates by name and version.
+
+    Templates are compiled (parsed and validated) when they are
+    registered, so a malformed prompt fails at startup rather than on a
+    request. The latest version of every prompt is tracked as versions
+    are registered; "latest" lookups are a dict access.
+    """
 
     def __init__(self) -> None:
         self._prompts: dict[str, dict[str, PromptTemplate]] = defaultdict(dict)
 
+        # name -> latest version
+        self._latest: dict[str, str] = {}
+
     async def register(self, prompt: PromptTemplate) -> None:
 
         logger.info(
             f"Registering prompt '{prompt.name}' version '{prompt.version}'"
         )
 
+        for template in (prompt.system_template, prompt.user_template):
+            try:
+                compile_template(template)
+
+            except ValueError as exc:
+                raise ValueError(
+                    f"Invalid template in prompt '{prompt.name}' "
+                    f"version '{prompt.version}': {exc}"
+                ) from exc
+
         self._prompts[prompt.name][prompt.version] = prompt
 
+        latest = self._latest.get(prompt.name)
+
+        if latest is None or _version_key(prompt.version) >= _version_key(latest):
+            self._latest[prompt.name] = prompt.version
+
     async def get(
         self,
         name: str,
@@ -31,7 +59,7 @@ class InMemoryPromptRegistry(PromptRegistry):
 
         if version == "latest":
 
-            latest = sorted(versions.keys())[-1]
+            latest = self._latest[name]
 
             logger.debug(
                 f"Loading latest version '{latest}' for prompt '{name}'"
@@ -67,8 +95,20 @@ class InMemoryPromptRegistry(PromptRegistry):
         ]
 
 
+def _version_key(version: str) -> tuple[tuple[int, int | str], ...]:
+    """
+    Sort key for dotted versions. Numeric parts compare as numbers, so
+    "1.10.0" is newer than "1.9.0".
+    """
+
+    return tuple(
+        (0, int(part)) if part.isdigit() else (1, part)
+        for part in version.split(".")
+    )
+
+
 _prompt_registry = InMemoryPromptRegistry()
 
 
 async def get_prompt_registry() -> PromptRegistry:
-    return _prompt_registry
\ No newline at end of file
+    return _prompt_registry
@@ -1,5 +1,6 @@
 from loguru import logger
 
+from app.infrastructure.prompts.interfaces.registry import PromptRegistry
 from app.infrastructure.prompts.templates import ALL_PROMPTS
 
 
@@ -0,0 +1,33 @@
+"""
+Abstract interface for cross-encoder relevance models.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class CrossEncoder(ABC):
+    """
+    Base interface for models that score (query, passage) pairs jointly.
+    """
+
+    @property
+    @abstractmethod
+    def model_name(self) -> str:
+        """
+        Return the name of the underlying model.
+        """
+
+    @abstractmethod
+    async def score(
+        self,
+        query: str,
+        passages: list[str],
+    ) -> np.ndarray:
+        """
+        Score every (query, passage) pair in one batched call.
+
+        Returns a float32 array aligned with `passages`; higher is
+        more relevant.
+        """
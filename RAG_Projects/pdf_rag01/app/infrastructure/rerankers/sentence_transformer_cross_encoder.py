@@ -0,0 +1,78 @@
+"""
+SentenceTransformers cross-encoder provider.
+"""
+
+import asyncio
+
+import numpy as np
+from loguru import logger
+from sentence_transformers import CrossEncoder as SentenceTransformerModel
+
+from app.core.config import get_settings
+from app.core.exceptions import RetrievalError
+from app.infrastructure.rerankers.interfaces.cross_encoder import (
+    CrossEncoder,
+)
+
+
+class SentenceTransformerCrossEncoder(CrossEncoder):
+
+    def __init__(self) -> None:
+
+        settings = get_settings()
+
+        logger.info(
+            f"Loading cross-encoder model '{settings.reranker_model}'."
+        )
+
+        self._model_name = settings.reranker_model
+        self._batch_size = settings.reranker_batch_size
+
+        # max_length truncates each (query, passage) pair in tokens.
+        self._model = SentenceTransformerModel(
+            settings.reranker_model,
+            max_length=settings.reranker_max_tokens,
+        )
+
+        logger.success(
+            "Cross-encoder model loaded successfully."
+        )
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    async def score(
+        self,
+        query: str,
+        passages: list[str],
+    ) -> np.ndarray:
+
+        if not passages:
+            return np.empty(0, dtype=np.float32)
+
+        try:
+
+            logger.debug(
+                f"Scoring {len(passages)} passages with the cross-encoder."
+            )
+
+            scores = await asyncio.to_thread(
+                self._model.predict,
+                [(query, passage) for passage in passages],
+                batch_size=self._batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+
+            return np.asarray(scores, dtype=np.float32)
+
+        except Exception as exc:
+
+            logger.exception(
+                f"Failed scoring passages with the cross-encoder: {exc}"
+            )
+
+            raise RetrievalError(
+                "Unable to score passages with the cross-encoder."
+            ) from exc
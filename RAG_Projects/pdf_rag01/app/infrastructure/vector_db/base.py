@@ -10,6 +10,7 @@ from typing import Any
 
 from app.infrastructure.vector_db.models import (
     VectorDocument, 
+    VectorDocumentBatch,
     QueryResult, 
     QueryVector,
     UpsertResponse,
@@ -25,11 +26,14 @@ class VectorStoreRepository(ABC):
     @abstractmethod
     async def upsert(
         self,
-        vectors: list[VectorDocument],
+        vectors: list[VectorDocument] | VectorDocumentBatch,
         namespace: str | None = None,
     ) -> UpsertResponse:
         """
         Insert or update vectors.
+
+        Implementations should keep a VectorDocumentBatch columnar until
+        the vectors are serialized for the database.
         """
 
     @abstractmethod
@@ -39,9 +43,12 @@ class VectorStoreRepository(ABC):
         top_k: int = 5,
         namespace: str | None = None,
         metadata_filter: dict[str, Any] | None = None,
+        include_values: bool = False,
     ) -> list[QueryResult]:
         """
         Search similar vectors.
+
+        With `include_values`, results carry their stored vectors.
         """
 
     @abstractmethod
@@ -71,4 +78,9 @@ class VectorStoreRepository(ABC):
     ) -> list[VectorDocument]:
         """
         Fetch vectors by ids.
-        """
\ No newline at end of file
+        """
+
+    def close(self) -> None:
+        """
+        Release resources held by the repository. Called on shutdown.
+        """
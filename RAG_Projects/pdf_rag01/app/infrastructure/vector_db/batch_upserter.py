@@ -0,0 +1,284 @@
+"""
+Concurrent batch upserter.
+
+Responsibilities:
+- Split vectors into batches lazily. Columnar VectorDocumentBatch inputs
+  are sliced as zero-copy views.
+- Convert each batch into its wire payload only when it is about to be sent.
+- Send up to `concurrency` batches at once through a bounded thread pool,
+  so synchronous vector database SDKs never block the event loop.
+- Retry each batch independently with exponential backoff, but only on
+  transient failures: rate limiting (429), server errors (5xx), timeouts
+  and dropped connections. Anything else (a dimension mismatch, a bad
+  API key) fails on the first attempt.
+- Report per-batch latency.
+
+NOTE:
+This class knows nothing about a specific vector database. The repository
+passes in the payload converter and the synchronous upsert call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+from app.infrastructure.vector_db.models import (
+    UpsertResponse,
+    VectorDocument,
+    VectorDocumentBatch,
+)
+
+
+VectorBatch = Sequence[VectorDocument] | VectorDocumentBatch
+
+# vector batch -> wire payloads
+PayloadConverter = Callable[[VectorBatch], list[dict[str, Any]]]
+
+# (payload batch, namespace) -> number of upserted vectors
+UpsertCall = Callable[[list[dict[str, Any]], str | None], int]
+
+# upsert failure -> whether the batch should be retried
+RetryPolicy = Callable[[Exception], bool]
+
+# Transport errors of HTTP and gRPC clients (urllib3, httpx, aiohttp)
+# rarely subclass the builtin TimeoutError / ConnectionError.
+_TRANSIENT_ERROR_NAMES = ("Timeout", "Connection", "Protocol")
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Whether an upsert failure is worth retrying.
+
+    Errors that carry an HTTP status (`status` or `status_code`, as the
+    Pinecone SDK's API exceptions do) are retried on 429 and 5xx only.
+    Otherwise timeouts and connection errors are retried, including
+    ones wrapped by the client (urllib3's MaxRetryError.reason, or the
+    exception's cause).
+    """
+
+    status = getattr(exc, "status", None)
+
+    if status is None:
+        status = getattr(exc, "status_code", None)
+
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+
+    if any(
+        name in cls.__name__
+        for cls in type(exc).__mro__
+        for name in _TRANSIENT_ERROR_NAMES
+    ):
+        return True
+
+    cause = getattr(exc, "reason", None)
+
+    if not isinstance(cause, BaseException):
+        cause = exc.__cause__
+
+    return cause is not None and cause is not exc and is_transient_error(cause)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Outcome of a single uploaded batch.
+    """
+
+    batch_number: int
+    upserted_count: int
+    latency_ms: float
+    attempts: int
+
+
+class BatchUpserter:
+    """
+    Uploads vector batches concurrently with per-batch retries.
+    """
+
+    def __init__(
+        self,
+        upsert_call: UpsertCall,
+        payload_converter: PayloadConverter,
+        batch_size: int,
+        concurrency: int,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        is_retryable: RetryPolicy = is_transient_error,
+    ) -> None:
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        self._upsert_call = upsert_call
+        self._payload_converter = payload_converter
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._max_retries = max(0, max_retries)
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._is_retryable = is_retryable
+
+        # Dedicated pool so vector uploads never compete with embedding
+        # work scheduled on the default asyncio executor.
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="vector-upsert",
+        )
+
+    async def upsert(
+        self,
+        vectors: VectorBatch,
+        namespace: str | None = None,
+    ) -> UpsertResponse:
+        """
+        Upload all vectors and return the aggregated response.
+
+        If any batch exhausts its retries or fails with a non-retryable
+        error, the remaining batches are cancelled and the failure is
+        raised.
+        """
+
+        if not vectors:
+            return UpsertResponse(upserted_count=0)
+
+        logger.info(
+            f"Upserting {len(vectors)} vectors in batches of "
+            f"{self._batch_size} with concurrency={self._concurrency}."
+        )
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def run(
+            batch_number: int,
+            batch: VectorBatch,
+        ) -> BatchResult:
+            async with semaphore:
+                return await self._upload_batch(
+                    batch_number=batch_number,
+                    batch=batch,
+                    namespace=namespace,
+                )
+
+        tasks: list[asyncio.Task[BatchResult]] = []
+
+        async with asyncio.TaskGroup() as task_group:
+            for batch_number, start in enumerate(
+                range(0, len(vectors), self._batch_size),
+                1,
+            ):
+                batch = vectors[start:start + self._batch_size]
+                tasks.append(
+                    task_group.create_task(run(batch_number, batch))
+                )
+
+        results = [task.result() for task in tasks]
+
+        total_upserted = sum(
+            result.upserted_count
+            for result in results
+        )
+
+        latencies = [
+            result.latency_ms
+            for result in results
+        ]
+
+        logger.success(
+            f"Successfully upserted {total_upserted} vectors in "
+            f"{len(results)} batches "
+            f"(max batch latency {max(latencies):.2f} ms)."
+        )
+
+        return UpsertResponse(
+            upserted_count=total_upserted,
+            batch_latencies_ms=latencies,
+        )
+
+    async def _upload_batch(
+        self,
+        batch_number: int,
+        batch: VectorBatch,
+        namespace: str | None,
+    ) -> BatchResult:
+        """
+        Convert and upload one batch, retrying transient failures.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        payload = self._payload_converter(batch)
+
+        attempt = 0
+
+        while True:
+
+            attempt += 1
+            started_at = time.perf_counter()
+
+            try:
+
+                upserted_count = await loop.run_in_executor(
+                    self._executor,
+                    self._upsert_call,
+                    payload,
+                    namespace,
+                )
+
+            except Exception as exc:
+
+                if not self._is_retryable(exc):
+                    logger.error(
+                        f"Batch {batch_number} failed with a "
+                        f"non-retryable error: {exc}"
+                    )
+                    raise
+
+                if attempt > self._max_retries:
+                    logger.error(
+                        f"Batch {batch_number} failed after "
+                        f"{attempt} attempts: {exc}"
+                    )
+                    raise
+
+                delay = self._retry_backoff_seconds * 2 ** (attempt - 1)
+
+                logger.warning(
+                    f"Batch {batch_number} failed on attempt {attempt} "
+                    f"({exc}). Retrying in {delay:.2f}s."
+                )
+
+                await asyncio.sleep(delay)
+                continue
+
+            latency_ms = (time.perf_counter() - started_at) * 1000
+
+            logger.debug(
+                f"Uploaded batch {batch_number} of {len(payload)} vectors "
+                f"in {latency_ms:.2f} ms (attempt {attempt})."
+            )
+
+            return BatchResult(
+                batch_number=batch_number,
+                upserted_count=upserted_count,
+                latency_ms=latency_ms,
+                attempts=attempt,
+            )
+
+    def close(self) -> None:
+        """
+        Release the upload thread pool.
+        """
+        self._executor.shutdown(wait=False)
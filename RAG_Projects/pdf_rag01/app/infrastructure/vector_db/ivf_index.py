@@ -0,0 +1,130 @@
+"""
+Inverted-file (IVF) approximate nearest neighbour index.
+
+Responsibilities:
+- Cluster dense vectors with spherical k-means (inner-product).
+- Keep one posting list of row numbers per cluster.
+- Return candidate rows from the `n_probe` closest clusters.
+
+The index stores row numbers only; vectors stay in the owning matrix.
+Rows appended after the last build are not in any list, so callers
+must treat rows >= `indexed_rows` as candidates as well.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from loguru import logger
+
+
+class IvfIndex:
+    """
+    Coarse quantizer that narrows brute-force search to a few clusters.
+    """
+
+    def __init__(
+        self,
+        n_probe: int = 32,
+        iterations: int = 10,
+        sample_per_list: int = 64,
+        seed: int = 0,
+    ) -> None:
+        self._n_probe = n_probe
+        self._iterations = iterations
+        self._sample_per_list = sample_per_list
+        self._rng = np.random.default_rng(seed)
+
+        self._centroids: np.ndarray | None = None
+        self._lists: list[np.ndarray] = []
+
+        self.indexed_rows = 0
+
+    @property
+    def is_built(self) -> bool:
+        return self._centroids is not None
+
+    def build(
+        self,
+        matrix: np.ndarray,
+        rows: np.ndarray,
+    ) -> None:
+        """
+        Cluster `matrix[rows]` into roughly sqrt(len(rows)) lists.
+        """
+
+        n_lists = max(1, int(np.sqrt(len(rows))))
+
+        sample_size = min(len(rows), n_lists * self._sample_per_list)
+        sample = matrix[
+            np.sort(self._rng.choice(rows, size=sample_size, replace=False))
+        ]
+
+        centroids = sample[
+            self._rng.choice(sample_size, size=n_lists, replace=False)
+        ].copy()
+
+        for _ in range(self._iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+
+            for list_number in range(n_lists):
+                members = sample[labels == list_number]
+                if len(members):
+                    centroids[list_number] = members.mean(axis=0)
+
+            centroids /= np.maximum(
+                np.linalg.norm(centroids, axis=1, keepdims=True),
+                1e-12,
+            )
+
+        labels = self._assign(matrix, rows, centroids)
+
+        order = np.argsort(labels, kind="stable")
+        boundaries = np.searchsorted(labels[order], np.arange(n_lists + 1))
+
+        self._centroids = centroids.astype(np.float32, copy=False)
+        self._lists = [
+            rows[order[boundaries[n]:boundaries[n + 1]]]
+            for n in range(n_lists)
+        ]
+        self.indexed_rows = int(rows.max()) + 1 if len(rows) else 0
+
+        logger.info(
+            f"Built IVF index with {n_lists} lists over {len(rows)} vectors."
+        )
+
+    def search(
+        self,
+        query: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Return candidate rows from the closest clusters.
+        """
+
+        n_probe = min(self._n_probe, len(self._lists))
+
+        closest = np.argpartition(
+            -(self._centroids @ query),
+            n_probe - 1,
+        )[:n_probe]
+
+        return np.concatenate([self._lists[n] for n in closest])
+
+    @staticmethod
+    def _assign(
+        matrix: np.ndarray,
+        rows: np.ndarray,
+        centroids: np.ndarray,
+        block_size: int = 65_536,
+    ) -> np.ndarray:
+        # Blocked so assignment never materializes an (n, n_lists) matrix
+        # for the whole corpus at once.
+        labels = np.empty(len(rows), dtype=np.int64)
+
+        for start in range(0, len(rows), block_size):
+            block = matrix[rows[start:start + block_size]]
+            labels[start:start + block_size] = np.argmax(
+                block @ centroids.T,
+                axis=1,
+            )
+
+        return labels
@@ -0,0 +1,614 @@
+"""
+Storage and search for one namespace of the local vector store.
+
+Responsibilities:
+- Keep dense vectors in one growable float32 matrix (row per vector).
+- Keep sparse vectors in an inverted index (term -> rows, weights).
+- Score queries as dense dot product + sparse dot product, which is
+  how Pinecone scores hybrid queries on a dotproduct index.
+- Apply metadata filters before selecting the top-k.
+- Persist to / load from a directory. The dense matrix is saved as
+  .npy and memory-mapped on load.
+
+Updates and deletes leave tombstones. The namespace compacts itself
+once more than a quarter of its rows are dead.
+
+Rows below the current size are never written in place: upserts
+append, and compaction and growth build new arrays. A snapshot can
+therefore keep views of them and be saved after the caller's lock is
+released.
+
+NOTE:
+Queries may run concurrently with each other, but not with writes or
+snapshots; LocalVectorRepository holds a reader/writer lock.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from app.infrastructure.vector_db.ivf_index import IvfIndex
+from app.infrastructure.vector_db.metadata_filter import MetadataPredicate
+from app.infrastructure.vector_db.models import SparseVector
+
+
+_DENSE_FILE = "dense.npy"
+_RECORDS_FILE = "records.json"
+
+_COMPACTION_RATIO = 0.25
+
+# Rebuild IVF once this share of rows was added after the last build.
+_IVF_STALE_RATIO = 0.2
+
+
+class LocalNamespace:
+    """
+    Columnar in-memory vector storage with exact or IVF search.
+    """
+
+    def __init__(
+        self,
+        ivf_min_vectors: int = 0,
+        ivf_probes: int = 32,
+    ) -> None:
+        self._ivf_min_vectors = ivf_min_vectors
+        self._ivf_probes = ivf_probes
+
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._metadata: list[dict[str, Any]] = []
+        self._sparse: list[SparseVector | None] = []
+
+        self._dense: np.ndarray | None = None
+        self._alive = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._dead = 0
+
+        # term -> (rows, weights); compiled to arrays on first query.
+        self._postings: dict[int, tuple[list[int], list[float]]] = {}
+        self._compiled_postings: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+        self._ivf: IvfIndex | None = None
+        # Concurrent queries share one rebuild of a stale IVF index.
+        self._ivf_lock = threading.Lock()
+
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return self._size - self._dead
+
+    @property
+    def dimension(self) -> int | None:
+        return None if self._dense is None else self._dense.shape[1]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(
+        self,
+        ids: list[str],
+        metadata: list[dict[str, Any]],
+        dense_matrix: np.ndarray | None,
+        sparse_vectors: list[SparseVector | None] | None,
+    ) -> int:
+        """
+        Insert or replace vectors. Returns the number written.
+        """
+
+        count = len(ids)
+
+        if count == 0:
+            return 0
+
+        if dense_matrix is not None:
+            if self.dimension is not None and dense_matrix.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Vector dimension {dense_matrix.shape[1]} does not "
+                    f"match namespace dimension {self.dimension}."
+                )
+
+        if len(set(ids)) < count:
+            # The last write of an id wins, as in Pinecone; two live
+            # rows for one id would both be returned by queries.
+            ids, metadata, dense_matrix, sparse_vectors = _last_writes(
+                ids,
+                metadata,
+                dense_matrix,
+                sparse_vectors,
+            )
+            count = len(ids)
+
+        # Replacing an id tombstones its old row.
+        replaced = self._tombstone(ids)
+
+        start = self._size
+        self._reserve(start + count, dense_matrix)
+
+        if dense_matrix is not None:
+            self._dense[start:start + count] = dense_matrix
+        elif self._dense is not None:
+            self._dense[start:start + count] = 0.0
+
+        self._alive[start:start + count] = True
+
+        for offset, vector_id in enumerate(ids):
+            row = start + offset
+            sparse_vector = (
+                sparse_vectors[offset]
+                if sparse_vectors is not None
+                else None
+            )
+
+            self._rows[vector_id] = row
+            self._ids.append(vector_id)
+            self._metadata.append(metadata[offset])
+            self._sparse.append(sparse_vector)
+
+            if sparse_vector is not None:
+                self._index_sparse(row, sparse_vector)
+
+        self._size += count
+        self.dirty = True
+
+        if replaced:
+            self._maybe_compact()
+
+        return count
+
+    def delete(
+        self,
+        ids: list[str],
+    ) -> int:
+        """
+        Delete vectors by id. Unknown ids are ignored.
+        """
+
+        deleted = self._tombstone(ids)
+
+        if deleted:
+            self.dirty = True
+            self._maybe_compact()
+
+        return deleted
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        dense_query: np.ndarray | None,
+        sparse_query: SparseVector | None,
+        top_k: int,
+        predicate: MetadataPredicate | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Return (row, score) pairs for the best `top_k` live rows.
+        """
+
+        if len(self) == 0 or top_k <= 0:
+            return []
+
+        size = self._size
+        mask = self._alive[:size].copy()
+
+        if predicate is not None:
+            for row in np.flatnonzero(mask):
+                if not predicate(self._metadata[row]):
+                    mask[row] = False
+
+        scores = np.zeros(size, dtype=np.float32)
+
+        if dense_query is not None and self._dense is not None:
+            candidates = self._dense_candidates(dense_query, sparse_query)
+
+            if candidates is None:
+                scores += self._dense[:size] @ dense_query
+            else:
+                candidate_mask = np.zeros(size, dtype=bool)
+                candidate_mask[candidates] = True
+                mask &= candidate_mask
+                rows = np.flatnonzero(mask)
+                scores[rows] = self._dense[rows] @ dense_query
+
+        if sparse_query is not None:
+            for term, weight in zip(
+                sparse_query.indices,
+                sparse_query.values,
+                strict=True,
+            ):
+                posting = self._posting(term)
+                if posting is not None:
+                    rows, weights = posting
+                    scores[rows] += weight * weights
+
+        matching = np.flatnonzero(mask)
+
+        if len(matching) == 0:
+            return []
+
+        matching_scores = scores[matching]
+        k = min(top_k, len(matching))
+
+        best = np.argpartition(-matching_scores, k - 1)[:k]
+        best = best[np.argsort(-matching_scores[best], kind="stable")]
+
+        return [
+            (int(matching[position]), float(matching_scores[position]))
+            for position in best
+        ]
+
+    def row_of(
+        self,
+        vector_id: str,
+    ) -> int | None:
+        return self._rows.get(vector_id)
+
+    def vector_id(
+        self,
+        row: int,
+    ) -> str:
+        return self._ids[row]
+
+    def metadata(
+        self,
+        row: int,
+    ) -> dict[str, Any]:
+        return self._metadata[row]
+
+    def dense(
+        self,
+        row: int,
+    ) -> np.ndarray | None:
+        if self._dense is None:
+            return None
+        return self._dense[row]
+
+    def sparse(
+        self,
+        row: int,
+    ) -> SparseVector | None:
+        return self._sparse[row]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> NamespaceSnapshot:
+        """
+        Capture the live rows for saving, and clear `dirty`. Cheap
+        unless rows are tombstoned, in which case the live rows are
+        copied.
+        """
+
+        size = self._size
+
+        if self._dead:
+            keep = np.flatnonzero(self._alive[:size])
+            ids = [self._ids[row] for row in keep]
+            metadata = [self._metadata[row] for row in keep]
+            sparse = [self._sparse[row] for row in keep]
+            dense = self._dense[keep] if self._dense is not None else None
+        else:
+            ids = self._ids[:size]
+            metadata = self._metadata[:size]
+            sparse = self._sparse[:size]
+            dense = self._dense[:size] if self._dense is not None else None
+
+        self.dirty = False
+
+        return NamespaceSnapshot(
+            ids=ids,
+            metadata=metadata,
+            sparse=sparse,
+            dense=dense,
+        )
+
+    @classmethod
+    def load(
+        cls,
+        directory: Path,
+        ivf_min_vectors: int = 0,
+        ivf_probes: int = 32,
+    ) -> LocalNamespace:
+        """
+        Load a saved namespace. The dense matrix is memory-mapped
+        read-only and copied into memory on the first write.
+        """
+
+        namespace = cls(
+            ivf_min_vectors=ivf_min_vectors,
+            ivf_probes=ivf_probes,
+        )
+
+        records = json.loads(
+            (directory / _RECORDS_FILE).read_text(encoding="utf-8")
+        )
+
+        dense_path = directory / _DENSE_FILE
+        if dense_path.exists():
+            namespace._dense = np.load(dense_path, mmap_mode="r")
+
+        namespace._ids = records["ids"]
+        namespace._metadata = records["metadata"]
+        namespace._sparse = [
+            None
+            if vector is None
+            else SparseVector(indices=vector[0], values=vector[1])
+            for vector in records["sparse"]
+        ]
+        namespace._size = len(namespace._ids)
+        namespace._alive = np.ones(namespace._size, dtype=bool)
+        namespace._rows = {
+            vector_id: row
+            for row, vector_id in enumerate(namespace._ids)
+        }
+
+        for row, vector in enumerate(namespace._sparse):
+            if vector is not None:
+                namespace._index_sparse(row, vector)
+
+        return namespace
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _reserve(
+        self,
+        size: int,
+        dense_matrix: np.ndarray | None,
+    ) -> None:
+        """
+        Grow storage geometrically so appends are amortized O(1).
+        """
+
+        capacity = len(self._alive)
+
+        if self._dense is None and dense_matrix is not None:
+            self._dense = np.zeros(
+                (max(capacity, size), dense_matrix.shape[1]),
+                dtype=np.float32,
+            )
+
+        dense_capacity = 0 if self._dense is None else self._dense.shape[0]
+        memory_mapped = self._dense is not None and not self._dense.flags.writeable
+
+        if size <= capacity and size <= dense_capacity and not memory_mapped:
+            return
+
+        new_capacity = max(size, capacity * 2, 1024)
+
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        self._alive = alive
+
+        if self._dense is not None:
+            dense = np.zeros(
+                (new_capacity, self._dense.shape[1]),
+                dtype=np.float32,
+            )
+            dense[:self._size] = self._dense[:self._size]
+            self._dense = dense
+
+    def _tombstone(
+        self,
+        ids: list[str],
+    ) -> int:
+        deleted = 0
+
+        for vector_id in ids:
+            row = self._rows.pop(vector_id, None)
+            if row is not None and self._alive[row]:
+                self._alive[row] = False
+                deleted += 1
+
+        self._dead += deleted
+
+        return deleted
+
+    def _index_sparse(
+        self,
+        row: int,
+        vector: SparseVector,
+    ) -> None:
+        for term, weight in zip(vector.indices, vector.values, strict=True):
+            rows, weights = self._postings.setdefault(term, ([], []))
+            rows.append(row)
+            weights.append(weight)
+            self._compiled_postings.pop(term, None)
+
+    def _posting(
+        self,
+        term: int,
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        compiled = self._compiled_postings.get(term)
+
+        if compiled is None:
+            posting = self._postings.get(term)
+            if posting is None:
+                return None
+            compiled = (
+                np.asarray(posting[0], dtype=np.int64),
+                np.asarray(posting[1], dtype=np.float32),
+            )
+            self._compiled_postings[term] = compiled
+
+        return compiled
+
+    def _dense_candidates(
+        self,
+        dense_query: np.ndarray,
+        sparse_query: SparseVector | None,
+    ) -> np.ndarray | None:
+        """
+        Candidate rows from IVF, or None for an exhaustive scan.
+        """
+
+        live = len(self)
+
+        if not self._ivf_min_vectors or live < self._ivf_min_vectors:
+            return None
+
+        ivf = self._ivf
+
+        if ivf is None or self._size - ivf.indexed_rows > _IVF_STALE_RATIO * live:
+            with self._ivf_lock:
+                ivf = self._ivf
+
+                if (
+                    ivf is None
+                    or self._size - ivf.indexed_rows > _IVF_STALE_RATIO * live
+                ):
+                    # Published only once built: other queries read
+                    # self._ivf without the lock.
+                    ivf = IvfIndex(n_probe=self._ivf_probes)
+                    ivf.build(
+                        self._dense,
+                        np.flatnonzero(self._alive[:self._size]),
+                    )
+                    self._ivf = ivf
+
+        parts = [
+            ivf.search(dense_query),
+            # Rows added after the last build are not in any list yet.
+            np.arange(ivf.indexed_rows, self._size),
+        ]
+
+        if sparse_query is not None:
+            # Keyword matches must not be lost to the dense quantizer.
+            for term in sparse_query.indices:
+                posting = self._posting(term)
+                if posting is not None:
+                    parts.append(posting[0])
+
+        return np.concatenate(parts)
+
+    def _maybe_compact(self) -> None:
+        if self._dead > _COMPACTION_RATIO * max(self._size, 1):
+            self._compact()
+
+    def _compact(self) -> None:
+        """
+        Drop tombstoned rows and rebuild row-based structures.
+        """
+
+        if self._dead == 0:
+            return
+
+        keep = np.flatnonzero(self._alive[:self._size])
+
+        logger.debug(
+            f"Compacting namespace: {self._size} rows -> {len(keep)}."
+        )
+
+        if self._dense is not None:
+            self._dense = np.ascontiguousarray(self._dense[keep])
+
+        self._ids = [self._ids[row] for row in keep]
+        self._metadata = [self._metadata[row] for row in keep]
+        self._sparse = [self._sparse[row] for row in keep]
+
+        self._size = len(keep)
+        self._dead = 0
+        self._alive = np.ones(self._size, dtype=bool)
+        self._rows = {
+            vector_id: row
+            for row, vector_id in enumerate(self._ids)
+        }
+
+        self._postings = {}
+        self._compiled_postings = {}
+        for row, vector in enumerate(self._sparse):
+            if vector is not None:
+                self._index_sparse(row, vector)
+
+        self._ivf = None
+
+
+@dataclass(frozen=True)
+class NamespaceSnapshot:
+    """
+    Live rows of a namespace at one point in time.
+    """
+
+    ids: list[str]
+
+    metadata: list[dict[str, Any]]
+
+    sparse: list[SparseVector | None]
+
+    dense: np.ndarray | None
+
+    def save(
+        self,
+        directory: Path,
+    ) -> None:
+        """
+        Write the namespace atomically (temp files + rename).
+        """
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if self.dense is None or not self.ids:
+            # An empty .npy file cannot be memory-mapped on load.
+            (directory / _DENSE_FILE).unlink(missing_ok=True)
+        else:
+            temp_dense = directory / f"{_DENSE_FILE}.tmp"
+            with temp_dense.open("wb") as file:
+                np.save(file, np.ascontiguousarray(self.dense))
+            os.replace(temp_dense, directory / _DENSE_FILE)
+
+        records = {
+            "ids": self.ids,
+            "metadata": self.metadata,
+            "sparse": [
+                None
+                if vector is None
+                else [vector.indices, vector.values]
+                for vector in self.sparse
+            ],
+        }
+
+        temp_records = directory / f"{_RECORDS_FILE}.tmp"
+        temp_records.write_text(json.dumps(records), encoding="utf-8")
+        os.replace(temp_records, directory / _RECORDS_FILE)
+
+
+def _last_writes(
+    ids: list[str],
+    metadata: list[dict[str, Any]],
+    dense_matrix: np.ndarray | None,
+    sparse_vectors: list[SparseVector | None] | None,
+) -> tuple[
+    list[str],
+    list[dict[str, Any]],
+    np.ndarray | None,
+    list[SparseVector | None] | None,
+]:
+    """
+    Keep only the last occurrence of each id, in batch order.
+    """
+
+    last = {vector_id: position for position, vector_id in enumerate(ids)}
+    positions = sorted(last.values())
+
+    return (
+        [ids[position] for position in positions],
+        [metadata[position] for position in positions],
+        dense_matrix[positions] if dense_matrix is not None else None,
+        (
+            [sparse_vectors[position] for position in positions]
+            if sparse_vectors is not None
+            else None
+        ),
+    )
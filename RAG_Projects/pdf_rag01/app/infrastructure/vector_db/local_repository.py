@@ -0,0 +1,552 @@
+"""
+Local in-process vector repository.
+
+Responsibilities
+----------------
+- Implement VectorStoreRepository without any external service.
+- Keep one LocalNamespace per namespace.
+- Run searches and writes off the event loop. Searches run in
+  parallel; writes wait for them and run alone.
+- Persist changed namespaces to disk `autosave_seconds` after a write,
+  on save() and on close(), and load them on start. Only the snapshot
+  is taken under the lock; files are written outside it.
+
+Scoring matches a Pinecone dotproduct index: dense dot product plus
+sparse dot product. Small namespaces are searched exhaustively with a
+single matrix-vector product; namespaces above `ivf_min_vectors` use an
+IVF index for the dense part.
+
+Used for on-prem deployments, offline benchmarks, CI, and as a latency
+baseline against Pinecone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from app.core.exceptions import VectorStoreError
+from app.infrastructure.vector_db.base import VectorStoreRepository
+from app.infrastructure.vector_db.local_namespace import LocalNamespace
+from app.infrastructure.vector_db.metadata_filter import (
+    compile_metadata_filter,
+)
+from app.infrastructure.vector_db.models import (
+    DeleteResponse,
+    DenseVector,
+    QueryResult,
+    QueryVector,
+    UpsertResponse,
+    VectorDocument,
+    VectorDocumentBatch,
+)
+
+
+# Pinecone's name for the namespace used when none is given.
+_DEFAULT_NAMESPACE = ""
+
+
+class LocalVectorRepository(VectorStoreRepository):
+    """
+    Vector repository backed by in-process NumPy storage.
+    """
+
+    def __init__(
+        self,
+        storage_path: Path | None = None,
+        ivf_min_vectors: int = 50_000,
+        ivf_probes: int = 32,
+        autosave_seconds: float | None = 5.0,
+    ) -> None:
+        self._storage_path = storage_path
+        self._ivf_min_vectors = ivf_min_vectors
+        self._ivf_probes = ivf_probes
+        self._autosave_seconds = autosave_seconds
+
+        self._namespaces: dict[str, LocalNamespace] = {}
+        self._lock = _ReadWriteLock()
+
+        # One save at a time, so an older snapshot never overwrites a
+        # newer one.
+        self._save_lock = threading.Lock()
+
+        # Pending autosave; writes made while it waits share it.
+        self._autosave: asyncio.Task | None = None
+
+        if storage_path is not None and storage_path.exists():
+            self._load()
+
+        logger.info(
+            f"Initialized local vector store "
+            f"(path='{storage_path}', namespaces={len(self._namespaces)})."
+        )
+
+    async def upsert(
+        self,
+        vectors: list[VectorDocument] | VectorDocumentBatch,
+        namespace: str | None = None,
+    ) -> UpsertResponse:
+        """
+        Insert or update vectors.
+        """
+
+        if not isinstance(vectors, VectorDocumentBatch):
+            vectors = _to_batch(vectors)
+
+        try:
+
+            upserted_count = await asyncio.to_thread(
+                self._upsert,
+                vectors,
+                namespace,
+            )
+
+        except Exception as exc:
+
+            logger.exception(
+                f"Failed to upsert vectors: {exc}"
+            )
+
+            raise VectorStoreError(
+                "Unable to upsert vectors."
+            ) from exc
+
+        logger.success(
+            f"Successfully upserted {upserted_count} vectors."
+        )
+
+        self._schedule_save()
+
+        return UpsertResponse(upserted_count=upserted_count)
+
+    async def query(
+        self,
+        vector: QueryVector,
+        top_k: int = 5,
+        namespace: str | None = None,
+        metadata_filter: dict[str, Any] | None = None,
+        include_values: bool = False,
+    ) -> list[QueryResult]:
+        """
+        Perform similarity search.
+        """
+
+        try:
+
+            logger.info(
+                f"Querying local vector store with top_k={top_k}"
+            )
+
+            results = await asyncio.to_thread(
+                self._query,
+                vector,
+                top_k,
+                namespace,
+                metadata_filter,
+                include_values,
+            )
+
+        except Exception as exc:
+
+            logger.exception(
+                f"Query failed: {exc}"
+            )
+
+            raise VectorStoreError(
+                "Unable to query vectors."
+            ) from exc
+
+        logger.success(
+            f"Retrieved {len(results)} vectors."
+        )
+
+        return results
+
+    async def fetch(
+        self,
+        ids: list[str],
+        namespace: str | None = None,
+    ) -> list[VectorDocument]:
+        """
+        Fetch vectors by ids. Unknown ids are skipped.
+        """
+
+        with self._lock.read():
+            store = self._namespaces.get(namespace or _DEFAULT_NAMESPACE)
+
+            if store is None:
+                return []
+
+            documents = []
+
+            for vector_id in ids:
+                row = store.row_of(vector_id)
+                if row is None:
+                    continue
+                documents.append(_to_vector_document(store, row))
+
+        return documents
+
+    async def delete(
+        self,
+        ids: list[str],
+        namespace: str | None = None,
+    ) -> DeleteResponse:
+        """
+        Delete vectors by ids.
+        """
+
+        logger.info(
+            f"Deleting {len(ids)} vectors."
+        )
+
+        await asyncio.to_thread(
+            self._delete,
+            ids,
+            namespace,
+        )
+
+        self._schedule_save()
+
+        return DeleteResponse(deleted=True)
+
+    async def delete_all(
+        self,
+        namespace: str | None = None,
+    ) -> DeleteResponse:
+        """
+        Delete all vectors inside a namespace.
+        """
+
+        logger.warning(
+            f"Deleting all vectors from namespace '{namespace}'."
+        )
+
+        store = self._new_namespace()
+
+        # Saved over the namespace's files, or they would be loaded
+        # again on the next start.
+        store.dirty = True
+
+        with self._lock.write():
+            self._namespaces[namespace or _DEFAULT_NAMESPACE] = store
+
+        self._schedule_save()
+
+        return DeleteResponse(deleted=True)
+
+    async def save(self) -> None:
+        """
+        Persist every namespace that changed since the last save.
+        """
+
+        if self._storage_path is not None:
+            await asyncio.to_thread(self._save)
+
+    def close(self) -> None:
+        """
+        Persist pending changes.
+        """
+
+        if self._autosave is not None:
+            self._autosave.cancel()
+            self._autosave = None
+
+        if self._storage_path is not None:
+            self._save()
+
+    def _schedule_save(self) -> None:
+        """
+        Save `autosave_seconds` from now, unless a save is already
+        pending. Bounds what a crash can lose without rewriting the
+        namespace on every upsert batch.
+        """
+
+        if self._storage_path is None or self._autosave_seconds is None:
+            return
+
+        if self._autosave is not None:
+            return
+
+        self._autosave = asyncio.create_task(self._save_later())
+
+    async def _save_later(self) -> None:
+        await asyncio.sleep(self._autosave_seconds)
+
+        # Writes from here on need a save of their own.
+        self._autosave = None
+
+        try:
+            await self.save()
+
+        except Exception as exc:
+
+            logger.exception(
+                f"Failed to save local vector store: {exc}"
+            )
+
+    def _upsert(
+        self,
+        batch: VectorDocumentBatch,
+        namespace: str | None,
+    ) -> int:
+        with self._lock.write():
+            store = self._namespaces.setdefault(
+                namespace or _DEFAULT_NAMESPACE,
+                self._new_namespace(),
+            )
+
+            return store.upsert(
+                ids=batch.ids,
+                metadata=batch.metadata,
+                dense_matrix=batch.dense_matrix,
+                sparse_vectors=batch.sparse_vectors,
+            )
+
+    def _delete(
+        self,
+        ids: list[str],
+        namespace: str | None,
+    ) -> None:
+        with self._lock.write():
+            store = self._namespaces.get(namespace or _DEFAULT_NAMESPACE)
+            if store is not None:
+                store.delete(ids)
+
+    def _query(
+        self,
+        vector: QueryVector,
+        top_k: int,
+        namespace: str | None,
+        metadata_filter: dict[str, Any] | None,
+        include_values: bool,
+    ) -> list[QueryResult]:
+
+        predicate = compile_metadata_filter(metadata_filter)
+
+        dense_query = (
+            np.asarray(vector.dense.values, dtype=np.float32)
+            if vector.dense
+            else None
+        )
+
+        with self._lock.read():
+            store = self._namespaces.get(namespace or _DEFAULT_NAMESPACE)
+
+            if store is None:
+                return []
+
+            matches = store.query(
+                dense_query=dense_query,
+                sparse_query=vector.sparse,
+                top_k=top_k,
+                predicate=predicate,
+            )
+
+            return [
+                _to_query_result(store, row, score, include_values)
+                for row, score in matches
+            ]
+
+    def _new_namespace(self) -> LocalNamespace:
+        return LocalNamespace(
+            ivf_min_vectors=self._ivf_min_vectors,
+            ivf_probes=self._ivf_probes,
+        )
+
+    def _save(self) -> None:
+        with self._save_lock:
+
+            # Snapshots are cheap; writing them is not, and must not
+            # block queries and upserts.
+            with self._lock.read():
+                snapshots = [
+                    (name, store, store.snapshot())
+                    for name, store in self._namespaces.items()
+                    if store.dirty
+                ]
+
+            for name, store, snapshot in snapshots:
+                try:
+                    snapshot.save(self._namespace_path(name))
+
+                except Exception:
+                    store.dirty = True
+                    raise
+
+        logger.info(
+            f"Saved local vector store to '{self._storage_path}'."
+        )
+
+    def _load(self) -> None:
+        for directory in sorted(self._storage_path.iterdir()):
+            if not directory.is_dir():
+                continue
+
+            name = _namespace_name(directory.name)
+
+            self._namespaces[name] = LocalNamespace.load(
+                directory,
+                ivf_min_vectors=self._ivf_min_vectors,
+                ivf_probes=self._ivf_probes,
+            )
+
+            logger.info(
+                f"Loaded namespace '{name}' with "
+                f"{len(self._namespaces[name])} vectors."
+            )
+
+    def _namespace_path(
+        self,
+        name: str,
+    ) -> Path:
+        # "__default__" keeps the unnamed namespace addressable on disk.
+        return self._storage_path / (name or "__default__")
+
+
+class _ReadWriteLock:
+    """
+    Many readers or one writer. A waiting writer holds back new
+    readers, so a steady stream of queries cannot starve ingestion.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._condition:
+            while self._writing or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+def _namespace_name(directory_name: str) -> str:
+    if directory_name == "__default__":
+        return _DEFAULT_NAMESPACE
+    return directory_name
+
+
+def _to_batch(
+    vectors: list[VectorDocument],
+) -> VectorDocumentBatch:
+    """
+    Convert row-oriented documents into the columnar batch layout.
+    """
+
+    dimension = next(
+        (
+            len(vector.dense_vector.values)
+            for vector in vectors
+            if vector.dense_vector is not None
+        ),
+        None,
+    )
+    has_sparse = any(vector.sparse_vector is not None for vector in vectors)
+
+    return VectorDocumentBatch(
+        ids=[vector.id for vector in vectors],
+        metadata=[vector.metadata for vector in vectors],
+        dense_matrix=(
+            np.asarray(
+                [
+                    vector.dense_vector.values
+                    if vector.dense_vector is not None
+                    else [0.0] * dimension
+                    for vector in vectors
+                ],
+                dtype=np.float32,
+            )
+            if dimension is not None
+            else None
+        ),
+        sparse_vectors=(
+            [vector.sparse_vector for vector in vectors]
+            if has_sparse
+            else None
+        ),
+    )
+
+
+def _to_vector_document(
+    store: LocalNamespace,
+    row: int,
+) -> VectorDocument:
+    dense = store.dense(row)
+
+    return VectorDocument(
+        id=store.vector_id(row),
+        metadata=store.metadata(row),
+        dense_vector=(
+            DenseVector(values=dense.tolist())
+            if dense is not None
+            else None
+        ),
+        sparse_vector=store.sparse(row),
+    )
+
+
+def _to_query_result(
+    store: LocalNamespace,
+    row: int,
+    score: float,
+    include_values: bool,
+) -> QueryResult:
+    metadata = store.metadata(row)
+
+    if not include_values:
+        return QueryResult(
+            id=store.vector_id(row),
+            score=score,
+            text=metadata.get("text", ""),
+            metadata=metadata,
+        )
+
+    dense = store.dense(row)
+
+    return QueryResult(
+        id=store.vector_id(row),
+        score=score,
+        text=metadata.get("text", ""),
+        metadata=metadata,
+        dense_vector=(
+            DenseVector(values=dense.tolist())
+            if dense is not None
+            else None
+        ),
+        sparse_vector=store.sparse(row),
+    )
@@ -1,8 +1,10 @@
+from collections.abc import Sequence
 from typing import Any
 
 from app.infrastructure.vector_db.models import (
     QueryResult,
     VectorDocument,
+    VectorDocumentBatch,
     DenseVector,
     SparseVector
 )
@@ -29,6 +31,52 @@ def to_pinecone_payload(vector: VectorDocument) -> dict[str, Any]:
     return payload
 
 
+def to_pinecone_payloads(
+    vectors: Sequence[VectorDocument] | VectorDocumentBatch,
+) -> list[dict[str, Any]]:
+    """
+    Convert a batch of vectors into Pinecone payloads.
+
+    For a VectorDocumentBatch this is the wire boundary: the float32
+    matrix is converted to Python floats in one call per batch.
+    """
+
+    if not isinstance(vectors, VectorDocumentBatch):
+        return [
+            to_pinecone_payload(vector)
+            for vector in vectors
+        ]
+
+    dense_rows = (
+        vectors.dense_matrix.tolist()
+        if vectors.dense_matrix is not None
+        else None
+    )
+
+    payloads: list[dict[str, Any]] = []
+
+    for row, vector_id in enumerate(vectors.ids):
+
+        payload = {
+            "id": vector_id,
+            "metadata": vectors.metadata[row],
+        }
+
+        if dense_rows is not None:
+            payload["values"] = dense_rows[row]
+
+        if vectors.sparse_vectors is not None:
+            sparse_vector = vectors.sparse_vectors[row]
+            payload["sparse_values"] = {
+                "indices": sparse_vector.indices,
+                "values": sparse_vector.values,
+            }
+
+        payloads.append(payload)
+
+    return payloads
+
+
 def to_query_result(match: Any) -> QueryResult:
     """
     Convert Pinecone match into QueryResult.
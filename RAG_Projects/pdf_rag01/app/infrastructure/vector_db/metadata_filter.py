@@ -0,0 +1,154 @@
+"""
+Metadata filter evaluation for local vector stores.
+
+Supports the Pinecone filter language so the same `metadata_filter`
+works against every repository:
+
+    {"document_id": "abc"}
+    {"page_number": {"$gte": 3, "$lt": 10}}
+    {"$or": [{"section": {"$in": ["Intro", "Summary"]}}, {"draft": False}]}
+
+Operators: $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin, $exists, $and, $or.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable
+from typing import Any
+
+
+MetadataPredicate = Callable[[dict[str, Any]], bool]
+
+
+_MISSING = object()
+
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+}
+
+
+def compile_metadata_filter(
+    metadata_filter: dict[str, Any] | None,
+) -> MetadataPredicate | None:
+    """
+    Compile a filter into a predicate once, before scanning any rows.
+
+    Returns None for an empty filter.
+    """
+
+    if not metadata_filter:
+        return None
+
+    return _compile_clause(metadata_filter)
+
+
+def _compile_clause(clause: dict[str, Any]) -> MetadataPredicate:
+    predicates: list[MetadataPredicate] = []
+
+    for key, value in clause.items():
+
+        if key == "$and":
+            parts = [_compile_clause(part) for part in value]
+            predicates.append(
+                lambda metadata, parts=parts: all(
+                    part(metadata) for part in parts
+                )
+            )
+
+        elif key == "$or":
+            parts = [_compile_clause(part) for part in value]
+            predicates.append(
+                lambda metadata, parts=parts: any(
+                    part(metadata) for part in parts
+                )
+            )
+
+        elif key.startswith("$"):
+            raise ValueError(f"Unsupported filter operator: '{key}'.")
+
+        else:
+            predicates.append(_compile_field(key, value))
+
+    if len(predicates) == 1:
+        return predicates[0]
+
+    return lambda metadata: all(
+        predicate(metadata) for predicate in predicates
+    )
+
+
+def _compile_field(
+    field: str,
+    condition: Any,
+) -> MetadataPredicate:
+
+    if not isinstance(condition, dict):
+        condition = {"$eq": condition}
+
+    checks: list[Callable[[Any], bool]] = []
+
+    for op, expected in condition.items():
+
+        if op == "$eq":
+            checks.append(lambda value, expected=expected: _equals(value, expected))
+
+        elif op == "$ne":
+            checks.append(
+                lambda value, expected=expected: not _equals(value, expected)
+            )
+
+        elif op == "$in":
+            options = list(expected)
+            checks.append(
+                lambda value, options=options: any(
+                    _equals(value, option) for option in options
+                )
+            )
+
+        elif op == "$nin":
+            options = list(expected)
+            checks.append(
+                lambda value, options=options: not any(
+                    _equals(value, option) for option in options
+                )
+            )
+
+        elif op == "$exists":
+            checks.append(
+                lambda value, expected=expected: (
+                    (value is not _MISSING) == bool(expected)
+                )
+            )
+
+        elif op in _COMPARISONS:
+            compare = _COMPARISONS[op]
+            checks.append(
+                lambda value, expected=expected, compare=compare: (
+                    value is not _MISSING
+                    and value is not None
+                    and compare(value, expected)
+                )
+            )
+
+        else:
+            raise ValueError(f"Unsupported filter operator: '{op}'.")
+
+    def predicate(metadata: dict[str, Any]) -> bool:
+        value = metadata.get(field, _MISSING)
+        return all(check(value) for check in checks)
+
+    return predicate
+
+
+def _equals(
+    value: Any,
+    expected: Any,
+) -> bool:
+    # Like Pinecone, a list-valued field matches if any element matches.
+    if isinstance(value, list):
+        return expected in value
+    return value is not _MISSING and value == expected
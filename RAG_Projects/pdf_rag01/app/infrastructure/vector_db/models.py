@@ -2,7 +2,12 @@
 Internal models used by the vector repository.
 """
 
+from __future__ import annotations
+
+from dataclasses import dataclass
 from typing import Any
+
+import numpy as np
 from pydantic import BaseModel, Field, model_validator
 
 
@@ -53,6 +58,114 @@ class VectorDocument(BaseModel):
         return self
 
 
+@dataclass(frozen=True)
+class VectorDocumentBatch:
+    """
+    Columnar batch of vector documents.
+
+    Dense vectors are stored as one C-contiguous float32 matrix of shape
+    (len(ids), dimension). Slicing returns views, so no vector data is
+    copied until the batch is serialized at the wire boundary.
+    """
+
+    ids: list[str]
+
+    metadata: list[dict[str, Any]]
+
+    dense_matrix: np.ndarray | None = None
+
+    sparse_vectors: list[SparseVector] | None = None
+
+    def __post_init__(self) -> None:
+        size = len(self.ids)
+
+        if len(self.metadata) != size:
+            raise ValueError(
+                "ids and metadata must have the same length."
+            )
+
+        if self.dense_matrix is None and self.sparse_vectors is None:
+            raise ValueError(
+                "Either dense_matrix or sparse_vectors must be provided."
+            )
+
+        if self.dense_matrix is not None:
+            # No copy when the matrix is already float32 and contiguous.
+            matrix = np.ascontiguousarray(
+                self.dense_matrix,
+                dtype=np.float32,
+            )
+
+            if matrix.ndim != 2 or matrix.shape[0] != size:
+                raise ValueError(
+                    f"dense_matrix must have shape ({size}, dimension)."
+                )
+
+            object.__setattr__(self, "dense_matrix", matrix)
+
+        if (
+            self.sparse_vectors is not None
+            and len(self.sparse_vectors) != size
+        ):
+            raise ValueError(
+                "ids and sparse_vectors must have the same length."
+            )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: slice) -> VectorDocumentBatch:
+        if not isinstance(index, slice):
+            raise TypeError("VectorDocumentBatch only supports slicing.")
+
+        return VectorDocumentBatch(
+            ids=self.ids[index],
+            metadata=self.metadata[index],
+            dense_matrix=(
+                self.dense_matrix[index]
+                if self.dense_matrix is not None
+                else None
+            ),
+            sparse_vectors=(
+                self.sparse_vectors[index]
+                if self.sparse_vectors is not None
+                else None
+            ),
+        )
+
+    @property
+    def dimension(self) -> int | None:
+        if self.dense_matrix is None:
+            return None
+        return self.dense_matrix.shape[1]
+
+    def to_documents(self) -> list[VectorDocument]:
+        """
+        Materialize the batch as VectorDocument objects.
+
+        Allocates Python floats for every value; only use it for small
+        batches or repositories without a columnar path.
+        """
+
+        return [
+            VectorDocument(
+                id=self.ids[row],
+                metadata=self.metadata[row],
+                dense_vector=(
+                    DenseVector(values=self.dense_matrix[row].tolist())
+                    if self.dense_matrix is not None
+                    else None
+                ),
+                sparse_vector=(
+                    self.sparse_vectors[row]
+                    if self.sparse_vectors is not None
+                    else None
+                ),
+            )
+            for row in range(len(self.ids))
+        ]
+
+
 class QueryVector(BaseModel):
     dense_vector: DenseVector | None = None
     sparse_vector: SparseVector | None = None
@@ -72,5 +185,8 @@ class QueryResult(BaseModel):
 class UpsertResponse(BaseModel):
     upserted_count: int
 
+    # Wall-clock latency of every uploaded batch, in batch order.
+    batch_latencies_ms: list[float] = Field(default_factory=list)
+
 class DeleteResponse(BaseModel):
     deleted: bool
\ No newline at end of file
@@ -13,22 +13,28 @@ This class assumes that the Pinecone index already exists.
 
 from __future__ import annotations
 
-from itertools import batched
+import asyncio
+
 from loguru import logger
 from pinecone import Index
 
 from app.core.config import get_settings
 from app.core.exceptions import VectorStoreError
 from app.infrastructure.vector_db.base import VectorStoreRepository
+from app.infrastructure.vector_db.batch_upserter import BatchUpserter
 from app.infrastructure.vector_db.models import (
     QueryResult,
     QueryVector,
     VectorDocument,
+    VectorDocumentBatch,
     UpsertResponse,
     DeleteResponse,
 )
 from app.infrastructure.vector_db.pinecone_client import get_pinecone_client
-from app.infrastructure.vector_db.mappers import to_pinecone_payload, to_query_result, to_vector_document
+from app.infrastructure.vector_db.mappers import to_pinecone_payloads, to_query_result, to_vector_document
+
+
+_MAX_DELETE_IDS = 1000
 
 
 class PineconeRepository(VectorStoreRepository):
@@ -45,13 +51,24 @@ class PineconeRepository(VectorStoreRepository):
 
         self.DEFAULT_BATCH_SIZE = settings.vector_db_batch_size
 
+        self._dimension = settings.embedding_dimension
+
+        self._upserter = BatchUpserter(
+            upsert_call=self._upsert_batch,
+            payload_converter=to_pinecone_payloads,
+            batch_size=self.DEFAULT_BATCH_SIZE,
+            concurrency=settings.vector_db_upsert_concurrency,
+            max_retries=settings.vector_db_upsert_max_retries,
+            retry_backoff_seconds=settings.vector_db_upsert_retry_backoff_seconds,
+        )
+
         logger.info(
             f"Connected to Pinecone index '{settings.pinecone_index_name}'."
         )
 
     async def upsert(
         self,
-        vectors: list[VectorDocument],
+        vectors: list[VectorDocument] | VectorDocumentBatch,
         namespace: str | None = None,
     ) -> UpsertResponse:
         """
@@ -60,31 +77,10 @@ class PineconeRepository(VectorStoreRepository):
 
         try:
 
-            logger.info(
-                f"Upserting {len(vectors)} vectors in batches of {self.DEFAULT_BATCH_SIZE}."
-            )
-
-            payload = [
-                to_pinecone_payload(vector)
-                for vector in vectors
-            ]
-
-            total_upserted = 0
-
-            for i, batch in enumerate(batched(payload, self.DEFAULT_BATCH_SIZE), 1):
-                batch_list = list(batch)
-                logger.debug(f"Uploading batch {i} of {len(batch_list)} vectors.")
-                response = self._index.upsert(
-                    vectors=batch_list,
-                    namespace=namespace,
-                )
-                total_upserted += response.upserted_count
-
-            logger.success(
-                f"Successfully upserted {total_upserted} vectors."
+            return await self._upserter.upsert(
+                vectors,
+                namespace=namespace,
             )
-            
-            return UpsertResponse(upserted_count=total_upserted)
 
         except Exception as exc:
 
@@ -96,6 +92,21 @@ class PineconeRepository(VectorStoreRepository):
                 "Unable to upsert vectors."
             ) from exc
 
+    def _upsert_batch(
+        self,
+        batch: list[dict],
+        namespace: str | None,
+    ) -> int:
+        """
+        Upload a single payload batch. Runs inside the upserter thread pool.
+        """
+
+        response = self._index.upsert(
+            vectors=batch,
+            namespace=namespace,
+        )
+
+        return response.upserted_count
 
     async def query(
         self,
@@ -103,6 +114,7 @@ class PineconeRepository(VectorStoreRepository):
         top_k: int = 5,
         namespace: str | None = None,
         metadata_filter: dict | None = None,
+        include_values: bool = False,
     ) -> list[QueryResult]:
         """
         Perform similarity search.
@@ -114,11 +126,14 @@ class PineconeRepository(VectorStoreRepository):
                 f"Querying Pinecone with top_k={top_k}"
             )
 
-            response = self._index.query(
+            # A dotproduct index always needs a dense vector; zeros make
+            # a sparse-only query score on the sparse part alone.
+            response = await asyncio.to_thread(
+                self._index.query,
                 vector=(
                     vector.dense.values
                     if vector.dense
-                    else None
+                    else [0.0] * self._dimension
                 ),
                 sparse_vector=(
                     {
@@ -132,7 +147,7 @@ class PineconeRepository(VectorStoreRepository):
                 namespace=namespace,
                 filter=metadata_filter,
                 include_metadata=True,
-                include_values=False,
+                include_values=include_values,
             )
 
             results = []
@@ -203,10 +218,13 @@ class PineconeRepository(VectorStoreRepository):
                 f"Deleting {len(ids)} vectors."
             )
 
-            self._index.delete(
-                ids=ids,
-                namespace=namespace,
-            )
+            # Pinecone accepts at most 1000 ids per delete request.
+            for start in range(0, len(ids), _MAX_DELETE_IDS):
+                await asyncio.to_thread(
+                    self._index.delete,
+                    ids=ids[start:start + _MAX_DELETE_IDS],
+                    namespace=namespace,
+                )
 
             logger.success(
                 "Vectors deleted successfully."
@@ -257,4 +275,10 @@ class PineconeRepository(VectorStoreRepository):
 
             raise VectorStoreError(
                 "Unable to delete all vectors."
-            ) from exc
\ No newline at end of file
+            ) from exc
+
+    def close(self) -> None:
+        """
+        Release the upload thread pool.
+        """
+        self._upserter.close()
@@ -1,6 +1,8 @@
 
 from fastapi import Depends
 
+from app.core.config import get_settings
+
 from app.rag_services.retrieval.interfaces.query_preprocessor import (
     QueryPreprocessor,
 )
@@ -8,9 +10,9 @@ from app.rag_services.retrieval.preprocessors.default_query_preprocessor import
     DefaultQueryPreprocessor,
 )
 
-from app.infrastructure.vector_db.pinecone_repository import VectorStoreRepository
+from app.infrastructure.vector_db.base import VectorStoreRepository
 
-from app.infrastructure.embeddings.providers import get_dense_embedder, get_sparse_embedder, get_vector_repository
+from app.infrastructure.embeddings.providers import get_dense_embedder, get_sparse_embedder, get_vector_repository, get_retrieval_cache, get_configured_reranker, get_parent_chunk_store
 
 from app.infrastructure.embeddings.interfaces.dense_embedder import DenseEmbedder
 from app.infrastructure.embeddings.interfaces.sparse_embedder import SparseEmbedder
@@ -20,6 +22,15 @@ from app.rag_services.retrieval.builders.query_vector_builder import (
 )
 
 from app.rag_services.retrieval.pipeline.retrieval_pipeline import RetrievalPipeline
+from app.rag_services.retrieval.cache.retrieval_cache import RetrievalCache
+from app.rag_services.retrieval.fusion.hybrid_searcher import HybridSearcher
+from app.rag_services.retrieval.diversity.mmr_selector import MmrSelector
+from app.rag_services.retrieval.parents.parent_document_resolver import (
+    ParentDocumentResolver,
+)
+from app.rag_services.ingestion.interfaces.parent_chunk_store import (
+    ParentChunkStore,
+)
 
 from app.rag_services.retrieval.mappers.retrieval_result_mapper import (
     RetrievalResultMapper,
@@ -67,8 +78,14 @@ def get_retrieval_result_mapper() -> RetrievalResultMapper:
     return RetrievalResultMapper()
 
 
-def get_reranker() -> Reranker:
-    return DefaultReranker()
+def get_reranker(
+    configured_reranker: Reranker | None = Depends(
+        get_configured_reranker,
+    ),
+) -> Reranker:
+    # The configured reranker is shared so its score cache survives
+    # across requests.
+    return configured_reranker or DefaultReranker()
 
 
 def get_context_builder() -> ContextBuilder:
@@ -76,6 +93,37 @@ def get_context_builder() -> ContextBuilder:
 
 
 
+def get_hybrid_searcher(
+    vector_repository: VectorStoreRepository = Depends(
+        get_vector_repository,
+    ),
+) -> HybridSearcher:
+
+    settings = get_settings()
+
+    return HybridSearcher(
+        vector_repository,
+        over_fetch=settings.retrieval_fusion_over_fetch,
+        rrf_k=settings.retrieval_rrf_k,
+    )
+
+
+def get_mmr_selector() -> MmrSelector:
+    return MmrSelector(
+        over_fetch=get_settings().retrieval_mmr_over_fetch,
+    )
+
+
+def get_parent_document_resolver(
+    parent_store: ParentChunkStore | None = Depends(
+        get_parent_chunk_store,
+    ),
+) -> ParentDocumentResolver | None:
+    if parent_store is None:
+        return None
+    return ParentDocumentResolver(parent_store)
+
+
 def get_retrieval_pipeline(
     query_preprocessor: QueryPreprocessor = Depends(
         get_query_preprocessor,
@@ -95,6 +143,18 @@ def get_retrieval_pipeline(
     context_builder: ContextBuilder = Depends(
         get_context_builder,
     ),
+    retrieval_cache: RetrievalCache | None = Depends(
+        get_retrieval_cache,
+    ),
+    hybrid_searcher: HybridSearcher = Depends(
+        get_hybrid_searcher,
+    ),
+    mmr_selector: MmrSelector = Depends(
+        get_mmr_selector,
+    ),
+    parent_resolver: ParentDocumentResolver | None = Depends(
+        get_parent_document_resolver,
+    ),
 ) -> RetrievalPipeline:
 
     return RetrievalPipeline(
@@ -104,14 +164,25 @@ def get_retrieval_pipeline(
         retrieval_result_mapper=retrieval_result_mapper,
         reranker=reranker,
         context_builder=context_builder,
+        cache=retrieval_cache,
+        hybrid_searcher=hybrid_searcher,
+        mmr_selector=mmr_selector,
+        parent_resolver=parent_resolver,
     )
 
 def get_retrieval_service(
     pipeline: RetrievalPipeline = Depends(
         get_retrieval_pipeline,
     ),
+    context_builder: ContextBuilder = Depends(
+        get_context_builder,
+    ),
 ) -> RetrievalService:
 
-    return RetrievalService(pipeline)
+    return RetrievalService(
+        pipeline,
+        context_builder=context_builder,
+        batch_concurrency=get_settings().retrieval_batch_concurrency,
+    )
 
 
@@ -5,6 +5,28 @@ from app.rag_services.generation.content_window.interfaces.allocator import Budg
 
 
 class DefaultBudgetAllocator(BudgetAllocator):
+    """
+    Splits the prompt budget by fixed shares.
+
+    History and context share one pool: whatever the kept history does
+    not use of its share is handed to the context by `rebalance`.
+    """
+
+    def __init__(
+        self,
+        system_share: float = 0.10,
+        history_share: float = 0.20,
+        context_share: float = 0.60,
+        query_share: float = 0.10,
+    ) -> None:
+
+        if system_share + history_share + context_share + query_share > 1:
+            raise ValueError("Budget shares must not add up to more than 1.")
+
+        self._system_share = system_share
+        self._history_share = history_share
+        self._context_share = context_share
+        self._query_share = query_share
 
     async def allocate(
         self,
@@ -20,10 +42,10 @@ class DefaultBudgetAllocator(BudgetAllocator):
         budget = TokenBudget(
             max_context_tokens=max_context_tokens,
             reserved_response_tokens=reserved_response_tokens,
-            system_budget=int(available * 0.10),
-            history_budget=int(available * 0.20),
-            context_budget=int(available * 0.60),
-            query_budget=int(available * 0.10),
+            system_budget=int(available * self._system_share),
+            history_budget=int(available * self._history_share),
+            context_budget=int(available * self._context_share),
+            query_budget=int(available * self._query_share),
             available_budget=available,
         )
 
@@ -31,4 +53,26 @@ class DefaultBudgetAllocator(BudgetAllocator):
             f"Allocated token budget: {budget.model_dump()}"
         )
 
-        return budget
\ No newline at end of file
+        return budget
+
+    async def rebalance(
+        self,
+        budget: TokenBudget,
+        history_tokens: int,
+    ) -> TokenBudget:
+
+        unused = max(budget.history_budget - history_tokens, 0)
+
+        if not unused:
+            return budget
+
+        logger.debug(
+            f"Moving {unused} unused history tokens to the context budget."
+        )
+
+        return budget.model_copy(
+            update={
+                "history_budget": budget.history_budget - unused,
+                "context_budget": budget.context_budget + unused,
+            }
+        )
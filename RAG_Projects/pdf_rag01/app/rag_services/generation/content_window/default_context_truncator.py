@@ -1,3 +1,23 @@
+"""
+Knapsack context packing.
+
+Responsibilities:
+- Pick the chunks with the highest total relevance whose token counts
+  fit the context budget (0/1 knapsack), instead of greedily skipping
+  whatever does not fit.
+- Solve exactly with a token-level DP while N * budget stays under
+  `max_dp_cells`; otherwise solve over token buckets (weights rounded
+  up, so the result always fits) and fill leftover tokens greedily.
+- Optionally fill the remaining tokens with the leading sentences of
+  the best chunk that did not fit.
+
+Each DP row is one vectorized NumPy max over the capacity axis, which
+keeps 100 candidates well under a millisecond.
+"""
+
+import re
+
+import numpy as np
 from loguru import logger
 
 from app.domains.generation.models import (
@@ -6,10 +26,34 @@ from app.domains.generation.models import (
 from app.rag_services.generation.content_window.interfaces.context_truncator import (
     ContextTruncator
 )
+from app.rag_services.generation.content_window.interfaces.token_counter import (
+    TokenCounter,
+)
+
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
 
 
 class DefaultContextTruncator(ContextTruncator):
 
+    def __init__(
+        self,
+        token_counter: TokenCounter | None = None,
+        trim_sentences: bool = False,
+        min_trim_tokens: int = 32,
+        max_dp_cells: int = 50_000,
+    ) -> None:
+
+        if trim_sentences and token_counter is None:
+            raise ValueError(
+                "Sentence trimming needs a token counter."
+            )
+
+        self._token_counter = token_counter
+        self._trim_sentences = trim_sentences
+        self._min_trim_tokens = min_trim_tokens
+        self._max_dp_cells = max_dp_cells
+
     async def truncate(
         self,
         chunks: list[TokenizedContextChunk],
@@ -20,35 +64,223 @@ class DefaultContextTruncator(ContextTruncator):
             f"Context budget: {token_budget}"
         )
 
+        if not chunks or token_budget <= 0:
+            return []
+
+        picked = self._pack(
+            weights=np.fromiter(
+                (chunk.token_count for chunk in chunks),
+                dtype=np.int64,
+                count=len(chunks),
+            ),
+            values=_relevance(
+                np.fromiter(
+                    (chunk.chunk.score for chunk in chunks),
+                    dtype=np.float64,
+                    count=len(chunks),
+                )
+            ),
+            capacity=token_budget,
+        )
+
         #
         # Highest score first
         #
 
-        ordered_chunks = sorted(
-            chunks,
+        selected = sorted(
+            (chunks[row] for row in picked),
             key=lambda chunk: chunk.chunk.score,
             reverse=True,
         )
 
-        selected: list[TokenizedContextChunk] = []
+        total_tokens = sum(chunk.token_count for chunk in selected)
+
+        if (
+            self._trim_sentences
+            and token_budget - total_tokens >= self._min_trim_tokens
+        ):
+            trimmed = await self._trim_best_remaining(
+                chunks=[
+                    chunk
+                    for row, chunk in enumerate(chunks)
+                    if row not in picked
+                ],
+                token_budget=token_budget - total_tokens,
+            )
+
+            if trimmed is not None:
+                selected.append(trimmed)
+                total_tokens += trimmed.token_count
+
+        logger.info(
+            f"Selected {len(selected)} chunks "
+            f"({total_tokens} tokens)"
+        )
+
+        return selected
 
-        total_tokens = 0
+    def _pack(
+        self,
+        weights: np.ndarray,
+        values: np.ndarray,
+        capacity: int,
+    ) -> set[int]:
+        """
+        0/1 knapsack over chunks. Returns the picked row numbers.
+        """
+
+        # Free chunks are always taken; oversized ones never fit.
+        free = np.flatnonzero(weights <= 0)
+        rows = np.flatnonzero((weights > 0) & (weights <= capacity))
 
-        for chunk in ordered_chunks:
+        if not len(rows):
+            return set(free.tolist())
 
-            if (
-                total_tokens + chunk.token_count
-                > token_budget
+        if int(weights[rows].sum()) <= capacity:
+            return set(free.tolist()) | set(rows.tolist())
+
+        # Tokens per DP column. 1 is exact; larger values round every
+        # weight up, so a bucketed solution never exceeds the budget.
+        resolution = max(
+            1,
+            -(-capacity * len(rows) // self._max_dp_cells),
+        )
+
+        bucket_weights = -(-weights[rows] // resolution)
+        bucket_capacity = capacity // resolution
+
+        chosen = _knapsack(
+            weights=bucket_weights,
+            values=values[rows],
+            capacity=bucket_capacity,
+        )
+
+        picked = set(free.tolist()) | {int(rows[row]) for row in chosen}
+
+        if resolution > 1:
+
+            # Rounding leaves real tokens unused; fill them by value
+            # density.
+            remaining = capacity - int(weights[list(picked)].sum())
+
+            for row in sorted(
+                (int(row) for row in rows if int(row) not in picked),
+                key=lambda row: values[row] / weights[row],
+                reverse=True,
             ):
-                continue
+                if weights[row] <= remaining:
+                    picked.add(row)
+                    remaining -= int(weights[row])
 
-            selected.append(chunk)
+        logger.debug(
+            f"Packed {len(picked)} of {len(weights)} chunks "
+            f"({'exact' if resolution == 1 else f'{resolution}-token buckets'})."
+        )
 
-            total_tokens += chunk.token_count
+        return picked
 
-        logger.info(
-            f"Selected {len(selected)} chunks "
-            f"({total_tokens} tokens)"
+    async def _trim_best_remaining(
+        self,
+        chunks: list[TokenizedContextChunk],
+        token_budget: int,
+    ) -> TokenizedContextChunk | None:
+        """
+        Keep the leading sentences of the best chunk left out.
+        """
+
+        if not chunks:
+            return None
+
+        best = max(chunks, key=lambda chunk: chunk.chunk.score)
+
+        sentences = _SENTENCE_BOUNDARY.split(best.chunk.content.strip())
+
+        if len(sentences) < 2:
+            return None
+
+        counts = np.cumsum(
+            await self._token_counter.count_batch(sentences)
         )
 
-        return selected
\ No newline at end of file
+        # Sentences that fit, counted separately. Joining can add a few
+        # tokens, so the joined text is counted again below.
+        keep = int(np.searchsorted(counts, token_budget, side="right"))
+
+        while keep:
+            content = " ".join(sentences[:keep])
+            tokens = await self._token_counter.count(content)
+
+            if tokens <= token_budget:
+                logger.debug(
+                    f"Trimmed chunk '{best.chunk.chunk_id}' to "
+                    f"{keep} of {len(sentences)} sentences."
+                )
+
+                return TokenizedContextChunk(
+                    chunk=best.chunk.model_copy(
+                        update={
+                            "content": content,
+                            "metadata": {
+                                **best.chunk.metadata,
+                                "trimmed": True,
+                            },
+                        }
+                    ),
+                    token_count=tokens,
+                )
+
+            keep -= 1
+
+        return None
+
+
+def _relevance(scores: np.ndarray) -> np.ndarray:
+    """
+    Knapsack values. Scores such as cross-encoder logits can be
+    negative; they are shifted so every chunk is worth something and
+    the ranking is unchanged.
+    """
+
+    low = float(scores.min())
+
+    if low > 0:
+        return scores
+
+    spread = float(scores.max()) - low
+
+    return scores - low + (spread * 0.01 if spread > 0 else 1.0)
+
+
+def _knapsack(
+    weights: np.ndarray,
+    values: np.ndarray,
+    capacity: int,
+) -> list[int]:
+    """
+    Exact 0/1 knapsack over integer weights.
+    """
+
+    best = np.zeros(capacity + 1, dtype=np.float64)
+    taken = np.zeros((len(weights), capacity + 1), dtype=bool)
+
+    for row, (weight, value) in enumerate(zip(weights.tolist(), values.tolist())):
+
+        if weight > capacity:
+            continue
+
+        # `candidate` is a copy, so updating `best` in place below
+        # still reads the previous row.
+        candidate = best[:capacity + 1 - weight] + value
+
+        np.greater(candidate, best[weight:], out=taken[row, weight:])
+        np.maximum(best[weight:], candidate, out=best[weight:])
+
+    chosen: list[int] = []
+    remaining = int(np.argmax(best))
+
+    for row in range(len(weights) - 1, -1, -1):
+        if taken[row, remaining]:
+            chosen.append(row)
+            remaining -= int(weights[row])
+
+    return chosen
@@ -1,3 +1,5 @@
+import asyncio
+
 from loguru import logger
 
 from app.domains.generation.models import (
@@ -68,19 +70,19 @@ class DefaultContextWindowManager(ContextWindowManager):
         )
 
         # ---------------------------------------------------------
-        # Step 2 - Tokenize conversation history
+        # Step 2 / 3 - Tokenize conversation history and chunks
+        #
+        # Earlier messages carry their count in metadata and chunks
+        # carry the count from ingestion, so only new text is encoded.
         # ---------------------------------------------------------
 
-        tokenized_history = await self._tokenizer.tokenize_messages(
-            history
-        )
-
-        # ---------------------------------------------------------
-        # Step 3 - Tokenize retrieved chunks
-        # ---------------------------------------------------------
-
-        tokenized_chunks = await self._tokenizer.tokenize_chunks(
-            retrieval_context.results
+        tokenized_history, tokenized_chunks = await asyncio.gather(
+            self._tokenizer.tokenize_messages(
+                history
+            ),
+            self._tokenizer.tokenize_chunks(
+                retrieval_context.results
+            ),
         )
 
         # ---------------------------------------------------------
@@ -93,9 +95,18 @@ class DefaultContextWindowManager(ContextWindowManager):
         )
 
         # ---------------------------------------------------------
-        # Step 5 - Truncate retrieved chunks
+        # Step 5 - Give unused history tokens to the context, then
+        #          pack retrieved chunks into the context budget
         # ---------------------------------------------------------
 
+        budget = await self._allocator.rebalance(
+            budget=budget,
+            history_tokens=sum(
+                message.token_count
+                for message in tokenized_history
+            ),
+        )
+
         tokenized_chunks = await self._context_truncator.truncate(
             chunks=tokenized_chunks,
             token_budget=budget.context_budget,
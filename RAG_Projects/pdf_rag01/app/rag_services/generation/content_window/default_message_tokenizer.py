@@ -9,36 +9,76 @@ from app.domains.generation.models import (
 
 from app.rag_services.generation.content_window.interfaces.message_tokenizer import MessageTokenizer
 from app.rag_services.generation.content_window.interfaces.token_counter import TokenCounter
+from app.rag_services.generation.content_window.token_count_cache import (
+    TokenCountCache,
+    content_key,
+)
 
 
 class DefaultMessageTokenizer(MessageTokenizer):
+    """
+    Counts tokens of history messages and context chunks.
+
+    Counts are looked up before anything is encoded:
+
+    1. Message metadata: a message that was tokenized before carries
+       `token_count` and the hash of the content it was counted for.
+    2. Chunk metadata: `token_count` computed during ingestion, when its
+       `token_encoding` is the counter's encoding.
+    3. The TokenCountCache, by content hash.
+
+    Whatever is left is encoded in one `count_batch` call.
+    """
 
     def __init__(
         self,
         token_counter: TokenCounter,
+        cache: TokenCountCache | None = None,
     ) -> None:
 
         self._token_counter = token_counter
+        self._cache = cache
 
     async def tokenize_messages(
         self,
         messages: list[ChatMessage],
     ) -> list[TokenizedMessage]:
 
-        tokenized: list[TokenizedMessage] = []
-
-        for message in messages:
-
-            tokens = await self._token_counter.count(
-                message.content
-            )
+        keys = [
+            content_key(message.content)
+            for message in messages
+        ]
+
+        counts = await self._count(
+            texts=[message.content for message in messages],
+            keys=keys,
+            known=[
+                message.metadata.get("token_count")
+                if message.metadata.get("token_count_key") == key
+                else None
+                for message, key in zip(messages, keys)
+            ],
+        )
 
-            tokenized.append(
-                TokenizedMessage(
-                    message=message,
-                    token_count=tokens,
-                )
+        tokenized = [
+            TokenizedMessage(
+                message=(
+                    message
+                    if message.metadata.get("token_count_key") == key
+                    else message.model_copy(
+                        update={
+                            "metadata": {
+                                **message.metadata,
+                                "token_count": tokens,
+                                "token_count_key": key,
+                            }
+                        }
+                    )
+                ),
+                token_count=tokens,
             )
+            for message, key, tokens in zip(messages, keys, counts)
+        ]
 
         logger.debug(
             f"Tokenized {len(messages)} messages."
@@ -51,23 +91,108 @@ class DefaultMessageTokenizer(MessageTokenizer):
         chunks: list[ContextChunk],
     ) -> list[TokenizedContextChunk]:
 
-        tokenized: list[TokenizedContextChunk] = []
+        # Chunks with an ingestion-time count are never hashed.
+        known = [
+            _stored_token_count(
+                chunk.metadata,
+                self._token_counter.encoding_name,
+            )
+            for chunk in chunks
+        ]
+
+        counts = await self._count(
+            texts=[chunk.content for chunk in chunks],
+            keys=[
+                content_key(chunk.content) if count is None else None
+                for chunk, count in zip(chunks, known)
+            ],
+            known=known,
+        )
+
+        tokenized = [
+            TokenizedContextChunk(
+                chunk=chunk,
+                token_count=tokens,
+            )
+            for chunk, tokens in zip(chunks, counts)
+        ]
+
+        logger.debug(
+            f"Tokenized {len(chunks)} context chunks."
+        )
+
+        return tokenized
+
+    async def _count(
+        self,
+        texts: list[str],
+        keys: list[str | None],
+        known: list[int | None],
+    ) -> list[int]:
+        """
+        Fill in the unknown counts, encoding each distinct text once.
+        """
+
+        counts = list(known)
+
+        # key -> positions still waiting for a count
+        missing: dict[str, list[int]] = {}
 
-        for chunk in chunks:
+        for position, (key, count) in enumerate(zip(keys, known)):
 
-            tokens = await self._token_counter.count(
-                chunk.content
+            if count is not None:
+                continue
+
+            cached = (
+                self._cache.get(key)
+                if self._cache is not None
+                else None
             )
 
-            tokenized.append(
-                TokenizedContextChunk(
-                    chunk=chunk,
-                    token_count=tokens,
-                )
+            if cached is not None:
+                counts[position] = cached
+            else:
+                missing.setdefault(key, []).append(position)
+
+        if missing:
+            encoded = await self._token_counter.count_batch(
+                [texts[positions[0]] for positions in missing.values()]
             )
 
+            for (key, positions), tokens in zip(missing.items(), encoded):
+
+                if self._cache is not None:
+                    self._cache.put(key, tokens)
+
+                for position in positions:
+                    counts[position] = tokens
+
         logger.debug(
-            f"Tokenized {len(chunks)} context chunks."
+            f"Encoded {len(missing)} of {len(texts)} texts; "
+            "the rest came from metadata or the token count cache."
         )
 
-        return tokenized
\ No newline at end of file
+        return counts
+
+
+def _stored_token_count(
+    metadata: dict,
+    encoding_name: str | None,
+) -> int | None:
+    """
+    The ingestion-time token count of a chunk, if it can be trusted.
+    """
+
+    if (
+        encoding_name is None
+        or metadata.get("token_encoding") != encoding_name
+    ):
+        return None
+
+    count = metadata.get("token_count")
+
+    # Vector stores may hand numbers back as floats.
+    if isinstance(count, float) and count.is_integer():
+        return int(count)
+
+    return count if isinstance(count, int) else None
@@ -11,4 +11,12 @@ class BudgetAllocator(ABC):
         max_context_tokens: int,
         reserved_response_tokens: int,
     ) -> TokenBudget:
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    async def rebalance(
+        self,
+        budget: TokenBudget,
+        history_tokens: int,
+    ) -> TokenBudget:
+        ...
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app.domains.generation.models import (
     GenerationRequest,
     GenerationResult,
+    GenerationStreamEvent,
 )
 
 
@@ -13,4 +15,11 @@ class GenerationPipeline(ABC):
         self,
         request: GenerationRequest,
     ) -> GenerationResult:
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    def stream(
+        self,
+        request: GenerationRequest,
+    ) -> AsyncIterator[GenerationStreamEvent]:
+        ...
@@ -10,9 +10,24 @@ class TokenCounter(ABC):
     ) -> int:
         ...
 
+    @abstractmethod
+    async def count_batch(
+        self,
+        texts: list[str],
+    ) -> list[int]:
+        ...
+
     @abstractmethod
     async def count_messages(
         self,
         messages: list[str],
     ) -> int:
-        ...
\ No newline at end of file
+        ...
+
+    @property
+    def encoding_name(self) -> str | None:
+        """
+        Encoding the counts belong to. Ingestion-time chunk counts are
+        only reused when they were made with the same encoding.
+        """
+        return None
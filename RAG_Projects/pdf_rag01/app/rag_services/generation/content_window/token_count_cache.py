@@ -0,0 +1,107 @@
+"""
+Token count cache.
+
+Responsibilities:
+- Remember token counts by content hash, so history messages that
+  never change are not re-encoded on every turn.
+- Cap memory with LRU eviction.
+- Track hit / miss counters.
+
+Hashing a message is far cheaper than encoding it, so a lookup pays
+off from the second time a message is seen.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+from pydantic import BaseModel, computed_field
+
+
+class TokenCountCacheStats(BaseModel):
+    """
+    Snapshot of the token count cache counters.
+    """
+
+    hits: int = 0
+
+    misses: int = 0
+
+    entries: int = 0
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
+
+
+class TokenCountCache:
+    """
+    In-process LRU of token counts keyed by content hash.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+    ) -> None:
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+
+        self._max_entries = max_entries
+        self._counts: OrderedDict[str, int] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self,
+        key: str,
+    ) -> int | None:
+        count = self._counts.get(key)
+
+        if count is None:
+            self._misses += 1
+            return None
+
+        self._counts.move_to_end(key)
+        self._hits += 1
+
+        return count
+
+    def put(
+        self,
+        key: str,
+        count: int,
+    ) -> None:
+        self._counts[key] = count
+        self._counts.move_to_end(key)
+
+        while len(self._counts) > self._max_entries:
+            self._counts.popitem(last=False)
+
+    def stats(self) -> TokenCountCacheStats:
+        """
+        Return the current hit / miss counters.
+        """
+
+        return TokenCountCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=len(self._counts),
+        )
+
+
+def content_key(text: str) -> str:
+    """
+    Hash used to key token counts of `text`.
+    """
+
+    return hashlib.blake2b(
+        text.encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
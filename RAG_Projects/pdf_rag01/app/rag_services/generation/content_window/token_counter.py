@@ -1,19 +1,35 @@
+import asyncio
+
 import tiktoken
 
 from loguru import logger
 
+from app.core.config import get_settings
+from app.rag_services.generation.content_window.interfaces.token_counter import (
+    TokenCounter,
+)
+
 
 class TikTokenCounter(TokenCounter):
 
     def __init__(
         self,
-        encoding_name: str = "cl100k_base",
+        encoding_name: str | None = None,
     ) -> None:
 
+        # Same default as ingestion, so stored chunk counts are reusable.
+        self._encoding_name = (
+            encoding_name or get_settings().tokenizer_encoding
+        )
+
         self._encoding = tiktoken.get_encoding(
-            encoding_name
+            self._encoding_name
         )
 
+    @property
+    def encoding_name(self) -> str:
+        return self._encoding_name
+
     async def count(
         self,
         text: str,
@@ -29,14 +45,34 @@ class TikTokenCounter(TokenCounter):
 
         return tokens
 
+    async def count_batch(
+        self,
+        texts: list[str],
+    ) -> list[int]:
+
+        if not texts:
+            return []
+
+        # encode_batch spreads the texts over tiktoken's own thread
+        # pool; the worker thread keeps the event loop free meanwhile.
+        encoded = await asyncio.to_thread(
+            self._encoding.encode_batch,
+            texts,
+        )
+
+        counts = [len(tokens) for tokens in encoded]
+
+        logger.debug(
+            f"Token counts for {len(texts)} texts: {sum(counts)} total"
+        )
+
+        return counts
+
     async def count_messages(
         self,
         messages: list[str],
     ) -> int:
 
-        total = 0
-
-        for message in messages:
-            total += await self.count(message)
-
-        return total
\ No newline at end of file
+        return sum(
+            await self.count_batch(messages)
+        )
@@ -1,16 +1,41 @@
+from fastapi import Depends
+
+from app.infrastructure.embeddings.providers import (
+    get_llm_client,
+    get_prompt_registry,
+)
+from app.infrastructure.llm.interfaces.client import LLMClient
 from app.infrastructure.prompts.default_prompt_renderer import DefaultPromptRenderer
+from app.infrastructure.prompts.interfaces.message_builder import MessageBuilder
 from app.infrastructure.prompts.interfaces.renderer import PromptRenderer
 from app.infrastructure.prompts.interfaces.registry import PromptRegistry
-from app.infrastructure.prompts.in_memory_registry import InMemoryPromptRegistry
+from app.rag_services.dependencies.retrieval import get_retrieval_pipeline
+from app.rag_services.retrieval.pipeline.retrieval_pipeline import RetrievalPipeline
 from app.rag_services.generation.content_window.interfaces.token_counter import TokenCounter
 from app.rag_services.generation.content_window.token_counter import TikTokenCounter
+from app.rag_services.generation.content_window.token_count_cache import (
+    TokenCountCache,
+)
+from app.rag_services.generation.content_window.default_message_tokenizer import (
+    DefaultMessageTokenizer,
+)
+from app.rag_services.generation.content_window.interfaces.message_tokenizer import (
+    MessageTokenizer,
+)
+
+from app.rag_services.generation.content_window.budget_allocator import (
+    DefaultBudgetAllocator,
+)
+from app.rag_services.generation.content_window.interfaces.allocator import (
+    BudgetAllocator,
+)
 
 from app.rag_services.generation.content_window.truncator import (
     DefaultHistoryTruncator
 )
 
 from app.rag_services.generation.content_window.interfaces.history_truncator import (
-    DefaultHistoryTruncator
+    HistoryTruncator
 )
 
 from app.rag_services.generation.content_window.interfaces.context_truncator import (
@@ -28,63 +53,146 @@ from app.rag_services.generation.content_window.interfaces.context_organizer imp
     ContextOrganizer
 )
 
-from app.domains.generation.service import GenerationService
+from app.rag_services.generation.content_window.default_manager import (
+    DefaultContextWindowManager,
+)
+from app.rag_services.generation.content_window.interfaces.manager import (
+    ContextWindowManager,
+)
 
-from app.api.dependencies.generation_pipeline import (
-    get_generation_pipeline,
+from app.rag_services.generation.content_window.interfaces.pipeline import (
+    GenerationPipeline,
 )
+from app.rag_services.generation.pipeline import DefaultGenerationPipeline
+
+from app.domains.generation.services import GenerationService
 
 
-from app.rag_services.generation.interfaces.response_parser import (
+from app.rag_services.generation.content_window.interfaces.response_parser import (
     ResponseParser,
 )
-from app.rag_services.generation.response_parser import (
+from app.rag_services.generation.default_response_parser import (
     DefaultResponseParser,
 )
+from app.rag_services.generation.default_message_builder import (
+    DefaultMessageBuilder,
+)
 
 
-# prompt registry
-_prompt_registry = InMemoryPromptRegistry()
-async def get_prompt_registry() -> PromptRegistry:
-    return _prompt_registry
-
+# The components below hold no per-request state and are shared.
+# The prompt registry and the LLM client are created at startup
+# (see main.py).
 
 _prompt_renderer = DefaultPromptRenderer()
-async def get_prompt_renderer() -> PromptRenderer:
+def get_prompt_renderer() -> PromptRenderer:
     return _prompt_renderer
 
 
 _message_builder = DefaultMessageBuilder()
-async def get_message_builder() -> MessageBuilder:
+def get_message_builder() -> MessageBuilder:
     return _message_builder
 
 # context window management
 _token_counter = TikTokenCounter()
-async def get_token_counter() -> TokenCounter:
+def get_token_counter() -> TokenCounter:
     return _token_counter
 
 
+# Shared so history counts survive across requests.
+_token_count_cache = TokenCountCache()
+def get_token_count_cache() -> TokenCountCache:
+    return _token_count_cache
+
+
+_message_tokenizer = DefaultMessageTokenizer(
+    token_counter=_token_counter,
+    cache=_token_count_cache,
+)
+def get_message_tokenizer() -> MessageTokenizer:
+    return _message_tokenizer
+
+
+_budget_allocator = DefaultBudgetAllocator()
+def get_budget_allocator() -> BudgetAllocator:
+    return _budget_allocator
+
+
 _history_truncator = DefaultHistoryTruncator()
-async def get_history_truncator() -> HistoryTruncator:
+def get_history_truncator() -> HistoryTruncator:
     return _history_truncator
 
 
 _context_truncator = DefaultContextTruncator()
-async def get_context_truncator() -> ContextTruncator:
+def get_context_truncator() -> ContextTruncator:
     return _context_truncator
 
 _context_organizer = LostMiddleContextOrganizer()
-async def get_context_organizer() -> ContextOrganizer:
+def get_context_organizer() -> ContextOrganizer:
     return _context_organizer
 
 
+_context_window_manager = DefaultContextWindowManager(
+    tokenizer=_message_tokenizer,
+    allocator=_budget_allocator,
+    history_truncator=_history_truncator,
+    context_truncator=_context_truncator,
+    context_organizer=_context_organizer,
+    token_counter=_token_counter,
+)
+def get_context_window_manager() -> ContextWindowManager:
+    return _context_window_manager
+
+
 _response_parser = DefaultResponseParser()
-async def get_response_parser() -> ResponseParser:
+def get_response_parser() -> ResponseParser:
     return _response_parser
 
-async def get_generation_service() -> GenerationService:
-    pipeline = await get_generation_pipeline()
+
+def get_generation_pipeline(
+    retrieval_pipeline: RetrievalPipeline = Depends(
+        get_retrieval_pipeline,
+    ),
+    context_window_manager: ContextWindowManager = Depends(
+        get_context_window_manager,
+    ),
+    prompt_registry: PromptRegistry = Depends(
+        get_prompt_registry,
+    ),
+    prompt_renderer: PromptRenderer = Depends(
+        get_prompt_renderer,
+    ),
+    message_builder: MessageBuilder = Depends(
+        get_message_builder,
+    ),
+    llm_client: LLMClient = Depends(
+        get_llm_client,
+    ),
+    response_parser: ResponseParser = Depends(
+        get_response_parser,
+    ),
+    message_tokenizer: MessageTokenizer = Depends(
+        get_message_tokenizer,
+    ),
+) -> GenerationPipeline:
+
+    return DefaultGenerationPipeline(
+        retrieval_pipeline=retrieval_pipeline,
+        context_window_manager=context_window_manager,
+        prompt_registry=prompt_registry,
+        prompt_renderer=prompt_renderer,
+        message_builder=message_builder,
+        llm_client=llm_client,
+        response_parser=response_parser,
+        message_tokenizer=message_tokenizer,
+    )
+
+
+def get_generation_service(
+    pipeline: GenerationPipeline = Depends(
+        get_generation_pipeline,
+    ),
+) -> GenerationService:
 
     return GenerationService(
         pipeline=pipeline,
-    )
\ No newline at end of file
+    )
@@ -1,14 +1,33 @@
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
 from loguru import logger
 
+from app.domains.generation.enums import GenerationEventType
 from app.domains.generation.models import (
+    Citation,
+    ContextChunk,
     GenerationRequest,
     GenerationResult,
+    GenerationStreamEvent,
+    ChatMessage,
+    PromptTemplate,
     PromptVariables,
     LLMRequest,
+    RetrievalContext,
+    UsageMetrics,
 )
 from app.rag_services.generation.content_window.interfaces.pipeline import GenerationPipeline
+from app.rag_services.retrieval.models.retrieval_request import RetrievalRequest
+from app.rag_services.retrieval.models.retrieval_result import RetrievalResult
 from app.rag_services.retrieval.pipeline.retrieval_pipeline import RetrievalPipeline
 from app.rag_services.generation.content_window.interfaces.manager import ContextWindowManager
+from app.rag_services.generation.content_window.interfaces.message_tokenizer import (
+    MessageTokenizer,
+)
+from app.rag_services.generation.stage_spans import StageSpans
+from app.infrastructure.llm.interfaces.client import LLMClient
 from app.infrastructure.prompts.interfaces.registry import PromptRegistry
 from app.infrastructure.prompts.interfaces.renderer import PromptRenderer
 from app.infrastructure.prompts.interfaces.message_builder import MessageBuilder
@@ -17,9 +36,21 @@ from app.rag_services.generation.content_window.interfaces.response_parser impor
 
 
 class DefaultGenerationPipeline(GenerationPipeline):
+    """
+    Retrieval-augmented generation.
+
+    `generate` returns the parsed answer once the LLM has finished.
+    `stream` yields the retrieval metadata as soon as retrieval is done,
+    then every token as the LLM produces it, then the usage.
+
+    Work that does not depend on the retrieved chunks runs while
+    retrieval is in flight: the prompt template lookup, tokenizing the
+    conversation history (the counts land in message metadata, so the
+    context window manager does not encode it again) and warming up the
+    LLM connection. Every stage is recorded as a timing span.
+    """
 
     def __init__(
-        self,
         self,
         retrieval_pipeline: RetrievalPipeline,
         context_window_manager: ContextWindowManager,
@@ -28,6 +59,7 @@ class DefaultGenerationPipeline(GenerationPipeline):
         message_builder: MessageBuilder,
         llm_client: LLMClient,
         response_parser: ResponseParser,
+        message_tokenizer: MessageTokenizer | None = None,
     ) -> None:
 
         self._retrieval_pipeline = retrieval_pipeline
@@ -37,6 +69,10 @@ class DefaultGenerationPipeline(GenerationPipeline):
         self._message_builder = message_builder
         self._llm_client = llm_client
         self._response_parser = response_parser
+        self._message_tokenizer = message_tokenizer
+
+        # Warm-ups run detached; keep references until they finish.
+        self._background: set[asyncio.Task] = set()
 
     async def generate(
         self,
@@ -47,79 +83,327 @@ class DefaultGenerationPipeline(GenerationPipeline):
             f"Generating response for '{request.query}'"
         )
 
+        spans = StageSpans()
+        prefetch = self._start_prefetch(request, spans)
+
+        try:
+            with spans.span("retrieval"):
+                retrieval_context = await self._retrieve(request)
+
+            llm_request = await self._build_llm_request(
+                request,
+                retrieval_context,
+                prefetch,
+                spans,
+                stream=False,
+            )
+        finally:
+            prefetch.cancel()
+
         #
-        # Retrieve documents
+        # Generate
         #
 
-        retrieval_context = await self._retrieval_pipeline.retrieve(
-            query=request.query,
-            top_k=request.top_k,
+        with spans.span("llm"):
+            llm_response = await self._llm_client.generate(
+                llm_request
+            )
+
+        #
+        # Parse
+        #
+
+        with spans.span("parse"):
+            result = await self._response_parser.parse(
+                llm_response
+            )
+
+        return result.model_copy(
+            update={"timings": spans.spans()}
+        )
+
+    async def stream(
+        self,
+        request: GenerationRequest,
+    ) -> AsyncIterator[GenerationStreamEvent]:
+
+        logger.info(
+            f"Streaming response for '{request.query}'"
         )
 
+        spans = StageSpans()
+        prefetch = self._start_prefetch(request, spans)
+
+        try:
+            with spans.span("retrieval"):
+                retrieval_context = await self._retrieve(request)
+
+            #
+            # Retrieval metadata goes out before prompt building starts
+            #
+
+            yield GenerationStreamEvent(
+                event=GenerationEventType.RETRIEVAL,
+                data={
+                    "citations": [
+                        Citation(
+                            document_id=chunk.document_id,
+                            chunk_id=chunk.chunk_id,
+                            page_number=chunk.page_number,
+                            score=chunk.score,
+                        ).model_dump()
+                        for chunk in retrieval_context.results
+                    ],
+                    "total_results": retrieval_context.total_results,
+                },
+            )
+
+            llm_request = await self._build_llm_request(
+                request,
+                retrieval_context,
+                prefetch,
+                spans,
+                stream=True,
+            )
+        finally:
+            prefetch.cancel()
+
         #
-        # Build context window
+        # Stream tokens
         #
 
-        context_window = await self._context_window_manager.build(
-            history=request.history,
-            retrieval_context=retrieval_context,
-            max_context_tokens=request.max_context_tokens,
-            reserved_response_tokens=request.reserved_response_tokens,
+        time_to_first_token_ms: float | None = None
+        finish_reason: str | None = None
+        usage: UsageMetrics | None = None
+
+        with spans.span("llm"):
+            async for chunk in self._llm_client.stream(llm_request):
+
+                if chunk.content:
+
+                    if time_to_first_token_ms is None:
+                        time_to_first_token_ms = spans.elapsed_ms()
+
+                        logger.info(
+                            f"Time to first token: "
+                            f"{time_to_first_token_ms:.1f} ms."
+                        )
+
+                    yield GenerationStreamEvent(
+                        event=GenerationEventType.TOKEN,
+                        data={"content": chunk.content},
+                    )
+
+                finish_reason = chunk.finish_reason or finish_reason
+                usage = chunk.usage or usage
+
+        latency_ms = spans.elapsed_ms()
+
+        if usage is not None:
+            usage = usage.model_copy(update={"latency_ms": latency_ms})
+
+        logger.success(
+            f"Streamed response in {latency_ms:.1f} ms."
         )
 
+        yield GenerationStreamEvent(
+            event=GenerationEventType.DONE,
+            data={
+                "finish_reason": finish_reason,
+                "usage": usage.model_dump() if usage else None,
+                "time_to_first_token_ms": time_to_first_token_ms,
+                "latency_ms": latency_ms,
+                "timings": [
+                    span.model_dump()
+                    for span in spans.spans()
+                ],
+            },
+        )
+
+    def _start_prefetch(
+        self,
+        request: GenerationRequest,
+        spans: StageSpans,
+    ) -> "_Prefetch":
+        """
+        Start everything that does not need the retrieved chunks.
+        """
+
         #
-        # Load prompt
+        # Warm up the LLM connection; nobody waits for it
         #
 
-        prompt = await self._prompt_registry.get(
-            request.prompt_name,
-            request.prompt_version,
+        warm_up = asyncio.create_task(
+            spans.measure("llm_warm_up", self._llm_client.warm_up())
         )
 
+        self._background.add(warm_up)
+        warm_up.add_done_callback(self._background.discard)
+
+        return _Prefetch(
+            prompt=asyncio.create_task(
+                self._fetch_prompt(request, spans)
+            ),
+            history=asyncio.create_task(
+                self._pretokenize_history(
+                    request.conversation_history,
+                    spans,
+                )
+            ),
+        )
+
+    async def _fetch_prompt(
+        self,
+        request: GenerationRequest,
+        spans: StageSpans,
+    ) -> PromptTemplate:
+
+        with spans.span("prompt_fetch"):
+            return await self._prompt_registry.get(
+                request.prompt_name,
+                request.prompt_version,
+            )
+
+    async def _pretokenize_history(
+        self,
+        history: list[ChatMessage],
+        spans: StageSpans,
+    ) -> list[ChatMessage]:
+        """
+        Count history tokens ahead of time. The counts are kept in
+        message metadata, where the context window manager finds them.
+        """
+
+        if self._message_tokenizer is None or not history:
+            return history
+
+        with spans.span("history_tokenize"):
+            tokenized = await self._message_tokenizer.tokenize_messages(
+                history
+            )
+
+        return [message.message for message in tokenized]
+
+    async def _retrieve(
+        self,
+        request: GenerationRequest,
+    ) -> RetrievalContext:
+
         #
-        # Render prompt
+        # Retrieve documents
         #
 
-        rendered_prompt = await self._prompt_renderer.render(
-            prompt=prompt,
-            variables=PromptVariables(
+        retrieval_context = await self._retrieval_pipeline.retrieve(
+            RetrievalRequest(
                 query=request.query,
-                context=context_window.context,
-                history="",
-            ),
+                top_k=request.top_k,
+                namespace=request.namespace,
+            )
+        )
+
+        return RetrievalContext(
+            results=[
+                _to_context_chunk(result)
+                for result in retrieval_context.results
+            ],
+            total_results=retrieval_context.total_results,
         )
 
+    async def _build_llm_request(
+        self,
+        request: GenerationRequest,
+        retrieval_context: RetrievalContext,
+        prefetch: "_Prefetch",
+        spans: StageSpans,
+        stream: bool,
+    ) -> LLMRequest:
+
+        #
+        # Build context window
+        #
+
+        history = await prefetch.history
+
+        with spans.span("context_window"):
+            context_window = await self._context_window_manager.build(
+                history=history,
+                retrieval_context=retrieval_context,
+                max_context_tokens=request.max_context_tokens,
+                reserved_response_tokens=request.reserved_response_tokens,
+            )
+
+        #
+        # Render prompt (fetched during retrieval)
+        #
+
+        prompt = await prefetch.prompt
+
+        with spans.span("render"):
+            rendered_prompt = await self._prompt_renderer.render(
+                prompt=prompt,
+                variables=PromptVariables(
+                    query=request.query,
+                    context=context_window.context,
+                    history="",
+                ),
+            )
+
         #
         # Build chat messages
         #
 
-        messages = await self._message_builder.build(
-            prompt=rendered_prompt,
-            history=context_window.history,
-        )
+        with spans.span("messages"):
+            messages = await self._message_builder.build(
+                prompt=rendered_prompt,
+                history=context_window.history,
+            )
 
         #
         # Build provider request
         #
 
-        llm_request = LLMRequest(
+        return LLMRequest(
             messages=messages,
             temperature=request.temperature,
             max_tokens=request.max_response_tokens,
+            stream=stream,
         )
 
-        #
-        # Generate
-        #
 
-        llm_response = await self._llm_client.generate(
-            llm_request
-        )
+@dataclass
+class _Prefetch:
+    """
+    Tasks started before retrieval that prompt building waits on.
+    """
 
-        #
-        # Parse
-        #
+    prompt: asyncio.Task[PromptTemplate]
+
+    history: asyncio.Task[list[ChatMessage]]
+
+    def cancel(self) -> None:
+        """
+        Drop whatever is left, e.g. when retrieval failed.
+        """
+
+        for task in (self.prompt, self.history):
+
+            if not task.done():
+                task.cancel()
+
+            elif not task.cancelled():
+                # Mark the error as retrieved; the one that matters
+                # has already been raised.
+                task.exception()
+
+
+def _to_context_chunk(result: RetrievalResult) -> ContextChunk:
+    page_number = result.metadata.get("page_number")
 
-        return await self._response_parser.parse(
-            llm_response
-        )
\ No newline at end of file
+    return ContextChunk(
+        chunk_id=result.chunk_id,
+        document_id=str(result.metadata.get("document_id", "")),
+        content=result.text,
+        score=result.score,
+        page_number=int(page_number) if page_number is not None else None,
+        metadata=dict(result.metadata),
+    )
@@ -0,0 +1,86 @@
+"""
+Per-stage timing spans for one generation request.
+
+Responsibilities:
+- Time awaitables and code blocks against a shared request start.
+- Keep spans that overlap (stages running concurrently) as they are,
+  so the output shows what actually ran in parallel.
+- Log every span as it finishes.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from typing import TypeVar
+
+from loguru import logger
+
+from app.domains.generation.models import TimingSpan
+
+
+ResultT = TypeVar("ResultT")
+
+
+class StageSpans:
+    """
+    Records timing spans relative to the moment it was created.
+    """
+
+    def __init__(self) -> None:
+        self._started_at = time.perf_counter()
+        self._spans: list[TimingSpan] = []
+
+    @contextmanager
+    def span(
+        self,
+        stage: str,
+    ) -> Iterator[None]:
+        """
+        Time the enclosed block, including when it raises.
+        """
+
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self._record(stage, started_at)
+
+    async def measure(
+        self,
+        stage: str,
+        awaitable: Awaitable[ResultT],
+    ) -> ResultT:
+        """
+        Await `awaitable` inside a span. Handy for tasks started with
+        asyncio.create_task().
+        """
+
+        with self.span(stage):
+            return await awaitable
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started_at) * 1000
+
+    def spans(self) -> list[TimingSpan]:
+        return sorted(self._spans, key=lambda span: span.start_ms)
+
+    def _record(
+        self,
+        stage: str,
+        started_at: float,
+    ) -> None:
+        span = TimingSpan(
+            stage=stage,
+            start_ms=(started_at - self._started_at) * 1000,
+            duration_ms=(time.perf_counter() - started_at) * 1000,
+        )
+
+        self._spans.append(span)
+
+        logger.debug(
+            f"Stage '{stage}' took {span.duration_ms:.1f} ms "
+            f"(started at +{span.start_ms:.1f} ms)."
+        )
@@ -0,0 +1,203 @@
+"""
+Parent / child decorator chunker for small-to-big retrieval.
+
+Responsibilities:
+- Wrap another Chunker (normally the TokenAwareChunker).
+- Turn every produced chunk into a PARENT chunk.
+- Split each parent into small, overlapping CHILD chunks with a
+  BaseSplitter (normally a SentenceSplitter sized for children), so
+  children end on sentence or word boundaries. They carry the parent's
+  id in `parent_chunk_id`.
+
+Only children are embedded; parents go to a ParentChunkStore and are
+swapped in for their children at retrieval time.
+
+Parent ids are derived from the document id, the page number, the
+parent text and how many identical parents precede it on that page.
+An unchanged section keeps its id (and its children keep their content
+hash) when a document is re-ingested, while repeated sections
+(disclaimers, templated blocks) get ids of their own instead of
+overwriting each other in the parent store.
+
+Parents are measured by their `token_count` metadata. Larger ones are
+split with the token ids the wrapped chunker hands over through
+chunk_tokenized(), so with a TokenAwareChunker nothing is encoded
+again. Only chunks from a chunker that computed neither are encoded
+here, in one batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from uuid import NAMESPACE_URL, uuid5
+
+from loguru import logger
+
+from app.rag_services.ingestion.interfaces.chunker import Chunker
+from app.rag_services.ingestion.interfaces.token_counter import TokenCounter
+from app.rag_services.ingestion.mappers.chunk_mapper import ChunkMapper
+from app.rag_services.ingestion.splitters.base_splitter import BaseSplitter
+from app.rag_services.ingestion.tokenizers.models import TokenizationResult
+from app.schemas.chunk.chunk import Chunk
+from app.schemas.chunk.enums import ChunkType
+from app.schemas.document import Document
+
+
+class ParentChildChunker(Chunker):
+    """
+    Decorator chunker that emits each chunk as a parent plus its children.
+    """
+
+    def __init__(
+        self,
+        chunker: Chunker,
+        token_counter: TokenCounter,
+        splitter: BaseSplitter,
+        child_chunk_tokens: int = 128,
+    ) -> None:
+        """
+        `splitter` cuts parents larger than `child_chunk_tokens` into
+        children and should produce windows of that size.
+        """
+
+        if child_chunk_tokens < 1:
+            raise ValueError("child_chunk_tokens must be at least 1.")
+
+        self._chunker = chunker
+        self._token_counter = token_counter
+        self._splitter = splitter
+        self._child_chunk_tokens = child_chunk_tokens
+
+    async def chunk(
+        self,
+        document: Document,
+    ) -> list[Chunk]:
+        """
+        Return `[parent, child, child, ..., parent, child, ...]`.
+        """
+
+        tokenized = await self._chunker.chunk_tokenized(document)
+
+        chunks = [chunk for chunk, _ in tokenized]
+        tokenization_of = {
+            position: tokenization
+            for position, (_, tokenization) in enumerate(tokenized)
+            if tokenization is not None
+        }
+
+        # Chunks that may need splitting but came without token ids.
+        missing = [
+            position
+            for position, chunk in enumerate(chunks)
+            if position not in tokenization_of
+            and (
+                chunk.metadata.token_count is None
+                or chunk.metadata.token_count > self._child_chunk_tokens
+            )
+        ]
+
+        if missing:
+            tokenizations = await asyncio.to_thread(
+                self._token_counter.tokenize_batch,
+                [
+                    chunks[position].indexed_text or chunks[position].text
+                    for position in missing
+                ],
+            )
+
+            tokenization_of.update(zip(missing, tokenizations))
+
+        # (page number, text) -> parents seen so far
+        occurrences: Counter[tuple[int | None, str]] = Counter()
+
+        output: list[Chunk] = []
+
+        for position, chunk in enumerate(chunks):
+
+            key = (chunk.metadata.page_number, chunk.text)
+
+            output.extend(
+                self._split_parent(
+                    chunk,
+                    len(output),
+                    tokenization_of.get(position),
+                    occurrences[key],
+                )
+            )
+
+            occurrences[key] += 1
+
+        logger.info(
+            f"Parent/child chunking completed: {len(chunks)} parents, "
+            f"{len(output) - len(chunks)} children."
+        )
+
+        return output
+
+    def _split_parent(
+        self,
+        chunk: Chunk,
+        chunk_index: int,
+        tokenization: TokenizationResult | None,
+        occurrence: int,
+    ) -> list[Chunk]:
+        """
+        `tokenization` may be None when the chunk's `token_count` shows
+        it fits in a single child. `occurrence` counts identical parents
+        earlier on the same page.
+        """
+
+        parent = chunk.model_copy(
+            update={
+                "chunk_id": str(
+                    uuid5(
+                        NAMESPACE_URL,
+                        f"{chunk.document_id}\0"
+                        f"{chunk.metadata.page_number}\0"
+                        f"{occurrence}\0"
+                        f"{chunk.text}",
+                    )
+                ),
+                "chunk_type": ChunkType.PARENT,
+                "parent_chunk_id": None,
+                "metadata": chunk.metadata.model_copy(
+                    update={"chunk_index": chunk_index},
+                ),
+            }
+        )
+
+        # Template the children are copied from.
+        template = parent.model_copy(
+            update={
+                "text": chunk.indexed_text or chunk.text,
+                "chunk_type": ChunkType.CHILD,
+                "parent_chunk_id": parent.chunk_id,
+            }
+        )
+
+        token_count = (
+            chunk.metadata.token_count
+            if chunk.metadata.token_count is not None
+            else tokenization.token_count
+        )
+
+        if token_count <= self._child_chunk_tokens:
+            return [
+                parent,
+                ChunkMapper.from_existing_chunk(
+                    chunk=template,
+                    text=template.text,
+                    chunk_index=chunk_index + 1,
+                    token_count=token_count,
+                ),
+            ]
+
+        return [
+            parent,
+            *self._splitter.split(
+                chunk=template,
+                tokenization=tokenization,
+                chunk_index=chunk_index + 1,
+            ),
+        ]
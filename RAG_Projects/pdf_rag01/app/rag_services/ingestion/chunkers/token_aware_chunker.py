@@ -3,9 +3,15 @@ Token-aware decorator chunker — Phase 2.
 
 Responsibilities:
 - Wrap another Chunker.
-- Tokenize every produced chunk.
-- Populate token_count metadata.
-- Split chunks that exceed max_chunk_tokens using a BaseSplitter.
+- Tokenize every produced chunk, all in one batch.
+- Populate token_count / token_encoding metadata. The counts travel
+  with the chunk into vector metadata, so the context window manager
+  does not tokenize retrieved chunks again.
+- Split chunks that exceed max_chunk_tokens using a BaseSplitter, which
+  reuses the token ids computed here.
+- Hand every chunk's token ids on through chunk_tokenized(); for
+  sub-chunks they are the splitter's slices. Decorators such as the
+  ParentChildChunker split further without encoding again.
 
 Phase 2 changes from Phase 1:
 - Removed ChunkTooLargeError.
@@ -15,12 +21,15 @@ Phase 2 changes from Phase 1:
 
 from __future__ import annotations
 
+import asyncio
+
 from loguru import logger
 
 from app.core.config import get_settings
 from app.rag_services.ingestion.interfaces.chunker import Chunker
 from app.rag_services.ingestion.interfaces.token_counter import TokenCounter
 from app.rag_services.ingestion.splitters.base_splitter import BaseSplitter
+from app.rag_services.ingestion.tokenizers.models import TokenizationResult
 from app.schemas.chunk.chunk import Chunk
 from app.schemas.document import Document
 
@@ -49,20 +58,39 @@ class TokenAwareChunker(Chunker):
         Generate chunks, then split any that exceed the token limit.
         """
 
+        return [
+            chunk
+            for chunk, _ in await self.chunk_tokenized(document)
+        ]
+
+    async def chunk_tokenized(
+        self,
+        document: Document,
+    ) -> list[tuple[Chunk, TokenizationResult]]:
+        """
+        Like chunk(), with the tokenization of every output chunk.
+        """
+
         logger.info(
             f"Running token-aware chunking for '{document.filename}'."
         )
 
         chunks = await self._chunker.chunk(document)
 
-        processed_chunks: list[Chunk] = []
+        # One batch encode for the whole document, off the event loop.
+        tokenizations = await asyncio.to_thread(
+            self._token_counter.tokenize_batch,
+            [chunk.indexed_text or chunk.text for chunk in chunks],
+        )
+
+        processed_chunks: list[tuple[Chunk, TokenizationResult]] = []
 
         chunk_index = 0
 
-        for chunk in chunks:
+        for chunk, tokenization in zip(chunks, tokenizations):
 
             processed_chunks.extend(
-                self._split_chunk(chunk, chunk_index)
+                self._split_chunk(chunk, tokenization, chunk_index)
             )
 
             chunk_index = len(processed_chunks)
@@ -77,20 +105,18 @@ class TokenAwareChunker(Chunker):
     def _split_chunk(
         self,
         chunk: Chunk,
+        tokenization: TokenizationResult,
         chunk_index: int,
-    ) -> list[Chunk]:
+    ) -> list[tuple[Chunk, TokenizationResult]]:
         """
-        Tokenize a chunk and split it if it exceeds the token limit.
+        Split a tokenized chunk if it exceeds the token limit.
 
         Returns a list containing either:
         - The original chunk (with token_count populated), or
-        - Multiple sub-chunks produced by the splitter.
+        - Multiple sub-chunks produced by the splitter,
+        each with its tokenization.
         """
 
-        text = chunk.indexed_text or chunk.text
-
-        tokenization = self._token_counter.tokenize(text)
-
         logger.debug(
             f"Chunk '{chunk.chunk_id}' "
             f"contains {tokenization.token_count} tokens."
@@ -98,19 +124,20 @@ class TokenAwareChunker(Chunker):
 
         settings = self._settings
 
-        if tokenization.token_count <= settings.max_chunk_tokens:
-            # Chunk is within limit — just populate token_count metadata.
-            return [
-                chunk.model_copy(
+        chunk = chunk.model_copy(
+            update={
+                "metadata": chunk.metadata.model_copy(
                     update={
-                        "metadata": chunk.metadata.model_copy(
-                            update={
-                                "token_count": tokenization.token_count,
-                            }
-                        )
+                        "token_count": tokenization.token_count,
+                        "token_encoding": self._token_counter.encoding_name,
                     }
                 )
-            ]
+            }
+        )
+
+        if tokenization.token_count <= settings.max_chunk_tokens:
+            # Chunk is within limit — metadata is all it needs.
+            return [(chunk, tokenization)]
 
         logger.warning(
             f"Chunk '{chunk.chunk_id}' exceeds limit "
@@ -118,7 +145,7 @@ class TokenAwareChunker(Chunker):
             f"{settings.max_chunk_tokens} tokens). Splitting."
         )
 
-        return self._splitter.split(
+        return self._splitter.split_tokenized(
             chunk=chunk,
             tokenization=tokenization,
             chunk_index=chunk_index,
@@ -0,0 +1,263 @@
+"""
+Near-duplicate chunk detection.
+
+Responsibilities:
+- Sign every chunk's indexed text with a MinHash signature over word
+  shingles.
+- Find an earlier chunk with an estimated Jaccard similarity of at
+  least `threshold`, using LSH bands instead of pairwise comparison.
+- Collapse near-duplicates into the first chunk seen, keeping the
+  duplicates' chunk ids and page numbers in its metadata.
+
+Indexing: the signature is cut into bands; chunks are compared only
+when at least one band is identical. With the default 16 bands of 4
+rows, a pair at 0.85 similarity shares a band with probability
+> 0.9999, while unrelated chunks almost never do. Each chunk costs a
+few dict lookups, so detection scales linearly with the number of
+chunks.
+
+The detector keeps its index across calls, so page windows of one
+document are checked against each other. A duplicate of a chunk
+returned by an earlier call is dropped, but that chunk's metadata can
+no longer be updated.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+import numpy as np
+from loguru import logger
+
+from app.schemas.chunk.chunk import Chunk
+from app.schemas.chunk.enums import ChunkType
+
+
+# Odd multipliers that mix the word hashes of a shingle.
+_SHINGLE_MIX = (
+    np.uint64(0x9E3779B97F4A7C15),
+    np.uint64(0xC2B2AE3D27D4EB4F),
+    np.uint64(0x165667B19E3779F9),
+)
+
+_UPPER_HALF = np.uint64(32)
+
+
+class NearDuplicateDetector:
+    """
+    Drops chunks whose indexed text nearly repeats an earlier chunk.
+
+    Parent chunks are never deduplicated (their children point at
+    them), and chunks of different types are never merged. Chunks with
+    fewer than `min_words` words pass through: a handful of shingles
+    says little about similarity.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        bands: int = 16,
+        rows: int = 4,
+        min_words: int = 8,
+        shingle_size: int = 3,
+        seed: int = 0,
+    ) -> None:
+
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1].")
+
+        if shingle_size > len(_SHINGLE_MIX):
+            raise ValueError(
+                f"shingle_size must be at most {len(_SHINGLE_MIX)}."
+            )
+
+        self._threshold = threshold
+        self._bands = bands
+        self._rows = rows
+        self._min_words = max(min_words, shingle_size)
+        self._shingle_size = shingle_size
+
+        # One (xor, multiply) hash function per signature row. Odd
+        # multipliers keep every function a bijection on 64 bits.
+        rng = np.random.default_rng(seed)
+        permutations = bands * rows
+
+        self._xors = rng.integers(
+            0, 2**63, size=permutations, dtype=np.uint64,
+        )
+        self._multipliers = rng.integers(
+            0, 2**63, size=permutations, dtype=np.uint64,
+        ) | np.uint64(1)
+
+        # (chunk type, band number, band bytes) -> canonical numbers
+        self._index: dict[tuple[ChunkType, int, bytes], list[int]] = (
+            defaultdict(list)
+        )
+
+        self._signatures: list[np.ndarray] = []
+
+        self.duplicate_count = 0
+
+    def select_unique(
+        self,
+        chunks: list[Chunk],
+    ) -> list[Chunk]:
+        """
+        Return `chunks` without near-duplicates, in order.
+        """
+
+        kept: list[Chunk] = []
+
+        # canonical number -> position in `kept`, for this call only
+        positions: dict[int, int] = {}
+
+        # position in `kept` -> its duplicates
+        duplicates: dict[int, list[Chunk]] = defaultdict(list)
+
+        for chunk in chunks:
+
+            signature = (
+                self._signature(chunk.indexed_text or chunk.text)
+                if chunk.chunk_type is not ChunkType.PARENT
+                else None
+            )
+
+            if signature is None:
+                kept.append(chunk)
+                continue
+
+            keys = self._band_keys(signature, chunk.chunk_type)
+            canonical = self._find(signature, keys)
+
+            if canonical is None:
+                positions[self._add(signature, keys)] = len(kept)
+                kept.append(chunk)
+                continue
+
+            self.duplicate_count += 1
+
+            if canonical in positions:
+                duplicates[positions[canonical]].append(chunk)
+
+        for position, chunk_duplicates in duplicates.items():
+            kept[position] = _with_duplicates(
+                kept[position],
+                chunk_duplicates,
+            )
+
+        if len(kept) < len(chunks):
+            logger.info(
+                f"Collapsed {len(chunks) - len(kept)} near-duplicate "
+                f"chunks ({len(chunks)} -> {len(kept)})."
+            )
+
+        return kept
+
+    def _signature(self, text: str) -> np.ndarray | None:
+        words = text.lower().split()
+
+        if len(words) < self._min_words:
+            return None
+
+        # Python's string hash is per process, which is all a single
+        # ingestion run needs.
+        word_hashes = np.array(
+            list(map(hash, words)),
+            dtype=np.int64,
+        ).view(np.uint64)
+
+        shingles = len(words) - self._shingle_size + 1
+        hashes = np.zeros(shingles, dtype=np.uint64)
+
+        for offset in range(self._shingle_size):
+            hashes ^= (
+                word_hashes[offset:offset + shingles]
+                * _SHINGLE_MIX[offset]
+            )
+
+        # Minimum of every hash function over the shingle set. The upper
+        # half of the product is the well-mixed part; 32 bits is plenty
+        # for equality tests and halves the memory per signature.
+        return (
+            (
+                (hashes[:, None] ^ self._xors) * self._multipliers
+            ) >> _UPPER_HALF
+        ).min(axis=0).astype(np.uint32)
+
+    def _band_keys(
+        self,
+        signature: np.ndarray,
+        chunk_type: ChunkType,
+    ) -> list[tuple[ChunkType, int, bytes]]:
+        return [
+            (
+                chunk_type,
+                band,
+                signature[band * self._rows:(band + 1) * self._rows].tobytes(),
+            )
+            for band in range(self._bands)
+        ]
+
+    def _find(
+        self,
+        signature: np.ndarray,
+        keys: list[tuple[ChunkType, int, bytes]],
+    ) -> int | None:
+        checked: set[int] = set()
+
+        for key in keys:
+
+            for canonical in self._index.get(key, ()):
+
+                if canonical in checked:
+                    continue
+
+                checked.add(canonical)
+
+                # Share of equal rows estimates the Jaccard similarity.
+                similarity = float(
+                    np.mean(signature == self._signatures[canonical])
+                )
+
+                if similarity >= self._threshold:
+                    return canonical
+
+        return None
+
+    def _add(
+        self,
+        signature: np.ndarray,
+        keys: list[tuple[ChunkType, int, bytes]],
+    ) -> int:
+        canonical = len(self._signatures)
+        self._signatures.append(signature)
+
+        for key in keys:
+            self._index[key].append(canonical)
+
+        return canonical
+
+
+def _with_duplicates(
+    chunk: Chunk,
+    duplicates: list[Chunk],
+) -> Chunk:
+    return chunk.model_copy(
+        update={
+            "metadata": chunk.metadata.model_copy(
+                update={
+                    "duplicate_chunk_ids": [
+                        duplicate.chunk_id
+                        for duplicate in duplicates
+                    ],
+                    "duplicate_page_numbers": sorted(
+                        {
+                            duplicate.metadata.page_number
+                            for duplicate in duplicates
+                            if duplicate.metadata.page_number is not None
+                        }
+                    ),
+                }
+            ),
+        }
+    )
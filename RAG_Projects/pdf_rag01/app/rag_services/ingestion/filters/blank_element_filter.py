@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from loguru import logger
+from app.rag_services.ingestion.interfaces.element_filter import (
+    ElementPredicateFilter,
+)
+from app.schemas.document import DocumentElement
 
-from app.rag_services.ingestion.interfaces.element_filter import ElementFilter
-from app.schemas.document import Document
 
-
-class BlankElementFilter(ElementFilter):
+class BlankElementFilter(ElementPredicateFilter):
     """
     Removes document elements that contain no meaningful text.
 
@@ -19,23 +19,9 @@ class BlankElementFilter(ElementFilter):
 
     name = "blank_element_filter"
 
-    async def filter(
+    def keep(
         self,
-        document: Document,
-    ) -> Document:
-        original_count = len(document.elements)
-
-        document.elements = [
-            element
-            for element in document.elements
-            if element.text.strip()
-        ]
-
-        removed = original_count - len(document.elements)
-
-        logger.debug(
-            f"{self.name}: removed {removed} blank elements "
-            f"({original_count} -> {len(document.elements)})"
-        )
-
-        return document
\ No newline at end of file
+        element: DocumentElement,
+    ) -> bool:
+        # Same as `text.strip() != ""`, without copying the text.
+        return bool(element.text) and not element.text.isspace()
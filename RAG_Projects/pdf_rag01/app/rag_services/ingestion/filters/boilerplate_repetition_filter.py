@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from app.rag_services.ingestion.interfaces.element_filter import ElementFilter
+from app.schemas.document import Document, DocumentElement, DocumentElementType
+
+
+_DIGITS = re.compile(r"\d+")
+
+
+@dataclass
+class _PageCounts:
+    """
+    Fingerprint -> [pages it appeared on, last page it appeared on].
+    """
+
+    counts: dict[int, list[int]] = field(default_factory=dict)
+
+    last_page: int = 0
+
+
+class BoilerplateRepetitionFilter(ElementFilter):
+    """
+    Removes short elements that repeat across many pages: running
+    heads, watermarks, copyright lines and other boilerplate that
+    `unstructured` does not label HEADER/FOOTER.
+
+    Only the first and last `edge_slots` elements of a page are
+    candidates, since that is where boilerplate sits. Their text is
+    normalized (case, whitespace, digits masked so "Chapter 3 · 47"
+    matches "Chapter 3 · 48") and fingerprinted. One pass counts the
+    pages each fingerprint appears on; elements whose fingerprint
+    reaches the threshold are dropped.
+
+    TITLE elements are never counted or dropped: headings such as
+    "Chapter 1" ... "Chapter 10" or a "Summary" title on every chapter
+    are structure, and would otherwise collapse into one fingerprint.
+
+    The threshold is `min_pages`, or `min_page_fraction` of the page
+    count when that is higher. Counts are kept per document id, so page
+    windows of one document (streaming ingestion) add up; in a window,
+    only fingerprints already over the threshold are dropped.
+
+    Expects elements in page order. Elements longer than `max_chars`
+    are never fingerprinted: boilerplate is short, and repeated long
+    passages are more likely real content.
+    """
+
+    name = "boilerplate_repetition_filter"
+
+    def __init__(
+        self,
+        min_pages: int = 5,
+        min_page_fraction: float = 0.02,
+        max_chars: int = 160,
+        max_documents: int = 16,
+        edge_slots: int = 2,
+    ) -> None:
+
+        if min_pages < 2:
+            raise ValueError("min_pages must be at least 2.")
+
+        if edge_slots < 1:
+            raise ValueError("edge_slots must be at least 1.")
+
+        self._min_pages = min_pages
+        self._edge_slots = edge_slots
+        self._min_page_fraction = min_page_fraction
+        self._max_chars = max_chars
+        self._max_documents = max_documents
+
+        # document id -> counts, least recently used first
+        self._documents: OrderedDict[str, _PageCounts] = OrderedDict()
+
+    async def filter(self, document: Document) -> Document:
+        original_count = len(document.elements)
+
+        page_counts = self._page_counts(document.document_id)
+
+        if document.elements and (
+            document.elements[0].page_number <= page_counts.last_page
+        ):
+            # Not the next window: the document is being read again.
+            page_counts = self._documents[document.document_id] = _PageCounts()
+
+        counts = page_counts.counts
+
+        fingerprints = self._fingerprints(document.elements)
+
+        for element, fingerprint in zip(document.elements, fingerprints):
+
+            if fingerprint is None:
+                continue
+
+            page_number = element.page_number
+            page_counts.last_page = max(page_counts.last_page, page_number)
+
+            entry = counts.get(fingerprint)
+
+            if entry is None:
+                counts[fingerprint] = [1, page_number]
+
+            elif entry[1] != page_number:
+                entry[0] += 1
+                entry[1] = page_number
+
+        threshold = max(
+            self._min_pages,
+            math.ceil(
+                self._min_page_fraction
+                * (document.metadata.page_count or page_counts.last_page)
+            ),
+        )
+
+        document.elements = [
+            element
+            for element, fingerprint in zip(document.elements, fingerprints)
+            if fingerprint is None or counts[fingerprint][0] < threshold
+        ]
+
+        removed = original_count - len(document.elements)
+        logger.debug(
+            f"{self.name}: removed {removed} repeated elements "
+            f"(threshold {threshold} pages, "
+            f"{original_count} -> {len(document.elements)})"
+        )
+        return document
+
+    def _fingerprints(
+        self,
+        elements: list[DocumentElement],
+    ) -> list[int | None]:
+        """
+        One fingerprint per element; None for elements that are not
+        candidates.
+        """
+
+        page_sizes = Counter(element.page_number for element in elements)
+
+        fingerprints: list[int | None] = []
+        page_number = None
+        slot = 0
+
+        for element in elements:
+
+            if element.page_number != page_number:
+                page_number = element.page_number
+                slot = 0
+
+            from_start = slot
+            from_end = page_sizes[page_number] - slot - 1
+            slot += 1
+
+            if (
+                element.element_type is DocumentElementType.TITLE
+                or min(from_start, from_end) >= self._edge_slots
+            ):
+                fingerprints.append(None)
+                continue
+
+            fingerprints.append(self._fingerprint(element.text))
+
+        return fingerprints
+
+    def _fingerprint(self, text: str) -> int | None:
+        if len(text) > self._max_chars:
+            return None
+
+        normalized = " ".join(
+            _DIGITS.sub("#", text.lower()).split()
+        )
+
+        if not normalized:
+            return None
+
+        # In-process only, so the built-in string hash is enough.
+        return hash(normalized)
+
+    def _page_counts(self, document_id: str) -> _PageCounts:
+        page_counts = self._documents.get(document_id)
+
+        if page_counts is None:
+            page_counts = self._documents[document_id] = _PageCounts()
+
+            while len(self._documents) > self._max_documents:
+                self._documents.popitem(last=False)
+
+        self._documents.move_to_end(document_id)
+
+        return page_counts
@@ -1,15 +1,37 @@
 from __future__ import annotations
 
+from collections import Counter
+
 from loguru import logger
 
-from app.rag_services.ingestion.interfaces.element_filter import ElementFilter
+from app.rag_services.ingestion.interfaces.element_filter import (
+    ElementFilter,
+    ElementPredicateFilter,
+    PageFilter,
+)
 from app.rag_services.ingestion.interfaces.document_filter_pipeline import DocumentFilterPipeline
-from app.schemas.document import Document
+from app.schemas.document import (
+    Document,
+    DocumentElement,
+    PageMap,
+)
 
 
 class DefaultDocumentFilterPipeline(DocumentFilterPipeline):
     """
-    Executes document filters sequentially.
+    Executes document filters in one fused pass.
+
+    1. One pass over the elements evaluates every ElementPredicateFilter
+       and builds the page index of the survivors.
+    2. Every PageFilter judges that same page index; the pages they flag
+       are dropped together.
+    3. Filters that implement neither run afterwards, in list order, on
+       the filtered document.
+
+    Predicates therefore always run before page decisions, whatever the
+    list order. A dropped element is counted against the first filter
+    (in list order) that rejected it; the counts are logged and added to
+    the caller's `drop_counts`.
     """
 
     def __init__(
@@ -18,35 +40,137 @@ class DefaultDocumentFilterPipeline(DocumentFilterPipeline):
     ) -> None:
         self._filters = filters
 
+        self._predicate_filters = [
+            element_filter
+            for element_filter in filters
+            if isinstance(element_filter, ElementPredicateFilter)
+        ]
+
+        self._page_filters = [
+            element_filter
+            for element_filter in filters
+            if isinstance(element_filter, PageFilter)
+        ]
+
+        self._document_filters = [
+            element_filter
+            for element_filter in filters
+            if not isinstance(
+                element_filter,
+                (ElementPredicateFilter, PageFilter),
+            )
+        ]
+
     async def filter(
         self,
         document: Document,
+        drop_counts: Counter[str] | None = None,
     ) -> Document:
 
         logger.info(
             f"Running {len(self._filters)} document filters."
         )
 
-        for element_filter in self._filters:
+        original_count = len(document.elements)
 
-            before = len(document.elements)
+        if drop_counts is None:
+            drop_counts = Counter()
 
-            logger.debug(
-                f"Running filter: {element_filter.name}"
-            )
+        # This call's counts; added to `drop_counts` at the end.
+        counts = {
+            element_filter.name: 0
+            for element_filter in self._filters
+        }
+
+        #
+        # Element predicates + page index, one pass
+        #
+
+        survivors, pages = self._apply_predicates(
+            document.elements,
+            counts,
+        )
+
+        #
+        # Page decisions over the shared index
+        #
+
+        dropped_pages: set[int] = set()
+
+        for page_filter in self._page_filters:
+
+            for page_number in page_filter.drop_pages(pages) - dropped_pages:
+                dropped_pages.add(page_number)
+                counts[page_filter.name] += len(
+                    pages.get(page_number, ())
+                )
+
+        document.elements = (
+            [
+                element
+                for element in survivors
+                if element.page_number not in dropped_pages
+            ]
+            if dropped_pages
+            else survivors
+        )
+
+        #
+        # Whole-document filters
+        #
+
+        for element_filter in self._document_filters:
+
+            before = len(document.elements)
 
             document = await element_filter.filter(document)
 
-            after = len(document.elements)
+            counts[element_filter.name] += (
+                before - len(document.elements)
+            )
+
+        drop_counts.update(counts)
 
+        for name, dropped in counts.items():
             logger.debug(
-                f"{element_filter.name}: "
-                f"{before} -> {after}"
+                f"{name}: removed {dropped} elements"
             )
 
         logger.info(
-            f"Document filtering completed. "
-            f"Remaining elements: {len(document.elements)}"
+            f"Document filtering completed "
+            f"({original_count} -> {len(document.elements)} elements, "
+            f"{len(dropped_pages)} pages dropped)."
         )
 
-        return document
\ No newline at end of file
+        return document
+
+    def _apply_predicates(
+        self,
+        elements: list[DocumentElement],
+        drop_counts: dict[str, int],
+    ) -> tuple[list[DocumentElement], PageMap]:
+        """
+        Return the elements every predicate keeps, and the same elements
+        grouped by page (pages sorted, element order preserved).
+        """
+
+        predicates = [
+            (element_filter.name, element_filter.keep)
+            for element_filter in self._predicate_filters
+        ]
+
+        survivors: list[DocumentElement] = []
+        pages: PageMap = {}
+
+        for element in elements:
+
+            for name, keep in predicates:
+                if not keep(element):
+                    drop_counts[name] += 1
+                    break
+
+            else:
+                survivors.append(element)
+                pages.setdefault(element.page_number, []).append(element)
+
+        return survivors, dict(sorted(pages.items()))
@@ -4,10 +4,10 @@ import re
 
 from loguru import logger
 
-from app.rag_services.ingestion.interfaces.element_filter import ElementFilter
-from app.schemas.document import Document
+from app.rag_services.ingestion.interfaces.element_filter import PageFilter
+from app.schemas.document import PageMap
 
-class FrontMatterFilter(ElementFilter):
+class FrontMatterFilter(PageFilter):
     """
     Drops copyright/half-title/dedication-style pages that precede real
     content. Deliberately conservative: only removes a page if it has a
@@ -33,11 +33,10 @@ class FrontMatterFilter(ElementFilter):
         self._sparse_word_limit = sparse_word_limit
         self._sparse_page_limit = sparse_page_limit
 
-    async def filter(self, document: Document) -> Document:
-        original_count = len(document.elements)
-        drop_pages: set[int] = set()
+    def drop_pages(self, pages: PageMap) -> set[int]:
+        front_matter_pages: set[int] = set()
 
-        for page_number, elements in document.pages.items():
+        for page_number, elements in pages.items():
             if page_number > self._max_scan_pages:
                 break
 
@@ -53,19 +52,10 @@ class FrontMatterFilter(ElementFilter):
             )
 
             if has_keyword or is_sparse_and_early:
-                drop_pages.add(page_number)
+                front_matter_pages.add(page_number)
                 logger.debug(
                     f"{self.name}: page {page_number} flagged as front matter "
                     f"(keyword={has_keyword}, words={word_count})"
                 )
 
-        document.elements = [
-            e for e in document.elements if e.page_number not in drop_pages
-        ]
-
-        removed = original_count - len(document.elements)
-        logger.debug(
-            f"{self.name}: removed {removed} elements across {len(drop_pages)} pages "
-            f"({original_count} -> {len(document.elements)})"
-        )
-        return document
\ No newline at end of file
+        return front_matter_pages
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import re
 
-from loguru import logger
+from app.rag_services.ingestion.interfaces.element_filter import (
+    ElementPredicateFilter,
+)
+from app.schemas.document import DocumentElement
 
-from app.rag_services.ingestion.interfaces.element_filter import ElementFilter
-from app.schemas.document import Document
 
-
-class PageNumberFilter(ElementFilter):
+class PageNumberFilter(ElementPredicateFilter):
     """
     Removes standalone page number elements.
 
@@ -50,30 +50,18 @@ class PageNumberFilter(ElementFilter):
         cls,
         text: str,
     ) -> bool:
-        return bool(
-            cls._PAGE_NUMBER_PATTERN.fullmatch(
-                text.strip()
-            )
+        text = text.strip()
+
+        # Every pattern starts with a digit, "-" or "Page"; checking the
+        # first character skips the regex for almost all body text.
+        return (
+            bool(text)
+            and (text[0].isdigit() or text[0] in "-Pp")
+            and cls._PAGE_NUMBER_PATTERN.fullmatch(text) is not None
         )
-    
-    async def filter(
-        self,
-        document: Document,
-    ) -> Document:
-
-        original_count = len(document.elements)
-
-        document.elements = [
-            element
-            for element in document.elements
-            if not self._is_page_number(element.text)
-        ]
-
-        removed = original_count - len(document.elements)
 
-        logger.debug(
-            f"{self.name}: removed {removed} page number elements "
-            f"({original_count} -> {len(document.elements)})"
-        )
-
-        return document
\ No newline at end of file
+    def keep(
+        self,
+        element: DocumentElement,
+    ) -> bool:
+        return not self._is_page_number(element.text)
@@ -4,11 +4,11 @@ import re
 
 from loguru import logger
 
-from app.rag_services.ingestion.interfaces.element_filter import ElementFilter
-from app.schemas.document import Document
+from app.rag_services.ingestion.interfaces.element_filter import PageFilter
+from app.schemas.document import PageMap
 
 
-class TableOfContentsFilter(ElementFilter):
+class TableOfContentsFilter(PageFilter):
     """
     Drops entire pages that look structurally like a Table of Contents.
 
@@ -47,11 +47,10 @@ class TableOfContentsFilter(ElementFilter):
         self._score_threshold = score_threshold
         self._min_entries = min_entries
 
-    async def filter(self, document: Document) -> Document:
-        original_count = len(document.elements)
+    def drop_pages(self, pages: PageMap) -> set[int]:
         toc_pages: set[int] = set()
 
-        for page_number, elements in document.pages.items():
+        for page_number, elements in pages.items():
             if page_number > self._max_scan_pages:
                 break
 
@@ -77,13 +76,4 @@ class TableOfContentsFilter(ElementFilter):
                     f"(entries={entry_hits}/{len(lines)}, heading={has_heading})"
                 )
 
-        document.elements = [
-            e for e in document.elements if e.page_number not in toc_pages
-        ]
-
-        removed = original_count - len(document.elements)
-        logger.debug(
-            f"{self.name}: removed {removed} elements across {len(toc_pages)} pages "
-            f"({original_count} -> {len(document.elements)})"
-        )
-        return document
\ No newline at end of file
+        return toc_pages
@@ -4,6 +4,7 @@ Base interface for all chunking strategies.
 
 from abc import ABC, abstractmethod
 
+from app.rag_services.ingestion.tokenizers.models import TokenizationResult
 from app.schemas.document import Document
 from app.schemas.chunk.chunk import Chunk
 
@@ -27,4 +28,24 @@ class Chunker(ABC):
         Returns:
             List of chunks.
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    async def chunk_tokenized(
+        self,
+        document: Document,
+    ) -> list[tuple[Chunk, TokenizationResult | None]]:
+        """
+        Split a document into chunks, each paired with the tokenization
+        of its `indexed_text or text` when the chunker computed one.
+        Decorators use it so they do not encode chunks again.
+
+        Args:
+            document: Preprocessed document.
+
+        Returns:
+            List of (chunk, tokenization) pairs.
+        """
+        return [
+            (chunk, None)
+            for chunk in await self.chunk(document)
+        ]
\ No newline at end of file
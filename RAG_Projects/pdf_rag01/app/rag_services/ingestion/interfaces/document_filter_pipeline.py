@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import Counter
 
 from app.schemas.document import Document
 
@@ -9,5 +10,11 @@ class DocumentFilterPipeline(ABC):
     async def filter(
         self,
         document: Document,
+        drop_counts: Counter[str] | None = None,
     ) -> Document:
+        """
+        Filter the document's elements. When `drop_counts` is given, the
+        elements each filter removed are added to it, so page windows
+        of one document can be totalled.
+        """
         raise NotImplementedError
\ No newline at end of file
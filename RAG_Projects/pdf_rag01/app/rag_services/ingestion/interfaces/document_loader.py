@@ -3,6 +3,7 @@ Base interface for document loaders.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 from app.schemas.document import Document
@@ -20,4 +21,23 @@ class DocumentLoader(ABC):
     ) -> Document:
         """
         Load a document from disk.
-        """
\ No newline at end of file
+        """
+
+
+class StreamingDocumentLoader(DocumentLoader):
+    """
+    Document loader that can also yield a document in page windows.
+    """
+
+    @abstractmethod
+    def stream(
+        self,
+        file_path: Path,
+        pages_per_window: int,
+    ) -> AsyncIterator[Document]:
+        """
+        Yield consecutive page windows of a document.
+
+        Every yielded Document shares the same document_id and metadata
+        and contains only the elements of its page window.
+        """
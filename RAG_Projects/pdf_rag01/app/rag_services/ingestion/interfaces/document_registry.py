@@ -0,0 +1,45 @@
+"""
+Base interface for document registries.
+"""
+
+from abc import ABC, abstractmethod
+
+from app.rag_services.ingestion.registry.models import DocumentRecord
+
+
+class DocumentRegistry(ABC):
+    """
+    Tracks ingested documents by checksum and document id.
+    """
+
+    @abstractmethod
+    async def get_by_checksum(
+        self,
+        checksum: str,
+    ) -> DocumentRecord | None:
+        """
+        Return the document whose file has exactly this checksum.
+        """
+
+    @abstractmethod
+    async def get(
+        self,
+        document_id: str,
+    ) -> DocumentRecord | None:
+        """
+        Return the document with this id.
+        """
+
+    @abstractmethod
+    async def save(
+        self,
+        record: DocumentRecord,
+    ) -> None:
+        """
+        Insert or replace a document and its chunk hashes.
+        """
+
+    def close(self) -> None:
+        """
+        Release resources held by the registry.
+        """
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from app.schemas.document import Document
+from loguru import logger
+
+from app.schemas.document import (
+    Document,
+    DocumentElement,
+    PageMap,
+)
 
 
 class ElementFilter(ABC):
@@ -33,4 +39,73 @@ class ElementFilter(ABC):
         Returns:
             The filtered document.
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+class ElementPredicateFilter(ElementFilter):
+    """
+    A filter that decides each element on its own.
+
+    DefaultDocumentFilterPipeline fuses these: every predicate is
+    evaluated in one pass over the elements.
+    """
+
+    @abstractmethod
+    def keep(self, element: DocumentElement) -> bool:
+        """
+        Return False to drop `element`.
+        """
+        raise NotImplementedError
+
+    async def filter(self, document: Document) -> Document:
+        original_count = len(document.elements)
+
+        document.elements = [
+            element
+            for element in document.elements
+            if self.keep(element)
+        ]
+
+        logger.debug(
+            f"{self.name}: removed "
+            f"{original_count - len(document.elements)} elements "
+            f"({original_count} -> {len(document.elements)})"
+        )
+
+        return document
+
+
+class PageFilter(ElementFilter):
+    """
+    A filter that drops whole pages, each judged by its own elements.
+
+    DefaultDocumentFilterPipeline hands every PageFilter the same page
+    index, built once from the elements left by the predicate filters.
+    """
+
+    @abstractmethod
+    def drop_pages(self, pages: PageMap) -> set[int]:
+        """
+        Return the page numbers to drop. `pages` is sorted by page
+        number and must not be modified.
+        """
+        raise NotImplementedError
+
+    async def filter(self, document: Document) -> Document:
+        original_count = len(document.elements)
+
+        dropped = self.drop_pages(document.pages)
+
+        document.elements = [
+            element
+            for element in document.elements
+            if element.page_number not in dropped
+        ]
+
+        logger.debug(
+            f"{self.name}: removed "
+            f"{original_count - len(document.elements)} elements "
+            f"across {len(dropped)} pages "
+            f"({original_count} -> {len(document.elements)})"
+        )
+
+        return document
@@ -0,0 +1,44 @@
+"""
+Base interface for ingestion job stores.
+"""
+
+from abc import ABC, abstractmethod
+
+from app.rag_services.ingestion.jobs.models import IngestionJob
+
+
+class JobStore(ABC):
+    """
+    Persists ingestion jobs and their status.
+    """
+
+    @abstractmethod
+    async def save(
+        self,
+        job: IngestionJob,
+    ) -> None:
+        """
+        Insert or replace a job.
+        """
+
+    @abstractmethod
+    async def get(
+        self,
+        job_id: str,
+    ) -> IngestionJob | None:
+        """
+        Return a job by id, or None if it is unknown.
+        """
+
+    @abstractmethod
+    async def list_unfinished(self) -> list[IngestionJob]:
+        """
+        Return queued and running jobs, oldest first.
+
+        Used to resume work after a restart.
+        """
+
+    def close(self) -> None:
+        """
+        Release resources held by the store.
+        """
@@ -0,0 +1,46 @@
+"""
+Base interface for parent chunk stores.
+"""
+
+from abc import ABC, abstractmethod
+
+from app.schemas.chunk.chunk import Chunk
+
+
+class ParentChunkStore(ABC):
+    """
+    Key-value store for parent chunks that are not embedded.
+    """
+
+    @abstractmethod
+    async def save_many(
+        self,
+        chunks: list[Chunk],
+    ) -> None:
+        """
+        Insert or replace parent chunks by chunk id.
+        """
+
+    @abstractmethod
+    async def get_many(
+        self,
+        chunk_ids: list[str],
+    ) -> dict[str, Chunk]:
+        """
+        Return the stored chunks for the given ids. Unknown ids are
+        left out.
+        """
+
+    @abstractmethod
+    async def delete_many(
+        self,
+        chunk_ids: list[str],
+    ) -> None:
+        """
+        Delete parent chunks by id. Unknown ids are ignored.
+        """
+
+    def close(self) -> None:
+        """
+        Release resources held by the store.
+        """
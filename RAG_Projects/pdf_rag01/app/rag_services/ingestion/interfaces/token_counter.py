@@ -28,6 +28,56 @@ class TokenCounter(ABC):
         """
         raise NotImplementedError
 
+    def tokenize_batch(
+        self,
+        texts: list[str],
+    ) -> list[TokenizationResult]:
+        """
+        Tokenize several texts. Implementations with a native batch
+        encoder should override this.
+
+        Args:
+            texts: Input texts.
+
+        Returns:
+            One TokenizationResult per text, in order.
+        """
+        return [self.tokenize(text) for text in texts]
+
+    @property
+    def encoding_name(self) -> str | None:
+        """
+        Name of the encoding the counts belong to, if known. Stored with
+        the counts so they are only reused with the same encoding.
+        """
+        return None
+
+    def decode_with_offsets(
+        self,
+        token_ids: list[int],
+    ) -> tuple[str, list[int]]:
+        """
+        Decode token ids, with the character offset at which each token
+        starts. The default decodes token by token; implementations
+        whose tokens can end inside a character should override this.
+
+        Args:
+            token_ids: List of token ids.
+
+        Returns:
+            Decoded string and one offset per token.
+        """
+        parts = [self.decode([token_id]) for token_id in token_ids]
+
+        offsets = []
+        length = 0
+
+        for part in parts:
+            offsets.append(length)
+            length += len(part)
+
+        return "".join(parts), offsets
+
     @abstractmethod
     def decode(
         self,
@@ -0,0 +1,56 @@
+"""
+In-process job store.
+
+Jobs are lost on restart. Finished jobs beyond `max_finished_jobs` are
+evicted oldest first.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from app.rag_services.ingestion.interfaces.job_store import JobStore
+from app.rag_services.ingestion.jobs.models import IngestionJob
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Dictionary-backed job store.
+    """
+
+    def __init__(
+        self,
+        max_finished_jobs: int = 1_000,
+    ) -> None:
+        self._jobs: OrderedDict[str, IngestionJob] = OrderedDict()
+        self._max_finished_jobs = max_finished_jobs
+
+    async def save(
+        self,
+        job: IngestionJob,
+    ) -> None:
+        self._jobs[job.job_id] = job
+        self._evict()
+
+    async def get(
+        self,
+        job_id: str,
+    ) -> IngestionJob | None:
+        return self._jobs.get(job_id)
+
+    async def list_unfinished(self) -> list[IngestionJob]:
+        return [
+            job
+            for job in self._jobs.values()
+            if not job.status.is_finished
+        ]
+
+    def _evict(self) -> None:
+        finished = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status.is_finished
+        ]
+
+        for job_id in finished[:max(0, len(finished) - self._max_finished_jobs)]:
+            del self._jobs[job_id]
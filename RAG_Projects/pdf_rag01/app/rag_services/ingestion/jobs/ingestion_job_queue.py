@@ -0,0 +1,243 @@
+"""
+Background ingestion job queue.
+
+Responsibilities:
+- Accept uploaded files as jobs and return immediately.
+- Run the ingestion pipeline on a fixed number of worker tasks.
+- Track live progress (stage, chunks embedded, vectors upserted).
+- Persist status transitions through a JobStore, and re-queue
+  unfinished jobs on start when the store is durable.
+
+Live progress is kept in memory. Only status transitions are written
+to the store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+from uuid import uuid4
+
+from loguru import logger
+
+from app.rag_services.ingestion.interfaces.job_store import JobStore
+from app.rag_services.ingestion.jobs.models import IngestionJob, JobStatus
+from app.rag_services.ingestion.models.ingestion_progress import (
+    IngestionProgress,
+    IngestionStage,
+)
+from app.rag_services.ingestion.pipeline.document_ingestion_pipeline import (
+    DocumentIngestionPipeline,
+)
+from app.rag_services.ingestion.pipeline.streaming_ingestion_pipeline import (
+    StreamingDocumentIngestionPipeline,
+)
+
+
+PipelineFactory = Callable[
+    [],
+    DocumentIngestionPipeline | StreamingDocumentIngestionPipeline,
+]
+
+
+class IngestionJobQueue:
+    """
+    In-process job queue with a pool of ingestion workers.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        pipeline_factory: PipelineFactory,
+        concurrency: int = 2,
+    ) -> None:
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        self._store = store
+        self._pipeline_factory = pipeline_factory
+        self._concurrency = concurrency
+
+        self._queue: asyncio.Queue[IngestionJob] = asyncio.Queue()
+        self._running: dict[str, IngestionJob] = {}
+        self._workers: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """
+        Re-queue unfinished jobs and start the workers.
+        """
+
+        for job in await self._store.list_unfinished():
+
+            if not Path(job.file_path).exists():
+                job.status = JobStatus.FAILED
+                job.error = "Uploaded file is no longer available."
+                job.touch()
+                await self._store.save(job)
+                continue
+
+            job.status = JobStatus.QUEUED
+            job.stage = IngestionStage.QUEUED
+            job.chunks_embedded = 0
+            job.vectors_upserted = 0
+            job.touch()
+
+            await self._store.save(job)
+            self._queue.put_nowait(job)
+
+        if not self._queue.empty():
+            logger.info(
+                f"Re-queued {self._queue.qsize()} unfinished ingestion jobs."
+            )
+
+        self._workers = [
+            asyncio.create_task(
+                self._work(),
+                name=f"ingestion-worker-{worker_number}",
+            )
+            for worker_number in range(1, self._concurrency + 1)
+        ]
+
+        logger.info(
+            f"Started {self._concurrency} ingestion workers."
+        )
+
+    async def stop(self) -> None:
+        """
+        Cancel the workers.
+
+        Jobs interrupted here stay 'running' in a durable store and are
+        picked up again by the next start().
+        """
+
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(
+            *self._workers,
+            return_exceptions=True,
+        )
+
+        self._workers = []
+
+        self._store.close()
+
+    async def submit(
+        self,
+        filename: str,
+        file_path: Path,
+        job_id: str | None = None,
+        document_id: str | None = None,
+    ) -> IngestionJob:
+        """
+        Register a job for an uploaded file and queue it.
+
+        `document_id` names the document the file replaces, if any.
+        """
+
+        job = IngestionJob(
+            job_id=job_id or str(uuid4()),
+            filename=filename,
+            file_path=str(file_path),
+            document_id=document_id,
+        )
+
+        await self._store.save(job)
+        self._queue.put_nowait(job)
+
+        logger.info(
+            f"Queued ingestion job '{job.job_id}' for '{filename}' "
+            f"({self._queue.qsize()} waiting)."
+        )
+
+        return job
+
+    async def get(
+        self,
+        job_id: str,
+    ) -> IngestionJob | None:
+        """
+        Return a job with its latest progress.
+        """
+
+        job = self._running.get(job_id)
+
+        if job is not None:
+            return job
+
+        return await self._store.get(job_id)
+
+    async def _work(self) -> None:
+        while True:
+
+            job = await self._queue.get()
+
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(
+        self,
+        job: IngestionJob,
+    ) -> None:
+
+        logger.info(
+            f"Running ingestion job '{job.job_id}' for '{job.filename}'."
+        )
+
+        job.status = JobStatus.RUNNING
+        job.touch()
+
+        self._running[job.job_id] = job
+        await self._store.save(job)
+
+        def on_progress(progress: IngestionProgress) -> None:
+            job.stage = progress.stage
+            job.chunks_embedded = progress.chunks_embedded
+            job.vectors_upserted = progress.vectors_upserted
+            job.touch()
+
+        # Cancellation (shutdown) skips the bookkeeping below on purpose,
+        # so a durable store still sees the job as unfinished.
+        try:
+            pipeline = self._pipeline_factory()
+
+            result = await pipeline.ingest(
+                Path(job.file_path),
+                progress=on_progress,
+                document_id=job.document_id,
+            )
+
+        except Exception as exc:
+            logger.exception(
+                f"Ingestion job '{job.job_id}' failed."
+            )
+
+            job.status = JobStatus.FAILED
+            job.error = str(exc)
+
+        else:
+            logger.success(
+                f"Ingestion job '{job.job_id}' completed."
+            )
+
+            job.status = JobStatus.SUCCEEDED
+            job.stage = IngestionStage.COMPLETED
+            job.result = result
+
+        job.touch()
+
+        await self._store.save(job)
+
+        self._running.pop(job.job_id, None)
+
+        file_path = Path(job.file_path)
+        file_path.unlink(missing_ok=True)
+
+        # Uploads live in a per-job directory; drop it once it is empty.
+        with suppress(OSError):
+            file_path.parent.rmdir()
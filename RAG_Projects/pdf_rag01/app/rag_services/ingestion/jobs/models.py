@@ -0,0 +1,77 @@
+"""
+Models for background ingestion jobs.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+from app.rag_services.ingestion.models.ingestion_progress import (
+    IngestionStage,
+)
+from app.rag_services.ingestion.models.ingestion_result import (
+    IngestionResult,
+)
+
+
+class JobStatus(StrEnum):
+    """
+    Lifecycle status of an ingestion job.
+    """
+
+    QUEUED = "queued"
+
+    RUNNING = "running"
+
+    SUCCEEDED = "succeeded"
+
+    FAILED = "failed"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+class IngestionJob(BaseModel):
+    """
+    A document waiting for, or going through, ingestion.
+
+    Mutable on purpose: workers update progress in place.
+    """
+
+    job_id: str
+
+    filename: str
+
+    # Uploaded file on disk. Removed once the job finishes.
+    file_path: str
+
+    # Id of the document this upload replaces, chosen by the client.
+    # None ingests the file as a new document.
+    document_id: str | None = None
+
+    status: JobStatus = JobStatus.QUEUED
+
+    stage: IngestionStage = IngestionStage.QUEUED
+
+    chunks_embedded: int = 0
+
+    vectors_upserted: int = 0
+
+    result: IngestionResult | None = None
+
+    error: str | None = None
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+    def touch(self) -> None:
+        self.updated_at = datetime.now(timezone.utc)
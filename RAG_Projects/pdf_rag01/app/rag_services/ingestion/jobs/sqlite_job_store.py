@@ -0,0 +1,118 @@
+"""
+SQLite-backed durable job store.
+
+Responsibilities:
+- Persist every job status transition.
+- Return unfinished jobs so they can be re-queued after a restart.
+
+Jobs are stored as JSON documents. All SQLite calls run in a worker
+thread so the event loop is never blocked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+from loguru import logger
+
+from app.rag_services.ingestion.interfaces.job_store import JobStore
+from app.rag_services.ingestion.jobs.models import IngestionJob, JobStatus
+
+
+class SqliteJobStore(JobStore):
+    """
+    Job store persisted to a SQLite database.
+    """
+
+    def __init__(
+        self,
+        sqlite_path: Path,
+    ) -> None:
+        sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            sqlite_path,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS ingestion_jobs ("
+            "job_id TEXT PRIMARY KEY, "
+            "status TEXT NOT NULL, "
+            "created_at TEXT NOT NULL, "
+            "payload TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+        logger.info(f"Initialized SQLite job store at '{sqlite_path}'.")
+
+    async def save(
+        self,
+        job: IngestionJob,
+    ) -> None:
+        await asyncio.to_thread(
+            self._write,
+            job.job_id,
+            job.status.value,
+            job.created_at.isoformat(),
+            job.model_dump_json(),
+        )
+
+    async def get(
+        self,
+        job_id: str,
+    ) -> IngestionJob | None:
+        rows = await asyncio.to_thread(
+            self._query,
+            "SELECT payload FROM ingestion_jobs WHERE job_id = ?",
+            (job_id,),
+        )
+
+        if not rows:
+            return None
+
+        return IngestionJob.model_validate_json(rows[0][0])
+
+    async def list_unfinished(self) -> list[IngestionJob]:
+        rows = await asyncio.to_thread(
+            self._query,
+            "SELECT payload FROM ingestion_jobs "
+            "WHERE status IN (?, ?) ORDER BY created_at",
+            (JobStatus.QUEUED.value, JobStatus.RUNNING.value),
+        )
+
+        return [
+            IngestionJob.model_validate_json(payload)
+            for (payload,) in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _write(
+        self,
+        job_id: str,
+        status: str,
+        created_at: str,
+        payload: str,
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO ingestion_jobs "
+                "(job_id, status, created_at, payload) VALUES (?, ?, ?, ?)",
+                (job_id, status, created_at, payload),
+            )
+            self._connection.commit()
+
+    def _query(
+        self,
+        sql: str,
+        params: tuple,
+    ) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
@@ -5,33 +5,125 @@ Responsibilities:
 - Load a document from disk using the Unstructured library.
 - Map raw Unstructured elements into domain DocumentElement objects.
 - Populate DocumentMetadata with stable, strongly-typed fields.
+- Stream PDFs in page windows so large files never have to be held
+  in memory as a single Document.
+- Optionally partition PDF page ranges in parallel on a process pool.
 - Raise DocumentLoadingError on failure.
 """
 
 from __future__ import annotations
 
 import asyncio
-import hashlib
+import io
 import mimetypes
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Executor
 from pathlib import Path
 from uuid import uuid4
 
 from loguru import logger
+from pypdf import PdfReader, PdfWriter
 from unstructured.partition.auto import partition
+from unstructured.partition.pdf import partition_pdf
 
 from app.core.exceptions import DocumentLoadingError
-from app.rag_services.ingestion.interfaces.document_loader import DocumentLoader
+from app.rag_services.ingestion.interfaces.document_loader import (
+    StreamingDocumentLoader,
+)
 from app.rag_services.ingestion.mappers.unstructured_mapper import (
     UnstructuredElementMapper,
 )
-from app.schemas.document import Document, DocumentMetadata
+from app.rag_services.ingestion.utils.file_checksum import (
+    compute_file_checksum,
+)
+from app.schemas.document import (
+    Document,
+    DocumentElement,
+    DocumentMetadata,
+)
+
+
+_PDF_MIME_TYPE = "application/pdf"
+
+
+def _partition_page_range(
+    file_path: Path,
+    first_page: int,
+    last_page: int,
+) -> list[DocumentElement]:
+    """
+    Partition pages [first_page, last_page] (1-based, inclusive) of a PDF.
+
+    The page range is copied into an in-memory PDF so Unstructured only
+    parses the requested pages. Page numbers are kept absolute and the
+    original filename is passed through, so Unstructured's deterministic
+    element ids (filename, page number, position on page, text) are the
+    same no matter how the document is split into ranges.
+
+    Defined at module level so it can be pickled into process pool
+    workers.
+    """
+
+    reader = PdfReader(str(file_path))
+    writer = PdfWriter()
 
+    for page_index in range(first_page - 1, last_page):
+        writer.add_page(reader.pages[page_index])
 
-class UnstructuredDocumentLoader(DocumentLoader):
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    buffer.seek(0)
+
+    elements = partition_pdf(
+        file=buffer,
+        metadata_filename=file_path.name,
+        strategy="auto",
+        infer_table_structure=False,
+        starting_page_number=first_page,
+    )
+
+    return [
+        UnstructuredElementMapper.map(element)
+        for element in elements
+    ]
+
+
+def _page_ranges(
+    page_count: int,
+    pages_per_range: int,
+) -> Iterator[tuple[int, int]]:
+    """
+    Yield 1-based inclusive (first_page, last_page) ranges.
+    """
+
+    for first_page in range(1, page_count + 1, pages_per_range):
+        yield first_page, min(first_page + pages_per_range - 1, page_count)
+
+
+class UnstructuredDocumentLoader(StreamingDocumentLoader):
     """
     Production document loader backed by Unstructured.
+
+    When an executor is given, PDFs longer than `pages_per_shard` pages
+    are split into page ranges that are partitioned in parallel, and
+    streamed windows are parsed up to `max_workers` windows ahead.
     """
 
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        pages_per_shard: int = 16,
+        max_workers: int = 1,
+    ) -> None:
+
+        if pages_per_shard < 1:
+            raise ValueError("pages_per_shard must be at least 1.")
+
+        self._executor = executor
+        self._pages_per_shard = pages_per_shard
+        self._max_workers = max(1, max_workers)
+
     async def load(
         self,
         file_path: Path,
@@ -39,6 +131,23 @@ class UnstructuredDocumentLoader(DocumentLoader):
         try:
             logger.info(f"Loading document: {file_path}")
 
+            mime_type, _ = mimetypes.guess_type(str(file_path))
+
+            if (
+                self._executor is not None
+                and mime_type == _PDF_MIME_TYPE
+            ):
+                page_count = await asyncio.to_thread(
+                    self._count_pdf_pages,
+                    file_path,
+                )
+
+                if page_count > self._pages_per_shard:
+                    return await self._load_sharded(
+                        file_path,
+                        page_count,
+                    )
+
             elements = await asyncio.to_thread(
                 partition,
                 filename=str(file_path),
@@ -57,7 +166,6 @@ class UnstructuredDocumentLoader(DocumentLoader):
             )
 
             # Derive stable metadata fields from the file itself
-            mime_type, _ = mimetypes.guess_type(str(file_path))
             file_size_bytes = file_path.stat().st_size
             page_count = self._extract_page_count(elements)
             languages = self._extract_languages(elements)
@@ -89,6 +197,215 @@ class UnstructuredDocumentLoader(DocumentLoader):
                 f"Unable to load document: {file_path}"
             ) from exc
 
+    async def _load_sharded(
+        self,
+        file_path: Path,
+        page_count: int,
+    ) -> Document:
+        """
+        Partition page ranges on the executor and merge them in page order.
+        """
+
+        shards = list(_page_ranges(page_count, self._pages_per_shard))
+
+        logger.info(
+            f"Partitioning '{file_path.name}' ({page_count} pages) in "
+            f"{len(shards)} shards of up to {self._pages_per_shard} pages."
+        )
+
+        # gather() keeps shard order, so elements stay in page order.
+        shard_elements = await asyncio.gather(
+            *(
+                self._partition(file_path, first_page, last_page)
+                for first_page, last_page in shards
+            )
+        )
+
+        elements = [
+            element
+            for shard in shard_elements
+            for element in shard
+        ]
+
+        logger.info(
+            f"Parsed {len(elements)} semantic elements "
+            f"from '{file_path.name}'."
+        )
+
+        languages = sorted(
+            {
+                language
+                for element in elements
+                for language in element.metadata.get("languages") or []
+            }
+        )
+
+        checksum = await asyncio.to_thread(self._compute_checksum, file_path)
+
+        metadata = DocumentMetadata(
+            parser="unstructured",
+            filename=file_path.name,
+            mime_type=_PDF_MIME_TYPE,
+            file_size_bytes=file_path.stat().st_size,
+            page_count=page_count,
+            languages=languages,
+            checksum=checksum,
+        )
+
+        return Document(
+            document_id=str(uuid4()),
+            filename=file_path.name,
+            elements=elements,
+            metadata=metadata,
+        )
+
+    def _partition(
+        self,
+        file_path: Path,
+        first_page: int,
+        last_page: int,
+    ) -> asyncio.Future[list[DocumentElement]]:
+        """
+        Schedule one page range on the executor, or on a thread if none.
+        """
+
+        if self._executor is None:
+            return asyncio.ensure_future(
+                asyncio.to_thread(
+                    _partition_page_range,
+                    file_path,
+                    first_page,
+                    last_page,
+                )
+            )
+
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            _partition_page_range,
+            file_path,
+            first_page,
+            last_page,
+        )
+
+    async def stream(
+        self,
+        file_path: Path,
+        pages_per_window: int = 10,
+    ) -> AsyncIterator[Document]:
+        """
+        Yield the document in windows of `pages_per_window` pages.
+
+        Only PDFs can be split by page; any other file type is loaded
+        in full and yielded as a single window.
+        """
+
+        if pages_per_window < 1:
+            raise ValueError("pages_per_window must be at least 1.")
+
+        mime_type, _ = mimetypes.guess_type(str(file_path))
+
+        if mime_type != _PDF_MIME_TYPE:
+            yield await self.load(file_path)
+            return
+
+        try:
+            page_count = await asyncio.to_thread(
+                self._count_pdf_pages,
+                file_path,
+            )
+            checksum = await asyncio.to_thread(
+                self._compute_checksum,
+                file_path,
+            )
+        except Exception as exc:
+            logger.exception(
+                f"Failed to open document '{file_path}'."
+            )
+
+            raise DocumentLoadingError(
+                f"Unable to load document: {file_path}"
+            ) from exc
+
+        # Languages are only known per window, so they are left empty on
+        # the shared document metadata.
+        metadata = DocumentMetadata(
+            parser="unstructured",
+            filename=file_path.name,
+            mime_type=mime_type,
+            file_size_bytes=file_path.stat().st_size,
+            page_count=page_count,
+            checksum=checksum,
+        )
+
+        document_id = str(uuid4())
+
+        logger.info(
+            f"Streaming '{file_path.name}' ({page_count} pages) in "
+            f"windows of {pages_per_window} pages."
+        )
+
+        windows = _page_ranges(page_count, pages_per_window)
+
+        # Windows are parsed ahead of the consumer, at most one per worker.
+        pending: deque[
+            tuple[int, int, asyncio.Future[list[DocumentElement]]]
+        ] = deque()
+
+        def schedule_next() -> None:
+            for first_page, last_page in windows:
+                pending.append(
+                    (
+                        first_page,
+                        last_page,
+                        self._partition(file_path, first_page, last_page),
+                    )
+                )
+                return
+
+        try:
+            for _ in range(self._max_workers):
+                schedule_next()
+
+            while pending:
+
+                first_page, last_page, future = pending.popleft()
+
+                try:
+                    elements = await future
+                except Exception as exc:
+                    logger.exception(
+                        f"Failed to load pages {first_page}-{last_page} "
+                        f"of '{file_path}'."
+                    )
+
+                    raise DocumentLoadingError(
+                        f"Unable to load pages {first_page}-{last_page} "
+                        f"of document: {file_path}"
+                    ) from exc
+
+                schedule_next()
+
+                logger.debug(
+                    f"Parsed {len(elements)} elements from pages "
+                    f"{first_page}-{last_page} of '{file_path.name}'."
+                )
+
+                yield Document(
+                    document_id=document_id,
+                    filename=file_path.name,
+                    elements=elements,
+                    metadata=metadata,
+                )
+
+        finally:
+            # The consumer stopped early or failed; drop queued windows.
+            for _, _, future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _count_pdf_pages(file_path: Path) -> int:
+        return len(PdfReader(str(file_path)).pages)
+
     @staticmethod
     def _extract_page_count(elements: list) -> int | None:
         """
@@ -119,8 +436,4 @@ class UnstructuredDocumentLoader(DocumentLoader):
         """
         Compute SHA-256 checksum of the file for deduplication.
         """
-        sha256 = hashlib.sha256()
-        with file_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
\ No newline at end of file
+        return compute_file_checksum(file_path)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict
+
+
+class IngestionStage(StrEnum):
+    """
+    Coarse stage of a running ingestion.
+    """
+
+    QUEUED = "queued"
+
+    LOADING = "loading"
+
+    CHUNKING = "chunking"
+
+    EMBEDDING = "embedding"
+
+    UPSERTING = "upserting"
+
+    COMPLETED = "completed"
+
+
+class IngestionProgress(BaseModel):
+    """
+    Progress snapshot reported by an ingestion pipeline.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    stage: IngestionStage
+
+    chunks_embedded: int = 0
+
+    vectors_upserted: int = 0
+
+
+ProgressCallback = Callable[[IngestionProgress], None]
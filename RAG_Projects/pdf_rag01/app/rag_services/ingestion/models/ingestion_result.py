@@ -1,6 +1,30 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StageMetrics(BaseModel):
+    """
+    Throughput of a single streaming ingestion stage.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    stage: str
+
+    # Units of work processed (pages, chunks or vectors).
+    items: int
+
+    # Number of times the stage ran (windows or batches).
+    batches: int
+
+    # Time spent doing work, excluding waits on the stage queues.
+    busy_time_ms: float
+
+    items_per_second: float
 
 
 class IngestionResult(BaseModel):
@@ -25,4 +49,24 @@ class IngestionResult(BaseModel):
 
     processing_time_ms: float
 
+    # The exact same file was already ingested; nothing was written.
+    unchanged: bool = False
+
+    # Chunks whose stored vectors were kept from the previous version.
+    vectors_reused: int = 0
+
+    # Vectors of chunks that disappeared from the previous version.
+    vectors_deleted: int = 0
+
+    # Near-duplicate chunks that were not embedded.
+    duplicates_skipped: int = 0
+
+    # Elements removed by each document filter, by filter name.
+    filter_drop_counts: dict[str, int] = Field(default_factory=dict)
+
+    # Only populated by the streaming pipeline.
+    time_to_first_upsert_ms: float | None = None
+
+    stage_metrics: list[StageMetrics] = Field(default_factory=list)
+
     success: bool = True
\ No newline at end of file
@@ -3,6 +3,8 @@ Production document ingestion pipeline.
 
 Pipeline:
 
+DocumentRegistry (skip unchanged files)
+        ↓
 DocumentLoader
         ↓
 DocumentPreprocessor
@@ -11,32 +13,61 @@ Chunker
         ↓
 ChunkEnricher
         ↓
+NearDuplicateDetector (collapse near-duplicate chunks)
+        ↓
+ChunkDiff (only changed chunks continue)
+        ↓
+ParentChunkStore (parent chunks, when hierarchical chunking is on)
+        ↓
 VectorDocumentBuilder
         ↓
-VectorRepository
+VectorRepository / ParentChunkStore (upsert changed, delete removed)
+        ↓
+DocumentRegistry
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
+from collections import Counter
 from pathlib import Path
 
 from loguru import logger
 
+from app.rag_services.ingestion.dedup.near_duplicate_detector import (
+    NearDuplicateDetector,
+)
 from app.rag_services.ingestion.interfaces.chunk_enricher import ChunkEnricher
 from app.rag_services.ingestion.interfaces.chunker import Chunker
 from app.rag_services.ingestion.interfaces.document_loader import DocumentLoader
+from app.rag_services.ingestion.interfaces.document_registry import (
+    DocumentRegistry,
+)
 from app.rag_services.ingestion.interfaces.document_preprocessor import (
     DocumentPreprocessor,
 )
 from app.rag_services.ingestion.interfaces.document_filter_pipeline import DocumentFilterPipeline
+from app.rag_services.ingestion.interfaces.parent_chunk_store import (
+    ParentChunkStore,
+)
+from app.rag_services.ingestion.models.ingestion_progress import (
+    IngestionProgress,
+    IngestionStage,
+    ProgressCallback,
+)
 from app.rag_services.ingestion.models.ingestion_result import (
     IngestionResult,
 )
+from app.rag_services.ingestion.registry.chunk_diff import ChunkDiff
+from app.rag_services.ingestion.utils.file_checksum import (
+    compute_file_checksum,
+)
 
 from app.infrastructure.vector_db.base import VectorStoreRepository
 
 from app.infrastructure.embeddings.vector_document_builder import VectorDocumentBuilder
+from app.schemas.chunk.enums import ChunkType
 
 
 class DocumentIngestionPipeline:
@@ -53,6 +84,9 @@ class DocumentIngestionPipeline:
         enricher: ChunkEnricher,
         vector_document_builder: VectorDocumentBuilder,
         repository: VectorStoreRepository,
+        registry: DocumentRegistry | None = None,
+        parent_store: ParentChunkStore | None = None,
+        near_duplicate_threshold: float | None = None,
     ) -> None:
         self._loader = loader
         self._preprocessor = preprocessor
@@ -61,34 +95,113 @@ class DocumentIngestionPipeline:
         self._enricher = enricher
         self._vector_document_builder = vector_document_builder
         self._repository = repository
+        self._registry = registry
+        self._parent_store = parent_store
+        self._near_duplicate_threshold = near_duplicate_threshold
 
     async def ingest(
         self,
         file_path: Path,
+        progress: ProgressCallback | None = None,
+        document_id: str | None = None,
     ) -> IngestionResult:
         """
         Execute the complete ingestion pipeline.
+
+        `progress`, when given, is called at every stage transition.
+
+        `document_id`, when given, is the id the caller keeps for this
+        document. If it is already registered, the file is ingested as
+        a new revision: unchanged chunks are reused and chunks that
+        disappeared are deleted. Without it the document gets a new id
+        and nothing already stored is touched.
         """
 
+        def report(
+            stage: IngestionStage,
+            chunks_embedded: int = 0,
+            vectors_upserted: int = 0,
+        ) -> None:
+            if progress is not None:
+                progress(
+                    IngestionProgress(
+                        stage=stage,
+                        chunks_embedded=chunks_embedded,
+                        vectors_upserted=vectors_upserted,
+                    )
+                )
+
         logger.info(
             f"Starting ingestion for '{file_path.name}'."
         )
 
         start_time = time.perf_counter()
 
+        report(IngestionStage.LOADING)
+
+        previous = None
+
+        if self._registry is not None:
+
+            checksum = await asyncio.to_thread(
+                compute_file_checksum,
+                file_path,
+            )
+
+            existing = await self._registry.get_by_checksum(checksum)
+
+            if existing is not None and document_id in (
+                None,
+                existing.document_id,
+            ):
+                logger.info(
+                    f"'{file_path.name}' is unchanged (document "
+                    f"'{existing.document_id}'). Skipping ingestion."
+                )
+
+                report(IngestionStage.COMPLETED)
+
+                return IngestionResult(
+                    document_id=existing.document_id,
+                    filename=existing.filename,
+                    chunk_count=existing.chunk_count,
+                    vector_count=0,
+                    checksum=checksum,
+                    processing_time_ms=(
+                        time.perf_counter() - start_time
+                    ) * 1000,
+                    unchanged=True,
+                )
+
+            if document_id is not None:
+                previous = await self._registry.get(document_id)
+
         # Load document
         document = await self._loader.load(file_path)
 
+        if document_id is not None:
+            # Uploading under an existing id replaces that document.
+            document = document.model_copy(
+                update={"document_id": document_id},
+            )
+
         # Preprocess
         document = await self._preprocessor.preprocess(
             document,
         )
 
         # Filter
-        document = await self._filter_pipeline.filter(document)
+        filter_drop_counts: Counter[str] = Counter()
+
+        document = await self._filter_pipeline.filter(
+            document,
+            filter_drop_counts,
+        )
 
         logger.success("Document filtering completed.")
 
+        report(IngestionStage.CHUNKING)
+
         # Chunk
         chunks = await self._chunker.chunk(
             document,
@@ -103,20 +216,87 @@ class DocumentIngestionPipeline:
 
         logger.success(f"Chuns encher executed")
 
+        # Deduplicate
+        detector = None
+
+        if self._near_duplicate_threshold is not None:
+            detector = NearDuplicateDetector(
+                threshold=self._near_duplicate_threshold,
+            )
+
+            chunks = detector.select_unique(chunks)
+
+        diff = ChunkDiff(previous)
+
+        changed_chunks = diff.select_changed(chunks)
+
+        if previous is not None:
+            logger.info(
+                f"Revision of document '{previous.document_id}': "
+                f"{len(changed_chunks)} changed chunks, "
+                f"{diff.reused_count} unchanged."
+            )
+
+        # Parent chunks are stored as-is; only their children are embedded.
+        if self._parent_store is not None:
+            await self._parent_store.save_many(
+                [
+                    chunk
+                    for chunk in changed_chunks
+                    if chunk.chunk_type is ChunkType.PARENT
+                ]
+            )
+
+            changed_chunks = [
+                chunk
+                for chunk in changed_chunks
+                if chunk.chunk_type is not ChunkType.PARENT
+            ]
+
+        report(IngestionStage.EMBEDDING)
+
         # Build vector documents
         vector_documents = (
             await self._vector_document_builder.build_batch(
-                chunks,
+                changed_chunks,
             )
         )
 
         logger.success(f"Vector Embeddings generated")
 
+        report(
+            IngestionStage.UPSERTING,
+            chunks_embedded=len(changed_chunks),
+        )
+
         # Persist
         await self._repository.upsert(
             vector_documents,
         )
 
+        removed_ids = diff.removed_ids()
+
+        if removed_ids:
+            await self._repository.delete(removed_ids)
+
+            if self._parent_store is not None:
+                await self._parent_store.delete_many(removed_ids)
+
+        if self._registry is not None:
+            await self._registry.save(
+                diff.to_record(
+                    document_id=document.document_id,
+                    filename=document.filename,
+                    checksum=document.metadata.checksum,
+                )
+            )
+
+        report(
+            IngestionStage.COMPLETED,
+            chunks_embedded=len(changed_chunks),
+            vectors_upserted=len(vector_documents),
+        )
+
         processing_time = (
             time.perf_counter() - start_time
         ) * 1000
@@ -133,4 +313,10 @@ class DocumentIngestionPipeline:
             vector_count=len(vector_documents),
             checksum=document.metadata.checksum,
             processing_time_ms=processing_time,
+            vectors_reused=diff.reused_count,
+            vectors_deleted=len(removed_ids),
+            duplicates_skipped=(
+                detector.duplicate_count if detector is not None else 0
+            ),
+            filter_drop_counts=dict(filter_drop_counts),
         )
\ No newline at end of file
@@ -0,0 +1,668 @@
+"""
+Streaming document ingestion pipeline.
+
+Pipeline:
+
+DocumentRegistry                 (skip unchanged files)
+        ↓
+StreamingDocumentLoader.stream   (page windows)
+        ↓
+DocumentPreprocessor → DocumentFilterPipeline → Chunker → ChunkEnricher
+        ↓
+NearDuplicateDetector            (collapse near-duplicate chunks)
+        ↓
+ChunkDiff                        (only changed chunks continue)
+        ↓
+ParentChunkStore                 (parent chunks are stored, not embedded)
+        ↓  bounded chunk queue
+VectorDocumentBuilder            (micro-batches of embedding_batch_size)
+        ↓  bounded vector queue
+VectorRepository                 (upsert_workers concurrent consumers)
+        ↓
+VectorRepository.delete / ParentChunkStore.delete / DocumentRegistry
+                                 (removed chunks, new record)
+
+Responsibilities:
+- Overlap parsing, embedding and upserting instead of running them one
+  after the other on the whole document.
+- Keep memory bounded: only `queue_size` items wait between two stages,
+  so a slow stage applies backpressure to the stages before it.
+- Carry the trailing semantic chunk of a window over to the next window,
+  so chunks are not cut at window boundaries.
+- Report per-stage throughput and time to first upsert.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+from app.core.exceptions import DocumentLoadingError
+from app.infrastructure.embeddings.vector_document_builder import (
+    VectorDocumentBuilder,
+)
+from app.infrastructure.vector_db.base import VectorStoreRepository
+from app.infrastructure.vector_db.models import VectorDocumentBatch
+from app.rag_services.ingestion.dedup.near_duplicate_detector import (
+    NearDuplicateDetector,
+)
+from app.rag_services.ingestion.interfaces.chunk_enricher import ChunkEnricher
+from app.rag_services.ingestion.interfaces.chunker import Chunker
+from app.rag_services.ingestion.interfaces.document_filter_pipeline import (
+    DocumentFilterPipeline,
+)
+from app.rag_services.ingestion.interfaces.document_registry import (
+    DocumentRegistry,
+)
+from app.rag_services.ingestion.interfaces.document_loader import (
+    StreamingDocumentLoader,
+)
+from app.rag_services.ingestion.interfaces.document_preprocessor import (
+    DocumentPreprocessor,
+)
+from app.rag_services.ingestion.interfaces.parent_chunk_store import (
+    ParentChunkStore,
+)
+from app.rag_services.ingestion.models.ingestion_progress import (
+    IngestionProgress,
+    IngestionStage,
+    ProgressCallback,
+)
+from app.rag_services.ingestion.models.ingestion_result import (
+    IngestionResult,
+    StageMetrics,
+)
+from app.rag_services.ingestion.registry.chunk_diff import ChunkDiff
+from app.rag_services.ingestion.utils.file_checksum import (
+    compute_file_checksum,
+)
+from app.schemas.chunk.chunk import Chunk
+from app.schemas.chunk.enums import ChunkType
+from app.schemas.document import Document, DocumentElement
+
+
+# Marks the end of a stage queue.
+_END = object()
+
+
+@dataclass
+class _StageTracker:
+    """
+    Mutable throughput counters for one stage.
+    """
+
+    stage: str
+    items: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    first_started_at: float | None = None
+    last_finished_at: float | None = None
+
+    def record(
+        self,
+        items: int,
+        started_at: float,
+    ) -> None:
+        finished_at = time.perf_counter()
+
+        self.items += items
+        self.batches += 1
+        self.busy_seconds += finished_at - started_at
+
+        if self.first_started_at is None:
+            self.first_started_at = started_at
+        self.last_finished_at = finished_at
+
+    def snapshot(self) -> StageMetrics:
+        # Throughput is measured over the stage's active wall-clock span,
+        # which stays meaningful when several workers run concurrently.
+        span = 0.0
+        if self.first_started_at is not None:
+            span = self.last_finished_at - self.first_started_at
+
+        return StageMetrics(
+            stage=self.stage,
+            items=self.items,
+            batches=self.batches,
+            busy_time_ms=self.busy_seconds * 1000,
+            items_per_second=self.items / span if span > 0 else 0.0,
+        )
+
+
+@dataclass
+class _StreamState:
+    """
+    State shared by the stages of a single ingest() call.
+    """
+
+    started_at: float
+    diff: ChunkDiff
+    detector: NearDuplicateDetector | None = None
+    progress: ProgressCallback | None = None
+    document_id: str | None = None
+    document: Document | None = None
+    # Chunks produced so far, before deduplication; numbers the next one.
+    next_chunk_index: int = 0
+    # Chunks kept after deduplication, as the batch pipeline counts them.
+    chunk_count: int = 0
+    chunks_embedded: int = 0
+    vector_count: int = 0
+    first_upsert_at: float | None = None
+    # Summed over the page windows.
+    filter_drop_counts: Counter[str] = field(default_factory=Counter)
+    trackers: dict[str, _StageTracker] = field(
+        default_factory=lambda: {
+            stage: _StageTracker(stage)
+            for stage in ("load", "chunk", "embed", "upsert")
+        }
+    )
+
+    def report(
+        self,
+        stage: IngestionStage,
+    ) -> None:
+        if self.progress is not None:
+            self.progress(
+                IngestionProgress(
+                    stage=stage,
+                    chunks_embedded=self.chunks_embedded,
+                    vectors_upserted=self.vector_count,
+                )
+            )
+
+
+class StreamingDocumentIngestionPipeline:
+    """
+    Coordinates ingestion as a set of concurrent, bounded stages.
+    """
+
+    def __init__(
+        self,
+        loader: StreamingDocumentLoader,
+        preprocessor: DocumentPreprocessor,
+        filter_pipeline: DocumentFilterPipeline,
+        chunker: Chunker,
+        enricher: ChunkEnricher,
+        vector_document_builder: VectorDocumentBuilder,
+        repository: VectorStoreRepository,
+        registry: DocumentRegistry | None = None,
+        parent_store: ParentChunkStore | None = None,
+        pages_per_window: int = 10,
+        embedding_batch_size: int = 64,
+        queue_size: int = 4,
+        upsert_workers: int = 2,
+        max_carry_elements: int = 200,
+        near_duplicate_threshold: float | None = None,
+    ) -> None:
+
+        if embedding_batch_size < 1:
+            raise ValueError("embedding_batch_size must be at least 1.")
+
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1.")
+
+        if upsert_workers < 1:
+            raise ValueError("upsert_workers must be at least 1.")
+
+        self._loader = loader
+        self._preprocessor = preprocessor
+        self._filter_pipeline = filter_pipeline
+        self._chunker = chunker
+        self._enricher = enricher
+        self._vector_document_builder = vector_document_builder
+        self._repository = repository
+        self._registry = registry
+        self._parent_store = parent_store
+        self._pages_per_window = pages_per_window
+        self._embedding_batch_size = embedding_batch_size
+        self._queue_size = queue_size
+        self._upsert_workers = upsert_workers
+        self._max_carry_elements = max_carry_elements
+        self._near_duplicate_threshold = near_duplicate_threshold
+
+    async def ingest(
+        self,
+        file_path: Path,
+        progress: ProgressCallback | None = None,
+        document_id: str | None = None,
+    ) -> IngestionResult:
+        """
+        Stream a document through all stages and return the result.
+
+        Stages overlap, so `progress` reports the stage that produced
+        the latest update together with the running counters.
+
+        `document_id` works as in DocumentIngestionPipeline.ingest: an
+        already registered id makes this a revision of that document.
+        """
+
+        logger.info(
+            f"Starting streaming ingestion for '{file_path.name}' "
+            f"(pages_per_window={self._pages_per_window}, "
+            f"embedding_batch_size={self._embedding_batch_size}, "
+            f"queue_size={self._queue_size}, "
+            f"upsert_workers={self._upsert_workers})."
+        )
+
+        started_at = time.perf_counter()
+
+        if progress is not None:
+            progress(IngestionProgress(stage=IngestionStage.LOADING))
+
+        previous = None
+
+        if self._registry is not None:
+
+            checksum = await asyncio.to_thread(
+                compute_file_checksum,
+                file_path,
+            )
+
+            existing = await self._registry.get_by_checksum(checksum)
+
+            if existing is not None and document_id in (
+                None,
+                existing.document_id,
+            ):
+                logger.info(
+                    f"'{file_path.name}' is unchanged (document "
+                    f"'{existing.document_id}'). Skipping ingestion."
+                )
+
+                if progress is not None:
+                    progress(IngestionProgress(stage=IngestionStage.COMPLETED))
+
+                return IngestionResult(
+                    document_id=existing.document_id,
+                    filename=existing.filename,
+                    chunk_count=existing.chunk_count,
+                    vector_count=0,
+                    checksum=checksum,
+                    processing_time_ms=(
+                        time.perf_counter() - started_at
+                    ) * 1000,
+                    unchanged=True,
+                )
+
+            if document_id is not None:
+                previous = await self._registry.get(document_id)
+
+        state = _StreamState(
+            started_at=started_at,
+            diff=ChunkDiff(previous),
+            detector=(
+                NearDuplicateDetector(
+                    threshold=self._near_duplicate_threshold,
+                )
+                if self._near_duplicate_threshold is not None
+                else None
+            ),
+            progress=progress,
+            document_id=document_id,
+        )
+
+        chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        vector_queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(
+                    self._produce_chunks(file_path, chunk_queue, state)
+                )
+                task_group.create_task(
+                    self._embed_chunks(chunk_queue, vector_queue, state)
+                )
+                for _ in range(self._upsert_workers):
+                    task_group.create_task(
+                        self._upsert_vectors(vector_queue, state)
+                    )
+        except ExceptionGroup as group:
+            # Surface the stage failure itself; the other stages were
+            # cancelled because of it.
+            raise group.exceptions[0] from group
+
+        if state.document is None:
+            raise DocumentLoadingError(
+                f"No pages could be loaded from: {file_path}"
+            )
+
+        document = state.document
+
+        removed_ids = state.diff.removed_ids()
+
+        if removed_ids:
+            await self._repository.delete(removed_ids)
+
+            if self._parent_store is not None:
+                await self._parent_store.delete_many(removed_ids)
+
+        if self._registry is not None:
+            await self._registry.save(
+                state.diff.to_record(
+                    document_id=document.document_id,
+                    filename=document.filename,
+                    checksum=document.metadata.checksum,
+                )
+            )
+
+        if previous is not None:
+            logger.info(
+                f"Revision of document '{previous.document_id}': "
+                f"{state.chunks_embedded} changed chunks, "
+                f"{state.diff.reused_count} unchanged, "
+                f"{len(removed_ids)} removed."
+            )
+
+        state.report(IngestionStage.COMPLETED)
+
+        processing_time = (time.perf_counter() - state.started_at) * 1000
+
+        time_to_first_upsert = None
+        if state.first_upsert_at is not None:
+            time_to_first_upsert = (
+                state.first_upsert_at - state.started_at
+            ) * 1000
+
+        stage_metrics = [
+            tracker.snapshot()
+            for tracker in state.trackers.values()
+        ]
+
+        for metrics in stage_metrics:
+            logger.info(
+                f"Stage '{metrics.stage}': {metrics.items} items in "
+                f"{metrics.batches} batches, "
+                f"{metrics.items_per_second:.1f} items/s."
+            )
+
+        logger.info(
+            f"Streaming ingestion completed for '{file_path.name}' "
+            f"in {processing_time:.2f} ms."
+        )
+
+        return IngestionResult(
+            document_id=document.document_id,
+            filename=document.filename,
+            chunk_count=state.chunk_count,
+            vector_count=state.vector_count,
+            checksum=document.metadata.checksum,
+            processing_time_ms=processing_time,
+            vectors_reused=state.diff.reused_count,
+            vectors_deleted=len(removed_ids),
+            duplicates_skipped=(
+                state.detector.duplicate_count
+                if state.detector is not None
+                else 0
+            ),
+            time_to_first_upsert_ms=time_to_first_upsert,
+            stage_metrics=stage_metrics,
+            filter_drop_counts=dict(state.filter_drop_counts),
+        )
+
+    async def _produce_chunks(
+        self,
+        file_path: Path,
+        chunk_queue: asyncio.Queue,
+        state: _StreamState,
+    ) -> None:
+        """
+        Load page windows and turn them into enriched chunks.
+        """
+
+        load_tracker = state.trackers["load"]
+        chunk_tracker = state.trackers["chunk"]
+
+        windows = aiter(
+            self._loader.stream(
+                file_path,
+                pages_per_window=self._pages_per_window,
+            )
+        )
+
+        carry: list[DocumentElement] = []
+
+        while True:
+
+            started_at = time.perf_counter()
+
+            try:
+                window = await anext(windows)
+            except StopAsyncIteration:
+                break
+
+            load_tracker.record(
+                len({element.page_number for element in window.elements}),
+                started_at,
+            )
+
+            if state.document_id is not None:
+                # Uploading under an existing id replaces that document.
+                window = window.model_copy(
+                    update={"document_id": state.document_id},
+                )
+
+            if state.document is None:
+                state.document = window
+
+            started_at = time.perf_counter()
+
+            window = await self._preprocessor.preprocess(window)
+            window = await self._filter_pipeline.filter(
+                window,
+                state.filter_drop_counts,
+            )
+
+            chunks, carry = await self._chunk_window(
+                window.model_copy(
+                    update={"elements": carry + window.elements},
+                )
+            )
+
+            await self._emit_chunks(chunks, chunk_queue, state)
+
+            chunk_tracker.record(len(chunks), started_at)
+
+        if carry:
+            started_at = time.perf_counter()
+
+            chunks = await self._chunker.chunk(
+                state.document.model_copy(update={"elements": carry})
+            )
+
+            await self._emit_chunks(chunks, chunk_queue, state)
+
+            chunk_tracker.record(len(chunks), started_at)
+
+        await chunk_queue.put(_END)
+
+    async def _chunk_window(
+        self,
+        window: Document,
+    ) -> tuple[list[Chunk], list[DocumentElement]]:
+        """
+        Chunk a window and split off the elements of its last chunk.
+
+        The last chunk may continue on the next page window, so its
+        elements are carried over instead of being emitted now.
+        """
+
+        chunks = await self._chunker.chunk(window)
+
+        if not chunks or not chunks[-1].source_element_ids:
+            return chunks, []
+
+        first_open_id = chunks[-1].source_element_ids[0]
+
+        start = next(
+            (
+                position
+                for position, element in enumerate(window.elements)
+                if element.element_id == first_open_id
+            ),
+            None,
+        )
+
+        if start is None:
+            return chunks, []
+
+        carry = window.elements[start:]
+
+        if len(carry) > self._max_carry_elements:
+            logger.debug(
+                f"Carry-over reached {len(carry)} elements; "
+                "flushing the open chunk."
+            )
+            return chunks, []
+
+        carried_ids = {element.element_id for element in carry}
+
+        # A split chunk yields several sub-chunks from the same elements.
+        closed = [
+            chunk
+            for chunk in chunks
+            if not carried_ids.issuperset(chunk.source_element_ids)
+        ]
+
+        return closed, carry
+
+    async def _emit_chunks(
+        self,
+        chunks: list[Chunk],
+        chunk_queue: asyncio.Queue,
+        state: _StreamState,
+    ) -> None:
+        """
+        Enrich chunks, renumber them document-wide and queue them.
+        """
+
+        if not chunks:
+            return
+
+        chunks = await self._enricher.enrich(chunks)
+
+        chunks = [
+            chunk.model_copy(
+                update={
+                    "metadata": chunk.metadata.model_copy(
+                        update={"chunk_index": state.next_chunk_index + offset},
+                    )
+                }
+            )
+            for offset, chunk in enumerate(chunks)
+        ]
+
+        state.next_chunk_index += len(chunks)
+
+        if state.detector is not None:
+            chunks = state.detector.select_unique(chunks)
+
+        state.chunk_count += len(chunks)
+
+        chunks = state.diff.select_changed(chunks)
+
+        # Parent chunks are stored as-is; only their children are embedded.
+        if self._parent_store is not None:
+            await self._parent_store.save_many(
+                [
+                    chunk
+                    for chunk in chunks
+                    if chunk.chunk_type is ChunkType.PARENT
+                ]
+            )
+
+            chunks = [
+                chunk
+                for chunk in chunks
+                if chunk.chunk_type is not ChunkType.PARENT
+            ]
+
+        if not chunks:
+            return
+
+        # Blocks while the embedding stage is behind.
+        await chunk_queue.put(chunks)
+
+    async def _embed_chunks(
+        self,
+        chunk_queue: asyncio.Queue,
+        vector_queue: asyncio.Queue,
+        state: _StreamState,
+    ) -> None:
+        """
+        Re-batch incoming chunks into fixed-size embedding micro-batches.
+        """
+
+        tracker = state.trackers["embed"]
+        buffer: list[Chunk] = []
+        finished = False
+
+        while not finished:
+
+            item = await chunk_queue.get()
+
+            if item is _END:
+                finished = True
+            else:
+                buffer.extend(item)
+
+            while buffer and (
+                finished or len(buffer) >= self._embedding_batch_size
+            ):
+                batch = buffer[:self._embedding_batch_size]
+                buffer = buffer[self._embedding_batch_size:]
+
+                started_at = time.perf_counter()
+
+                vectors = await self._vector_document_builder.build_batch(
+                    batch,
+                )
+
+                tracker.record(len(batch), started_at)
+
+                state.chunks_embedded += len(batch)
+                state.report(IngestionStage.EMBEDDING)
+
+                # Blocks while the upsert workers are behind.
+                await vector_queue.put(vectors)
+
+        for _ in range(self._upsert_workers):
+            await vector_queue.put(_END)
+
+    async def _upsert_vectors(
+        self,
+        vector_queue: asyncio.Queue,
+        state: _StreamState,
+    ) -> None:
+        """
+        Persist vector batches until the embedding stage is done.
+        """
+
+        tracker = state.trackers["upsert"]
+
+        while True:
+
+            vectors: VectorDocumentBatch | object = await vector_queue.get()
+
+            if vectors is _END:
+                return
+
+            started_at = time.perf_counter()
+
+            await self._repository.upsert(vectors)
+
+            tracker.record(len(vectors), started_at)
+
+            state.vector_count += len(vectors)
+            state.report(IngestionStage.UPSERTING)
+
+            if state.first_upsert_at is None:
+                state.first_upsert_at = time.perf_counter()
+                logger.info(
+                    f"First vectors upserted after "
+                    f"{(state.first_upsert_at - state.started_at) * 1000:.2f} ms."
+                )
@@ -0,0 +1,129 @@
+"""
+Chunk-level diff between a new document version and the stored one.
+
+Responsibilities:
+- Hash the content of every chunk.
+- Match new chunks against the previous version's hashes.
+- Return only chunks that must be embedded and upserted.
+- Report the vector ids that no longer exist in the new version.
+
+Matching is by content only. An unchanged chunk keeps its previous
+vector, including the chunk_index / page_number stored with it. The
+near-duplicates a chunk stands for count as content, so a chunk whose
+duplicates changed is upserted again with the new duplicate metadata.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+
+from app.rag_services.ingestion.registry.models import DocumentRecord
+from app.schemas.chunk.chunk import Chunk
+
+
+def chunk_content_hash(chunk: Chunk) -> str:
+    """
+    Hash everything that ends up in a chunk's embeddings and payload text.
+    """
+
+    sha256 = hashlib.sha256()
+
+    for part in (
+        chunk.chunk_type.value,
+        chunk.text,
+        chunk.indexed_text or "",
+    ):
+        sha256.update(part.encode("utf-8"))
+        sha256.update(b"\0")
+
+    # A child is re-embedded when its parent changes. Chunks without a
+    # parent keep the hash they had before hierarchical chunking.
+    if chunk.parent_chunk_id is not None:
+        sha256.update(chunk.parent_chunk_id.encode("utf-8"))
+        sha256.update(b"\0")
+
+    # Duplicates get fresh chunk ids on every run, so their number and
+    # pages identify the set. Chunks without duplicates keep the hash
+    # they had before deduplication.
+    duplicate_ids = chunk.metadata.duplicate_chunk_ids
+
+    if duplicate_ids:
+        sha256.update(str(len(duplicate_ids)).encode("utf-8"))
+        sha256.update(b"\0")
+
+        for page_number in chunk.metadata.duplicate_page_numbers or ():
+            sha256.update(str(page_number).encode("utf-8"))
+            sha256.update(b"\0")
+
+    return sha256.hexdigest()
+
+
+class ChunkDiff:
+    """
+    Incrementally diffs chunks against a previous DocumentRecord.
+    """
+
+    def __init__(
+        self,
+        previous: DocumentRecord | None = None,
+    ) -> None:
+
+        # content hash -> previous chunk ids not matched yet
+        self._unmatched: dict[str, list[str]] = defaultdict(list)
+
+        if previous is not None:
+            for chunk_id, content_hash in previous.chunk_hashes.items():
+                self._unmatched[content_hash].append(chunk_id)
+
+        self._current: dict[str, str] = {}
+
+        self.reused_count = 0
+
+    def select_changed(
+        self,
+        chunks: list[Chunk],
+    ) -> list[Chunk]:
+        """
+        Record the chunks and return those without a stored twin.
+        """
+
+        changed: list[Chunk] = []
+
+        for chunk in chunks:
+
+            content_hash = chunk_content_hash(chunk)
+            previous_ids = self._unmatched.get(content_hash)
+
+            if previous_ids:
+                self._current[previous_ids.pop()] = content_hash
+                self.reused_count += 1
+            else:
+                self._current[chunk.chunk_id] = content_hash
+                changed.append(chunk)
+
+        return changed
+
+    def removed_ids(self) -> list[str]:
+        """
+        Previous chunk ids that no new chunk matched.
+        """
+
+        return [
+            chunk_id
+            for chunk_ids in self._unmatched.values()
+            for chunk_id in chunk_ids
+        ]
+
+    def to_record(
+        self,
+        document_id: str,
+        filename: str,
+        checksum: str,
+    ) -> DocumentRecord:
+        return DocumentRecord(
+            document_id=document_id,
+            filename=filename,
+            checksum=checksum,
+            chunk_hashes=dict(self._current),
+        )
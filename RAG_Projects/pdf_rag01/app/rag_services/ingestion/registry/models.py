@@ -0,0 +1,32 @@
+"""
+Models for the document registry.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field
+
+
+class DocumentRecord(BaseModel):
+    """
+    What the vector store currently holds for one document.
+    """
+
+    document_id: str
+
+    filename: str
+
+    checksum: str
+
+    # chunk_id (== vector id) -> content hash
+    chunk_hashes: dict[str, str] = Field(default_factory=dict)
+
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.chunk_hashes)
@@ -0,0 +1,158 @@
+"""
+SQLite-backed document registry.
+
+Responsibilities:
+- Store one row per document (id, filename, checksum).
+- Store one row per chunk (chunk id, content hash).
+- Replace a document's chunk rows atomically on save.
+
+All SQLite calls run in a worker thread so the event loop is never
+blocked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+from app.rag_services.ingestion.interfaces.document_registry import (
+    DocumentRegistry,
+)
+from app.rag_services.ingestion.registry.models import DocumentRecord
+
+
+class SqliteDocumentRegistry(DocumentRegistry):
+    """
+    Document registry persisted to a SQLite database.
+    """
+
+    def __init__(
+        self,
+        sqlite_path: Path,
+    ) -> None:
+        sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            sqlite_path,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "document_id TEXT PRIMARY KEY, "
+            "filename TEXT NOT NULL, "
+            "checksum TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS documents_checksum "
+            "ON documents (checksum);"
+            "CREATE TABLE IF NOT EXISTS document_chunks ("
+            "document_id TEXT NOT NULL, "
+            "chunk_id TEXT NOT NULL, "
+            "content_hash TEXT NOT NULL, "
+            "PRIMARY KEY (document_id, chunk_id));"
+        )
+        self._connection.commit()
+
+        logger.info(
+            f"Initialized SQLite document registry at '{sqlite_path}'."
+        )
+
+    async def get_by_checksum(
+        self,
+        checksum: str,
+    ) -> DocumentRecord | None:
+        return await asyncio.to_thread(
+            self._read,
+            "WHERE checksum = ?",
+            checksum,
+        )
+
+    async def get(
+        self,
+        document_id: str,
+    ) -> DocumentRecord | None:
+        return await asyncio.to_thread(
+            self._read,
+            "WHERE document_id = ?",
+            document_id,
+        )
+
+    async def save(
+        self,
+        record: DocumentRecord,
+    ) -> None:
+        await asyncio.to_thread(
+            self._write,
+            record,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _read(
+        self,
+        where: str,
+        value: str,
+    ) -> DocumentRecord | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT document_id, filename, checksum, updated_at "
+                f"FROM documents {where} "
+                "ORDER BY updated_at DESC LIMIT 1",
+                (value,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            document_id, filename, checksum, updated_at = row
+
+            chunk_rows = self._connection.execute(
+                "SELECT chunk_id, content_hash FROM document_chunks "
+                "WHERE document_id = ?",
+                (document_id,),
+            ).fetchall()
+
+        return DocumentRecord(
+            document_id=document_id,
+            filename=filename,
+            checksum=checksum,
+            chunk_hashes=dict(chunk_rows),
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+
+    def _write(
+        self,
+        record: DocumentRecord,
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO documents "
+                "(document_id, filename, checksum, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    record.document_id,
+                    record.filename,
+                    record.checksum,
+                    record.updated_at.isoformat(),
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM document_chunks WHERE document_id = ?",
+                (record.document_id,),
+            )
+            self._connection.executemany(
+                "INSERT INTO document_chunks "
+                "(document_id, chunk_id, content_hash) VALUES (?, ?, ?)",
+                (
+                    (record.document_id, chunk_id, content_hash)
+                    for chunk_id, content_hash in record.chunk_hashes.items()
+                ),
+            )
@@ -0,0 +1,155 @@
+"""
+SQLite-backed parent chunk store.
+
+Responsibilities:
+- Store one row per parent chunk (chunk id, document id, chunk JSON).
+- Fetch many parents in one query.
+- Delete parents that no longer exist in a new document version.
+
+All SQLite calls run in a worker thread so the event loop is never
+blocked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+from loguru import logger
+
+from app.rag_services.ingestion.interfaces.parent_chunk_store import (
+    ParentChunkStore,
+)
+from app.schemas.chunk.chunk import Chunk
+
+
+# Keeps "IN (?, ?, ...)" below SQLite's host parameter limit.
+_MAX_IDS_PER_QUERY = 500
+
+
+class SqliteParentChunkStore(ParentChunkStore):
+    """
+    Parent chunk store persisted to a SQLite database.
+    """
+
+    def __init__(
+        self,
+        sqlite_path: Path,
+    ) -> None:
+        sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            sqlite_path,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS parent_chunks ("
+            "chunk_id TEXT PRIMARY KEY, "
+            "document_id TEXT NOT NULL, "
+            "chunk TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS parent_chunks_document "
+            "ON parent_chunks (document_id);"
+        )
+        self._connection.commit()
+
+        logger.info(
+            f"Initialized SQLite parent chunk store at '{sqlite_path}'."
+        )
+
+    async def save_many(
+        self,
+        chunks: list[Chunk],
+    ) -> None:
+        if chunks:
+            await asyncio.to_thread(
+                self._write,
+                chunks,
+            )
+
+    async def get_many(
+        self,
+        chunk_ids: list[str],
+    ) -> dict[str, Chunk]:
+        if not chunk_ids:
+            return {}
+
+        return await asyncio.to_thread(
+            self._read,
+            chunk_ids,
+        )
+
+    async def delete_many(
+        self,
+        chunk_ids: list[str],
+    ) -> None:
+        if chunk_ids:
+            await asyncio.to_thread(
+                self._delete,
+                chunk_ids,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _write(
+        self,
+        chunks: list[Chunk],
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO parent_chunks "
+                "(chunk_id, document_id, chunk) VALUES (?, ?, ?)",
+                (
+                    (chunk.chunk_id, chunk.document_id, chunk.model_dump_json())
+                    for chunk in chunks
+                ),
+            )
+
+    def _read(
+        self,
+        chunk_ids: list[str],
+    ) -> dict[str, Chunk]:
+        rows: list[tuple[str, str]] = []
+
+        with self._lock:
+            for batch in _batched(chunk_ids):
+                rows.extend(
+                    self._connection.execute(
+                        "SELECT chunk_id, chunk FROM parent_chunks "
+                        f"WHERE chunk_id IN ({_placeholders(batch)})",
+                        batch,
+                    ).fetchall()
+                )
+
+        return {
+            chunk_id: Chunk.model_validate_json(payload)
+            for chunk_id, payload in rows
+        }
+
+    def _delete(
+        self,
+        chunk_ids: list[str],
+    ) -> None:
+        with self._lock, self._connection:
+            for batch in _batched(chunk_ids):
+                self._connection.execute(
+                    "DELETE FROM parent_chunks "
+                    f"WHERE chunk_id IN ({_placeholders(batch)})",
+                    batch,
+                )
+
+
+def _batched(chunk_ids: list[str]) -> list[list[str]]:
+    return [
+        chunk_ids[start:start + _MAX_IDS_PER_QUERY]
+        for start in range(0, len(chunk_ids), _MAX_IDS_PER_QUERY)
+    ]
+
+
+def _placeholders(batch: list[str]) -> str:
+    return ", ".join("?" * len(batch))
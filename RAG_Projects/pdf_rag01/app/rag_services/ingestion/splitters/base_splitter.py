@@ -16,7 +16,6 @@ class BaseSplitter(ABC):
     Abstract interface for chunk splitting strategies.
     """
 
-    @abstractmethod
     def split(
         self,
         *,
@@ -27,6 +26,30 @@ class BaseSplitter(ABC):
         """
         Split an oversized chunk into smaller sub-chunks.
 
+        See split_tokenized().
+        """
+        return [
+            sub_chunk
+            for sub_chunk, _ in self.split_tokenized(
+                chunk=chunk,
+                tokenization=tokenization,
+                chunk_index=chunk_index,
+            )
+        ]
+
+    @abstractmethod
+    def split_tokenized(
+        self,
+        *,
+        chunk: Chunk,
+        tokenization: TokenizationResult,
+        chunk_index: int,
+    ) -> list[tuple[Chunk, TokenizationResult]]:
+        """
+        Split an oversized chunk into smaller sub-chunks, each with its
+        tokenization (a slice of `tokenization`), so callers that split
+        them again need not encode them.
+
         Args:
             chunk:
                 The oversized source chunk.
@@ -38,6 +61,6 @@ class BaseSplitter(ABC):
                 Starting index for the first produced sub-chunk.
 
         Returns:
-            List of sub-chunks. Must not be empty.
+            List of (sub-chunk, tokenization) pairs. Must not be empty.
         """
         raise NotImplementedError
@@ -0,0 +1,307 @@
+"""
+Sentence-boundary-aware chunk splitter.
+
+Splits an oversized chunk into token windows that start and end on
+sentence boundaries.
+
+Algorithm:
+    1. Decode the chunk's token ids once, with the character offset of
+       every token.
+    2. Cut the text into sentences. Whitespace stays with the sentence
+       that follows it, so the pieces join back into the original text.
+       Sentences longer than `max_chunk_tokens` are cut into words, and
+       words longer than that at token boundaries.
+    3. Map each piece's first character onto the token offsets with a
+       binary search. The token index of each piece start is the
+       prefix sum of piece token counts.
+    4. From each window start, binary-search the prefix sums for the
+       last piece that still fits in `max_chunk_tokens`.
+    5. Start the next window `chunk_overlap_sentences` pieces before the
+       end of the previous one, keeping the overlap within
+       `chunk_overlap_tokens`.
+    6. Build sub-chunks via ChunkMapper.from_existing_chunk(). A window's
+       token count is the length of its slice of the token ids, and the
+       slice is handed back with it.
+
+The limits come from the settings unless they are passed in, as the
+parent/child chunker does for its smaller child windows.
+
+Nothing is encoded when the caller's token ids match the chunk text;
+otherwise the text is encoded once. Segmenting is linear in the text
+length; each piece and window costs one binary search. Window text is
+sliced from the original text, never decoded from token ids, so words
+and multi-byte characters are not cut at sentence or word edges.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+
+from loguru import logger
+
+from app.core.config import get_settings
+from app.rag_services.ingestion.interfaces.token_counter import TokenCounter
+from app.rag_services.ingestion.mappers.chunk_mapper import ChunkMapper
+from app.rag_services.ingestion.splitters.base_splitter import BaseSplitter
+from app.rag_services.ingestion.tokenizers.models import TokenizationResult
+from app.schemas.chunk.chunk import Chunk
+
+
+# Whitespace after terminal punctuation, or a blank line.
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+_WORD_BREAK = re.compile(r"\s+")
+
+
+class SentenceSplitter(BaseSplitter):
+    """
+    Splits a chunk into overlapping windows of whole sentences.
+    """
+
+    def __init__(
+        self,
+        token_counter: TokenCounter,
+        max_tokens: int | None = None,
+        overlap_tokens: int | None = None,
+        overlap_sentences: int | None = None,
+    ) -> None:
+        settings = get_settings()
+
+        self._token_counter = token_counter
+        self._max_tokens = (
+            max_tokens
+            if max_tokens is not None
+            else settings.max_chunk_tokens
+        )
+        self._overlap_tokens = (
+            overlap_tokens
+            if overlap_tokens is not None
+            else settings.chunk_overlap_tokens
+        )
+        self._overlap_sentences = (
+            overlap_sentences
+            if overlap_sentences is not None
+            else settings.chunk_overlap_sentences
+        )
+
+    def split_tokenized(
+        self,
+        *,
+        chunk: Chunk,
+        tokenization: TokenizationResult,
+        chunk_index: int,
+    ) -> list[tuple[Chunk, TokenizationResult]]:
+        """
+        Split an oversized chunk into sentence-aligned sub-chunks.
+        """
+
+        text, token_ids, offsets = self._tokens(
+            chunk.indexed_text or chunk.text,
+            tokenization,
+        )
+
+        starts, token_starts = self._segment(
+            text,
+            offsets,
+            self._max_tokens,
+        )
+
+        # Piece boundaries as token and character offsets.
+        token_starts.append(len(token_ids))
+        starts.append(len(text))
+
+        windows = _pack(
+            offsets=token_starts,
+            max_tokens=self._max_tokens,
+            overlap_tokens=self._overlap_tokens,
+            overlap_pieces=self._overlap_sentences,
+        )
+
+        logger.debug(
+            f"Splitting chunk '{chunk.chunk_id}' "
+            f"({len(token_ids)} tokens, {len(starts) - 1} pieces) "
+            f"into {len(windows)} windows."
+        )
+
+        sub_chunks: list[tuple[Chunk, TokenizationResult]] = []
+
+        for offset, (start, end) in enumerate(windows):
+
+            window_ids = token_ids[token_starts[start]:token_starts[end]]
+
+            sub_chunks.append(
+                (
+                    ChunkMapper.from_existing_chunk(
+                        chunk=chunk,
+                        text=text[starts[start]:starts[end]].strip(),
+                        chunk_index=chunk_index + offset,
+                        token_count=len(window_ids),
+                    ),
+                    TokenizationResult(
+                        token_count=len(window_ids),
+                        token_ids=window_ids,
+                    ),
+                )
+            )
+
+        return sub_chunks
+
+    def _tokens(
+        self,
+        text: str,
+        tokenization: TokenizationResult,
+    ) -> tuple[str, list[int], list[int]]:
+        """
+        The text to split, its token ids and their character offsets.
+        Reuses `tokenization` when its ids decode to `text` (give or
+        take surrounding whitespace); encodes `text` otherwise.
+        """
+
+        token_ids = tokenization.token_ids
+
+        if token_ids:
+            try:
+                decoded, offsets = self._token_counter.decode_with_offsets(
+                    token_ids,
+                )
+
+            except ValueError:
+                # The ids end inside a multi-byte character.
+                decoded = None
+
+            if decoded is not None and decoded.strip() == text.strip():
+                return decoded, token_ids, offsets
+
+        logger.debug("Token ids do not match the chunk text; encoding it.")
+
+        token_ids = self._token_counter.tokenize(text).token_ids
+        _, offsets = self._token_counter.decode_with_offsets(token_ids)
+
+        return text, token_ids, offsets
+
+    def _segment(
+        self,
+        text: str,
+        offsets: list[int],
+        max_tokens: int,
+    ) -> tuple[list[int], list[int]]:
+        """
+        Cut `text` into pieces of at most `max_tokens` tokens each.
+        Returns the character offset and the token offset at which each
+        piece starts.
+        """
+
+        starts: list[int] = []
+        token_starts: list[int] = []
+
+        def token_at(position: int) -> int:
+            # Tokens that start before `position`.
+            return bisect_left(offsets, position)
+
+        for start, end in _spans(text, _SENTENCE_BREAK, 0, len(text)):
+
+            first = token_at(start)
+
+            if token_at(end) - first <= max_tokens:
+                starts.append(start)
+                token_starts.append(first)
+                continue
+
+            #
+            # Sentence too long: fall back to words
+            #
+
+            for word_start, word_end in _spans(
+                text,
+                _WORD_BREAK,
+                start,
+                end,
+            ):
+
+                first = token_at(word_start)
+                last = token_at(word_end)
+
+                starts.append(word_start)
+                token_starts.append(first)
+
+                # A single "word" over the limit (a URL, a base64 blob):
+                # nothing left to respect but token offsets.
+                for token in range(first + max_tokens, last, max_tokens):
+                    starts.append(offsets[token])
+                    token_starts.append(token)
+
+        return starts, token_starts
+
+
+def _spans(
+    text: str,
+    pattern: re.Pattern[str],
+    start: int,
+    end: int,
+) -> list[tuple[int, int]]:
+    """
+    Cut `text[start:end]` where `pattern` matches, leaving the matched
+    whitespace at the start of the next span.
+    """
+
+    spans: list[tuple[int, int]] = []
+
+    for match in pattern.finditer(text, start, end):
+
+        if match.start() > start:
+            spans.append((start, match.start()))
+            start = match.start()
+
+    spans.append((start, end))
+
+    return spans
+
+
+def _pack(
+    offsets: list[int],
+    max_tokens: int,
+    overlap_tokens: int,
+    overlap_pieces: int,
+) -> list[tuple[int, int]]:
+    """
+    Windows over pieces, as (start, end) piece ranges. `offsets` is the
+    prefix sum of piece token counts, with a leading 0.
+    """
+
+    last = len(offsets) - 1
+    windows: list[tuple[int, int]] = []
+    start = 0
+
+    while True:
+
+        # Last piece boundary within max_tokens of the start; always at
+        # least one piece.
+        end = max(
+            bisect_right(offsets, offsets[start] + max_tokens, lo=start + 1) - 1,
+            start + 1,
+        )
+
+        windows.append((start, end))
+
+        if end >= last:
+            return windows
+
+        # Repeat up to `overlap_pieces` trailing pieces, as long as they
+        # fit in `overlap_tokens`.
+        next_start = max(
+            end - overlap_pieces,
+            bisect_left(
+                offsets,
+                offsets[end] - overlap_tokens,
+                lo=start + 1,
+                hi=end,
+            ),
+        )
+
+        # Overlap that leaves no room for a new piece is dropped, so
+        # every window moves past the previous one.
+        if offsets[end + 1] - offsets[next_start] > max_tokens:
+            next_start = end
+
+        start = next_start
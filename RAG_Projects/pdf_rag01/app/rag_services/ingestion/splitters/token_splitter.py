@@ -39,13 +39,13 @@ class TokenSplitter(BaseSplitter):
         self._token_counter = token_counter
         self._settings = get_settings()
 
-    def split(
+    def split_tokenized(
         self,
         *,
         chunk: Chunk,
         tokenization: TokenizationResult,
         chunk_index: int,
-    ) -> list[Chunk]:
+    ) -> list[tuple[Chunk, TokenizationResult]]:
         """
         Split an oversized chunk into token-window sub-chunks.
         """
@@ -57,7 +57,7 @@ class TokenSplitter(BaseSplitter):
         step = max_tokens - overlap
 
         token_ids = tokenization.token_ids
-        chunks: list[Chunk] = []
+        chunks: list[tuple[Chunk, TokenizationResult]] = []
         current_index = chunk_index
 
         for start in range(0, len(token_ids), step):
@@ -72,11 +72,17 @@ class TokenSplitter(BaseSplitter):
             )
 
             chunks.append(
-                ChunkMapper.from_existing_chunk(
-                    chunk=chunk,
-                    text=text,
-                    chunk_index=current_index,
-                    token_count=len(window),
+                (
+                    ChunkMapper.from_existing_chunk(
+                        chunk=chunk,
+                        text=text,
+                        chunk_index=current_index,
+                        token_count=len(window),
+                    ),
+                    TokenizationResult(
+                        token_count=len(window),
+                        token_ids=window,
+                    ),
                 )
             )
 
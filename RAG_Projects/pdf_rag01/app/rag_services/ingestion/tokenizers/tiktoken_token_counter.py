@@ -58,6 +58,42 @@ class TiktokenTokenCounter(TokenCounter):
             token_ids=token_ids,
         )
 
+    def tokenize_batch(
+        self,
+        texts: list[str],
+    ) -> list[TokenizationResult]:
+        """
+        Tokenize texts with tiktoken's multi-threaded batch encoder.
+        """
+
+        encoded = self._encoding.encode_batch(texts)
+
+        logger.debug(
+            f"Generated {sum(map(len, encoded))} tokens "
+            f"for {len(texts)} texts."
+        )
+
+        return [
+            TokenizationResult(
+                token_count=len(token_ids),
+                token_ids=token_ids,
+            )
+            for token_ids in encoded
+        ]
+
+    @property
+    def encoding_name(self) -> str:
+        return self._encoding_name
+
+    def decode_with_offsets(
+        self,
+        token_ids: list[int],
+    ) -> tuple[str, list[int]]:
+        """
+        Decode token ids, with the character offset of each token.
+        """
+        return self._encoding.decode_with_offsets(token_ids)
+
     def decode(
         self,
         token_ids: list[int],
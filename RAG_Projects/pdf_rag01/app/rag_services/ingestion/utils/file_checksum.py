@@ -0,0 +1,22 @@
+"""
+File checksum helper shared by loaders and pipelines.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+def compute_file_checksum(file_path: Path) -> str:
+    """
+    Compute the SHA-256 checksum of a file without reading it whole.
+    """
+
+    sha256 = hashlib.sha256()
+
+    with file_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
@@ -67,4 +67,48 @@ class QueryVectorBuilder:
             logger.exception(
                 f"Failed to generate query embeddings: {exc}"
             )
-            raise
\ No newline at end of file
+            raise
+
+    async def build_batch(
+        self,
+        queries: list[str],
+    ) -> list[QueryVector]:
+        """
+        Generate dense and sparse vectors for many queries with one
+        batched call per model.
+        """
+
+        if not queries:
+            return []
+
+        logger.info(
+            f"Generating embeddings for {len(queries)} queries."
+        )
+
+        try:
+            dense_vectors, sparse_vectors = await asyncio.gather(
+                self._dense_embedder.embed_batch(queries),
+                self._sparse_embedder.embed_batch(queries),
+            )
+
+            logger.success(
+                f"Successfully generated embeddings for "
+                f"{len(queries)} queries."
+            )
+
+            return [
+                QueryVector(
+                    dense=dense_vector,
+                    sparse=sparse_vector,
+                )
+                for dense_vector, sparse_vector in zip(
+                    dense_vectors,
+                    sparse_vectors,
+                )
+            ]
+
+        except Exception as exc:
+            logger.exception(
+                f"Failed to generate batch query embeddings: {exc}"
+            )
+            raise
@@ -0,0 +1,96 @@
+"""
+Vector repository decorator that keeps the retrieval cache fresh.
+
+Responsibilities:
+- Wrap another VectorStoreRepository.
+- Invalidate the RetrievalCache namespace after every upsert / delete.
+- Delegate reads unchanged.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.infrastructure.vector_db.base import VectorStoreRepository
+from app.infrastructure.vector_db.models import (
+    DeleteResponse,
+    QueryResult,
+    QueryVector,
+    UpsertResponse,
+    VectorDocument,
+    VectorDocumentBatch,
+)
+from app.rag_services.retrieval.cache.retrieval_cache import RetrievalCache
+
+
+class CacheInvalidatingRepository(VectorStoreRepository):
+    """
+    Invalidates cached retrievals when vectors change.
+    """
+
+    def __init__(
+        self,
+        repository: VectorStoreRepository,
+        cache: RetrievalCache,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    @property
+    def repository(self) -> VectorStoreRepository:
+        """
+        Return the wrapped repository.
+        """
+        return self._repository
+
+    async def upsert(
+        self,
+        vectors: list[VectorDocument] | VectorDocumentBatch,
+        namespace: str | None = None,
+    ) -> UpsertResponse:
+        try:
+            return await self._repository.upsert(vectors, namespace)
+        finally:
+            self._cache.invalidate(namespace)
+
+    async def query(
+        self,
+        vector: QueryVector,
+        top_k: int = 5,
+        namespace: str | None = None,
+        metadata_filter: dict[str, Any] | None = None,
+        include_values: bool = False,
+    ) -> list[QueryResult]:
+        return await self._repository.query(
+            vector=vector,
+            top_k=top_k,
+            namespace=namespace,
+            metadata_filter=metadata_filter,
+            include_values=include_values,
+        )
+
+    async def delete(
+        self,
+        ids: list[str],
+        namespace: str | None = None,
+    ) -> DeleteResponse:
+        try:
+            return await self._repository.delete(ids, namespace)
+        finally:
+            self._cache.invalidate(namespace)
+
+    async def delete_all(
+        self,
+        namespace: str | None = None,
+    ) -> DeleteResponse:
+        try:
+            return await self._repository.delete_all(namespace)
+        finally:
+            self._cache.invalidate(namespace)
+
+    async def fetch(
+        self,
+        ids: list[str],
+        namespace: str | None = None,
+    ) -> list[VectorDocument]:
+        return await self._repository.fetch(ids, namespace)
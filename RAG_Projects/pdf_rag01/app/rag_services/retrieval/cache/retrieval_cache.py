@@ -0,0 +1,360 @@
+"""
+Two-tier retrieval result cache.
+
+Responsibilities:
+- Exact tier: look up the normalized query text.
+- Semantic tier: match the dense query vector against recent queries
+  by cosine similarity above a threshold.
+- Expire entries after a TTL and cap the cache with LRU eviction.
+- Invalidate every entry of a namespace when its vectors change.
+- Track hit / miss counters and the retrieval time saved.
+
+Entries are scoped by every request field except the query text
+(namespace, top_k, filter, fusion settings), so a query only ever
+reuses results retrieved under the same parameters.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+from loguru import logger
+from pydantic import BaseModel, computed_field
+
+from app.rag_services.retrieval.models.retrieval_request import (
+    RetrievalRequest,
+)
+from app.rag_services.retrieval.models.retrieval_result import (
+    RetrievalContext,
+)
+
+
+class RetrievalCacheStats(BaseModel):
+    """
+    Snapshot of the retrieval cache counters.
+    """
+
+    exact_hits: int = 0
+
+    semantic_hits: int = 0
+
+    misses: int = 0
+
+    invalidations: int = 0
+
+    entries: int = 0
+
+    latency_saved_ms: float = 0.0
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.exact_hits + self.semantic_hits + self.misses
+        if not lookups:
+            return 0.0
+        return (self.exact_hits + self.semantic_hits) / lookups
+
+
+@dataclass(slots=True)
+class _Entry:
+    scope: str
+    namespace: str
+    context: RetrievalContext
+    expires_at: float
+    slot: int | None = None
+
+
+class RetrievalCache:
+    """
+    In-process LRU of retrieval results with a semantic second tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        similarity_threshold: float | None = 0.95,
+    ) -> None:
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._similarity_threshold = similarity_threshold
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+        # Semantic tier: one unit-length query vector per slot. Slots of
+        # other scopes, expired or free entries are masked out by scope id.
+        self._vectors: np.ndarray | None = None
+        self._slot_keys: list[str | None] = [None] * max_entries
+        self._slot_scopes = np.full(max_entries, -1, dtype=np.int64)
+        self._free_slots = list(range(max_entries - 1, -1, -1))
+        self._scope_ids: dict[str, int] = {}
+
+        # Bumped on invalidation so results retrieved before a write are
+        # not stored after it.
+        self._generations: dict[str, int] = {}
+
+        self._exact_hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._latency_saved = 0.0
+
+        # Moving average of a full retrieval, used to estimate savings.
+        self._miss_latency: float | None = None
+
+    def generation(
+        self,
+        request: RetrievalRequest,
+    ) -> int:
+        """
+        Return the namespace generation to pass to put().
+        """
+
+        return self._generations.get(request.namespace or "", 0)
+
+    def get(
+        self,
+        request: RetrievalRequest,
+        normalized_query: str,
+    ) -> RetrievalContext | None:
+        """
+        Exact-tier lookup by normalized query text.
+        """
+
+        key = self._key(_scope(request), normalized_query)
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        self._exact_hits += 1
+        self._record_saving()
+
+        logger.debug(
+            f"Retrieval cache exact hit for '{normalized_query}'."
+        )
+
+        return entry.context
+
+    def get_similar(
+        self,
+        request: RetrievalRequest,
+        dense_vector: list[float],
+    ) -> RetrievalContext | None:
+        """
+        Semantic-tier lookup by cosine similarity of query vectors.
+
+        Counts a miss when nothing is close enough.
+        """
+
+        if self._similarity_threshold is None or self._vectors is None:
+            self._misses += 1
+            return None
+
+        scope_id = self._scope_ids.get(_scope(request))
+
+        slots = (
+            np.flatnonzero(self._slot_scopes == scope_id)
+            if scope_id is not None
+            else np.empty(0, dtype=np.int64)
+        )
+
+        if len(slots):
+            query = _unit(dense_vector)
+
+            if query.shape[0] == self._vectors.shape[1]:
+                scores = self._vectors[slots] @ query
+                best = int(np.argmax(scores))
+
+                if scores[best] >= self._similarity_threshold:
+                    key = self._slot_keys[slots[best]]
+                    entry = self._entries[key]
+
+                    if entry.expires_at > time.monotonic():
+                        self._entries.move_to_end(key)
+                        self._semantic_hits += 1
+                        self._record_saving()
+
+                        logger.debug(
+                            f"Retrieval cache semantic hit "
+                            f"(similarity={scores[best]:.4f})."
+                        )
+
+                        return entry.context
+
+                    self._remove(key)
+
+        self._misses += 1
+        return None
+
+    def put(
+        self,
+        request: RetrievalRequest,
+        normalized_query: str,
+        dense_vector: list[float] | None,
+        context: RetrievalContext,
+        elapsed_seconds: float,
+        generation: int,
+    ) -> None:
+        """
+        Store a freshly retrieved result.
+
+        Skipped when the namespace was invalidated after `generation`
+        was taken.
+        """
+
+        self._miss_latency = (
+            elapsed_seconds
+            if self._miss_latency is None
+            else 0.9 * self._miss_latency + 0.1 * elapsed_seconds
+        )
+
+        if generation != self.generation(request):
+            return
+
+        scope = _scope(request)
+        key = self._key(scope, normalized_query)
+
+        if key in self._entries:
+            self._remove(key)
+
+        while len(self._entries) >= self._max_entries:
+            self._remove(next(iter(self._entries)))
+
+        entry = _Entry(
+            scope=scope,
+            namespace=request.namespace or "",
+            context=context,
+            expires_at=time.monotonic() + self._ttl_seconds,
+        )
+
+        if self._similarity_threshold is not None and dense_vector:
+            self._store_vector(key, entry, dense_vector)
+
+        self._entries[key] = entry
+
+    def invalidate(
+        self,
+        namespace: str | None,
+    ) -> None:
+        """
+        Drop every entry retrieved from `namespace`.
+        """
+
+        namespace = namespace or ""
+
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.namespace == namespace
+        ]
+
+        for key in stale:
+            self._remove(key)
+
+        if stale:
+            self._invalidations += 1
+
+            logger.info(
+                f"Invalidated {len(stale)} cached retrievals for "
+                f"namespace '{namespace}'."
+            )
+
+    def stats(self) -> RetrievalCacheStats:
+        """
+        Return the current hit / miss counters.
+        """
+
+        return RetrievalCacheStats(
+            exact_hits=self._exact_hits,
+            semantic_hits=self._semantic_hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            entries=len(self._entries),
+            latency_saved_ms=self._latency_saved * 1000,
+        )
+
+    def _store_vector(
+        self,
+        key: str,
+        entry: _Entry,
+        dense_vector: list[float],
+    ) -> None:
+        vector = _unit(dense_vector)
+
+        if self._vectors is None:
+            self._vectors = np.zeros(
+                (self._max_entries, vector.shape[0]),
+                dtype=np.float32,
+            )
+
+        if vector.shape[0] != self._vectors.shape[1]:
+            return
+
+        slot = self._free_slots.pop()
+
+        self._vectors[slot] = vector
+        self._slot_keys[slot] = key
+        self._slot_scopes[slot] = self._scope_ids.setdefault(
+            entry.scope,
+            len(self._scope_ids),
+        )
+
+        entry.slot = slot
+
+    def _remove(
+        self,
+        key: str,
+    ) -> None:
+        entry = self._entries.pop(key)
+
+        if entry.slot is not None:
+            self._slot_keys[entry.slot] = None
+            self._slot_scopes[entry.slot] = -1
+            self._free_slots.append(entry.slot)
+
+    def _record_saving(self) -> None:
+        if self._miss_latency is not None:
+            self._latency_saved += self._miss_latency
+
+    @staticmethod
+    def _key(
+        scope: str,
+        normalized_query: str,
+    ) -> str:
+        return hashlib.sha256(
+            f"{scope}\x00{normalized_query}".encode("utf-8")
+        ).hexdigest()
+
+
+def _scope(request: RetrievalRequest) -> str:
+    return json.dumps(
+        request.model_dump(mode="json", exclude={"query"}),
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _unit(values: list[float]) -> np.ndarray:
+    vector = np.asarray(values, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm:
+        vector = vector / norm
+    return vector
@@ -0,0 +1,121 @@
+"""
+Maximal Marginal Relevance (MMR) selection.
+
+Responsibilities:
+- Pick `top_k` of the over-fetched candidates, trading relevance to the
+  query against similarity to the chunks already picked.
+- Do it with one candidate-similarity matrix and an incrementally
+  updated "closest picked chunk" vector, so each step is O(n).
+
+    score(d) = lambda * sim(q, d) - (1 - lambda) * max sim(d, picked)
+
+lambda = 1 is plain relevance order; lower values favour diversity.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from loguru import logger
+
+from app.infrastructure.vector_db.models import QueryResult
+
+
+class MmrSelector:
+    """
+    Selects a diverse subset of retrieval candidates.
+    """
+
+    def __init__(
+        self,
+        over_fetch: int = 4,
+    ) -> None:
+
+        if over_fetch < 1:
+            raise ValueError("over_fetch must be at least 1.")
+
+        self.over_fetch = over_fetch
+
+    def select(
+        self,
+        query_vector: list[float],
+        candidates: list[QueryResult],
+        top_k: int,
+        lambda_mult: float,
+    ) -> list[QueryResult]:
+        """
+        Return up to `top_k` candidates in MMR order.
+
+        Candidates must carry their dense vectors (include_values=True);
+        otherwise the first `top_k` are returned unchanged.
+        """
+
+        if len(candidates) <= 1:
+            return candidates[:top_k]
+
+        if any(candidate.dense_vector is None for candidate in candidates):
+            logger.warning(
+                "Candidates have no dense vectors; skipping MMR selection."
+            )
+            return candidates[:top_k]
+
+        matrix = _unit_rows(
+            np.asarray(
+                [candidate.dense_vector.values for candidate in candidates],
+                dtype=np.float32,
+            )
+        )
+        query = _unit_rows(
+            np.asarray(query_vector, dtype=np.float32)[np.newaxis, :]
+        )[0]
+
+        relevance = matrix @ query
+        similarity = matrix @ matrix.T
+
+        picked = _select_rows(
+            relevance=relevance,
+            similarity=similarity,
+            top_k=min(top_k, len(candidates)),
+            lambda_mult=lambda_mult,
+        )
+
+        logger.debug(
+            f"MMR picked {len(picked)} of {len(candidates)} candidates "
+            f"(lambda={lambda_mult})."
+        )
+
+        return [candidates[row] for row in picked]
+
+
+def _select_rows(
+    relevance: np.ndarray,
+    similarity: np.ndarray,
+    top_k: int,
+    lambda_mult: float,
+) -> list[int]:
+    """
+    Greedy MMR over precomputed relevance and similarity matrices.
+    """
+
+    available = np.ones(len(relevance), dtype=bool)
+    closest_picked = np.full(len(relevance), -np.inf, dtype=np.float32)
+
+    picked: list[int] = []
+
+    for _ in range(top_k):
+        redundancy = np.where(np.isfinite(closest_picked), closest_picked, 0.0)
+
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[~available] = -np.inf
+
+        row = int(np.argmax(scores))
+
+        picked.append(row)
+        available[row] = False
+        closest_picked = np.maximum(closest_picked, similarity[row])
+
+    return picked
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
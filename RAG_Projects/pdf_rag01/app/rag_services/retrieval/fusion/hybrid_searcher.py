@@ -0,0 +1,209 @@
+"""
+Hybrid dense + sparse candidate search.
+
+Responsibilities:
+- Run the vector search for a request's FusionMode.
+- For convex / RRF fusion, run dense-only and sparse-only searches
+  concurrently, each over-fetching `top_k * over_fetch` candidates.
+- Merge the two candidate lists with vectorized NumPy scoring.
+
+Fusion happens here rather than inside the vector store, so the same
+weights work with every VectorStoreRepository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+from loguru import logger
+
+from app.infrastructure.vector_db.base import VectorStoreRepository
+from app.infrastructure.vector_db.models import QueryResult
+from app.rag_services.retrieval.models.fusion import FusionMode
+from app.rag_services.retrieval.models.query_vector import QueryVector
+from app.rag_services.retrieval.models.retrieval_request import (
+    RetrievalRequest,
+)
+
+
+class HybridSearcher:
+    """
+    Runs single, hybrid or fused candidate searches.
+    """
+
+    def __init__(
+        self,
+        vector_repository: VectorStoreRepository,
+        over_fetch: int = 4,
+        rrf_k: int = 60,
+    ) -> None:
+
+        if over_fetch < 1:
+            raise ValueError("over_fetch must be at least 1.")
+
+        self._vector_repository = vector_repository
+        self._over_fetch = over_fetch
+        self._rrf_k = rrf_k
+
+    async def search(
+        self,
+        request: RetrievalRequest,
+        query_vector: QueryVector,
+        top_k: int | None = None,
+        include_values: bool = False,
+    ) -> list[QueryResult]:
+        """
+        Return the best `top_k` (default `request.top_k`) results.
+        """
+
+        top_k = top_k or request.top_k
+        mode = request.fusion_mode
+
+        if mode is FusionMode.NATIVE:
+            return await self._query(
+                request,
+                query_vector,
+                top_k,
+                include_values,
+            )
+
+        if mode is FusionMode.DENSE:
+            return await self._query(
+                request,
+                QueryVector(dense=query_vector.dense),
+                top_k,
+                include_values,
+            )
+
+        if mode is FusionMode.SPARSE:
+            return _sparse_matches(
+                await self._query(
+                    request,
+                    QueryVector(sparse=query_vector.sparse),
+                    top_k,
+                    include_values,
+                )
+            )
+
+        candidates = top_k * self._over_fetch
+
+        dense_results, sparse_results = await asyncio.gather(
+            self._query(
+                request,
+                QueryVector(dense=query_vector.dense),
+                candidates,
+                include_values,
+            ),
+            self._query(
+                request,
+                QueryVector(sparse=query_vector.sparse),
+                candidates,
+                include_values,
+            ),
+        )
+
+        sparse_results = _sparse_matches(sparse_results)
+
+        logger.debug(
+            f"Fusing {len(dense_results)} dense and "
+            f"{len(sparse_results)} sparse candidates ({mode})."
+        )
+
+        return self._fuse(
+            dense_results=dense_results,
+            sparse_results=sparse_results,
+            mode=mode,
+            alpha=request.alpha,
+            top_k=top_k,
+        )
+
+    async def _query(
+        self,
+        request: RetrievalRequest,
+        query_vector: QueryVector,
+        top_k: int,
+        include_values: bool,
+    ) -> list[QueryResult]:
+        return await self._vector_repository.query(
+            vector=query_vector,
+            top_k=top_k,
+            namespace=request.namespace,
+            metadata_filter=request.metadata_filter,
+            include_values=include_values,
+        )
+
+    def _fuse(
+        self,
+        dense_results: list[QueryResult],
+        sparse_results: list[QueryResult],
+        mode: FusionMode,
+        alpha: float,
+        top_k: int,
+    ) -> list[QueryResult]:
+
+        # Union of candidates; each list is already in rank order.
+        by_id: dict[str, QueryResult] = {}
+        for result in (*dense_results, *sparse_results):
+            by_id.setdefault(result.id, result)
+
+        if not by_id:
+            return []
+
+        position = {vector_id: index for index, vector_id in enumerate(by_id)}
+
+        dense_rows = np.fromiter(
+            (position[result.id] for result in dense_results),
+            dtype=np.int64,
+            count=len(dense_results),
+        )
+        sparse_rows = np.fromiter(
+            (position[result.id] for result in sparse_results),
+            dtype=np.int64,
+            count=len(sparse_results),
+        )
+
+        fused = np.zeros(len(by_id), dtype=np.float64)
+
+        if mode is FusionMode.RRF:
+            fused[dense_rows] += alpha / (
+                self._rrf_k + np.arange(1, len(dense_rows) + 1)
+            )
+            fused[sparse_rows] += (1 - alpha) / (
+                self._rrf_k + np.arange(1, len(sparse_rows) + 1)
+            )
+        else:
+            fused[dense_rows] += alpha * _min_max(
+                np.array([result.score for result in dense_results])
+            )
+            fused[sparse_rows] += (1 - alpha) * _min_max(
+                np.array([result.score for result in sparse_results])
+            )
+
+        order = np.argsort(-fused, kind="stable")[:top_k]
+
+        results = list(by_id.values())
+
+        return [
+            results[row].model_copy(update={"score": float(fused[row])})
+            for row in order
+        ]
+
+
+def _sparse_matches(results: list[QueryResult]) -> list[QueryResult]:
+    # A sparse-only query still returns rows that share no terms with
+    # the query (score 0); they are not matches.
+    return [result for result in results if result.score > 0]
+
+
+def _min_max(scores: np.ndarray) -> np.ndarray:
+    if not len(scores):
+        return scores
+
+    low = scores.min()
+    spread = scores.max() - low
+
+    if spread <= 0:
+        return np.ones_like(scores)
+
+    return (scores - low) / spread
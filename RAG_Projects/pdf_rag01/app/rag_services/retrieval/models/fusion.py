@@ -0,0 +1,18 @@
+from enum import StrEnum
+
+
+class FusionMode(StrEnum):
+    """
+    How dense and sparse retrieval are combined.
+
+    - native: one hybrid query; the vector store weights both parts.
+    - convex: alpha * dense + (1 - alpha) * sparse, on min-max scaled scores.
+    - rrf: Reciprocal Rank Fusion, each list weighted by alpha / 1 - alpha.
+    - dense / sparse: a single modality.
+    """
+
+    NATIVE = "native"
+    CONVEX = "convex"
+    RRF = "rrf"
+    DENSE = "dense"
+    SPARSE = "sparse"
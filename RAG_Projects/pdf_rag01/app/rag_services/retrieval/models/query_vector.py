@@ -7,7 +7,8 @@ class QueryVector(BaseModel):
     Represents the vectorized form of a query.
 
     This model is provider-independent and is consumed by
-    the retrieval pipeline.
+    the retrieval pipeline. Either part may be left out for a
+    dense-only or sparse-only search.
     """
-    dense: DenseVector
-    sparse: SparseVector
\ No newline at end of file
+    dense: DenseVector | None = None
+    sparse: SparseVector | None = None
\ No newline at end of file
@@ -2,6 +2,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.rag_services.retrieval.models.fusion import FusionMode
+
 
 class RetrievalRequest(BaseModel):
     """
@@ -33,4 +35,26 @@ class RetrievalRequest(BaseModel):
     metadata_filter: dict[str, Any] | None = Field(
         default=None,
         description="Optional metadata filter.",
-    )
\ No newline at end of file
+    )
+
+    fusion_mode: FusionMode = Field(
+        default=FusionMode.NATIVE,
+        description="How dense and sparse results are combined.",
+    )
+
+    alpha: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Dense weight for convex and RRF fusion.",
+    )
+
+    mmr_lambda: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Enable MMR diversity selection. 1 favours relevance, "
+            "0 favours diversity."
+        ),
+    )
@@ -0,0 +1,127 @@
+"""
+Small-to-big parent resolution.
+
+Responsibilities:
+- Replace matched child chunks with their parent chunk.
+- Fetch all parents of a result list in one store lookup.
+- Deduplicate: several children of one parent become a single result
+  at the position and score of the best-ranked child.
+
+Results without a `parent_chunk_id` (flat chunks) pass through
+unchanged, as do children whose parent is missing from the store.
+"""
+
+from __future__ import annotations
+
+from loguru import logger
+
+from app.rag_services.ingestion.interfaces.parent_chunk_store import (
+    ParentChunkStore,
+)
+from app.rag_services.retrieval.models.retrieval_result import (
+    RetrievalResult,
+)
+
+
+class ParentDocumentResolver:
+    """
+    Swaps child results for their deduplicated parent chunks.
+    """
+
+    def __init__(
+        self,
+        parent_store: ParentChunkStore,
+    ) -> None:
+        self._parent_store = parent_store
+
+    async def resolve(
+        self,
+        results: list[RetrievalResult],
+    ) -> list[RetrievalResult]:
+        """
+        Return results with children replaced by their parents.
+
+        Expects `results` in rank order.
+        """
+
+        parent_ids = list(
+            dict.fromkeys(
+                result.metadata["parent_chunk_id"]
+                for result in results
+                if result.metadata.get("parent_chunk_id")
+            )
+        )
+
+        if not parent_ids:
+            return results
+
+        parents = await self._parent_store.get_many(parent_ids)
+
+        resolved: list[RetrievalResult] = []
+
+        # parent id -> position of its result in `resolved`
+        positions: dict[str, int] = {}
+
+        for result in results:
+
+            parent_id = result.metadata.get("parent_chunk_id")
+            parent = parents.get(parent_id) if parent_id else None
+
+            if parent is None:
+                resolved.append(result)
+                continue
+
+            position = positions.get(parent_id)
+
+            if position is not None:
+                merged = resolved[position]
+                resolved[position] = merged.model_copy(
+                    update={
+                        "metadata": {
+                            **merged.metadata,
+                            "child_chunk_ids": [
+                                *merged.metadata["child_chunk_ids"],
+                                result.chunk_id,
+                            ],
+                        },
+                    }
+                )
+                continue
+
+            positions[parent_id] = len(resolved)
+
+            child_metadata = {
+                key: value
+                for key, value in result.metadata.items()
+                if key != "parent_chunk_id"
+            }
+
+            resolved.append(
+                RetrievalResult(
+                    chunk_id=parent.chunk_id,
+                    text=parent.text,
+                    score=result.score,
+                    metadata={
+                        **child_metadata,
+                        **parent.metadata.model_dump(exclude_none=True),
+                        "document_id": parent.document_id,
+                        "text": parent.text,
+                        "child_chunk_ids": [result.chunk_id],
+                    },
+                )
+            )
+
+        missing = len(parent_ids) - len(parents)
+
+        if missing:
+            logger.warning(
+                f"{missing} parent chunks were not found in the parent "
+                "store; returning their children instead."
+            )
+
+        logger.info(
+            f"Resolved {len(results)} results to {len(resolved)} "
+            f"({len(positions)} parents)."
+        )
+
+        return resolved
@@ -1,12 +1,19 @@
+import asyncio
 import time
 
 from loguru import logger
 
-from app.infrastructure.vector_db.pinecone_repository import VectorStoreRepository
+from app.infrastructure.vector_db.base import VectorStoreRepository
 
 from app.rag_services.retrieval.builders.query_vector_builder import (
     QueryVectorBuilder,
 )
+from app.rag_services.retrieval.cache.retrieval_cache import RetrievalCache
+from app.rag_services.retrieval.diversity.mmr_selector import MmrSelector
+from app.rag_services.retrieval.fusion.hybrid_searcher import HybridSearcher
+from app.rag_services.retrieval.parents.parent_document_resolver import (
+    ParentDocumentResolver,
+)
 from app.rag_services.retrieval.interfaces.query_preprocessor import (
     QueryPreprocessor,
 )
@@ -14,8 +21,9 @@ from app.rag_services.retrieval.models.retrieval_request import (
     RetrievalRequest,
 )
 from app.rag_services.retrieval.models.retrieval_result import (
-    RetrievalResult,
+    RetrievalContext,
 )
+from app.rag_services.retrieval.models.query_vector import QueryVector
 from app.rag_services.retrieval.models.llm_context import (
     LLMContext
 )
@@ -34,6 +42,15 @@ class RetrievalPipeline:
         - Generate query embeddings
         - Query the vector database
         - Convert repository models into retrieval models
+
+    `retrieve_batch` embeds many queries with one model call per
+    embedder and runs their vector searches concurrently.
+
+    With a RetrievalCache, exact repeats skip embedding and search, and
+    near-duplicate queries skip the search.
+
+    With a ParentDocumentResolver, matched child chunks are returned as
+    their (deduplicated) parent chunks.
     """
 
     def __init__(
@@ -44,6 +61,10 @@ class RetrievalPipeline:
         retrieval_result_mapper: RetrievalResultMapper,
         reranker: Reranker,
         context_builder: ContextBuilder,
+        cache: RetrievalCache | None = None,
+        hybrid_searcher: HybridSearcher | None = None,
+        mmr_selector: MmrSelector | None = None,
+        parent_resolver: ParentDocumentResolver | None = None,
     ) -> None:
         self._query_preprocessor = query_preprocessor
         self._query_vector_builder = query_vector_builder
@@ -51,11 +72,17 @@ class RetrievalPipeline:
         self._retrieval_result_mapper = retrieval_result_mapper
         self._reranker = reranker
         self._context_builder = context_builder
+        self._cache = cache
+        self._hybrid_searcher = hybrid_searcher or HybridSearcher(
+            vector_repository,
+        )
+        self._mmr_selector = mmr_selector or MmrSelector()
+        self._parent_resolver = parent_resolver
 
     async def retrieve(
         self,
         request: RetrievalRequest,
-    ) -> list[RetrievalResult]:
+    ) -> RetrievalContext:
 
         logger.info(
             f"Starting retrieval for query: '{request.query}'"
@@ -77,6 +104,11 @@ class RetrievalPipeline:
                 f"Normalized query: '{normalized_query}'"
             )
 
+            if self._cache is not None:
+                cached = self._cache.get(request, normalized_query)
+                if cached is not None:
+                    return cached
+
             # --------------------------------------------------
             # Step 2 : Generate query vectors
             # --------------------------------------------------
@@ -86,53 +118,228 @@ class RetrievalPipeline:
             )
 
             # --------------------------------------------------
-            # Step 3 : Query vector database
+            # Step 3 : Search, map and rerank
             # --------------------------------------------------
 
-            query_results = await self._vector_repository.query(
-                vector= query_vector,
-                top_k=request.top_k,
-                namespace=request.namespace,
-                metadata_filter=request.metadata_filter,
+            retrieval_context = await self._search(
+                request=request,
+                normalized_query=normalized_query,
+                query_vector=query_vector,
             )
 
-            logger.info(
-                f"Retrieved {len(query_results)} chunks from vector database."
+        except Exception as exc:
+            logger.exception(
+                f"Retrieval pipeline failed: {exc}"
             )
+            raise
 
-            retrieval_results = self._retrieval_result_mapper.map_many(
-                query_results
-            )
+        elapsed = time.perf_counter() - started_at
+        logger.success(
+            f"Retrieval completed successfully in "
+            f"{elapsed:.3f} seconds."
+        )
 
+        return retrieval_context
 
-            logger.info(
-                f"Retrieved {len(retrieval_results)} chunks before reranking."
-            )
+    async def retrieve_batch(
+        self,
+        requests: list[RetrievalRequest],
+        max_concurrency: int = 8,
+    ) -> list[RetrievalContext]:
+        """
+        Retrieve results for many queries.
+
+        Results are returned in the order of `requests`. Identical
+        queries (after normalization) are embedded once.
+        """
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        if not requests:
+            return []
+
+        logger.info(
+            f"Starting batch retrieval for {len(requests)} queries."
+        )
+
+        started_at = time.perf_counter()
+
+        try:
+
+            # --------------------------------------------------
+            # Step 1 : Normalize queries
+            # --------------------------------------------------
 
-            elapsed = time.perf_counter() - started_at
-            logger.success(
-                f"Retrieval completed successfully in "
-                f"{elapsed:.3f} seconds."
+            normalized_queries = await asyncio.gather(
+                *(
+                    self._query_preprocessor.preprocess(request.query)
+                    for request in requests
+                )
             )
 
-            reranked_results = await self._reranker.rerank(
-                query=normalized_query,
-                results=retrieval_results,
+            cached_contexts = [
+                self._cache.get(request, normalized_query)
+                if self._cache is not None
+                else None
+                for request, normalized_query in zip(
+                    requests,
+                    normalized_queries,
+                )
+            ]
+
+            # --------------------------------------------------
+            # Step 2 : Generate query vectors in one batch
+            # --------------------------------------------------
+
+            unique_queries = list(
+                dict.fromkeys(
+                    normalized_query
+                    for normalized_query, cached in zip(
+                        normalized_queries,
+                        cached_contexts,
+                    )
+                    if cached is None
+                )
             )
 
-            logger.success(
-                f"Returning {len(reranked_results)} chunks after reranking."
+            query_vectors = dict(
+                zip(
+                    unique_queries,
+                    await self._query_vector_builder.build_batch(
+                        unique_queries
+                    ),
+                )
             )
 
-        
-            # llm_context = await self._context_builder.build(
-            #     reranked_results
-            # )
+            # --------------------------------------------------
+            # Step 3 : Fan out vector searches
+            # --------------------------------------------------
+
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def search(
+                request: RetrievalRequest,
+                normalized_query: str,
+                cached: RetrievalContext | None,
+            ) -> RetrievalContext:
+                if cached is not None:
+                    return cached
+
+                async with semaphore:
+                    return await self._search(
+                        request=request,
+                        normalized_query=normalized_query,
+                        query_vector=query_vectors[normalized_query],
+                    )
 
-            # return llm_context
+            retrieval_contexts = await asyncio.gather(
+                *(
+                    search(request, normalized_query, cached)
+                    for request, normalized_query, cached in zip(
+                        requests,
+                        normalized_queries,
+                        cached_contexts,
+                    )
+                )
+            )
 
         except Exception as exc:
             logger.exception(
-                f"Retrieval pipeline failed: {exc}"
+                f"Batch retrieval pipeline failed: {exc}"
+            )
+            raise
+
+        elapsed = time.perf_counter() - started_at
+        logger.success(
+            f"Batch retrieval of {len(requests)} queries "
+            f"({len(unique_queries)} embedded) completed in "
+            f"{elapsed:.3f} seconds."
+        )
+
+        return list(retrieval_contexts)
+
+    async def _search(
+        self,
+        request: RetrievalRequest,
+        normalized_query: str,
+        query_vector: QueryVector,
+    ) -> RetrievalContext:
+
+        if self._cache is not None:
+            cached = self._cache.get_similar(
+                request,
+                query_vector.dense.values,
+            )
+            if cached is not None:
+                return cached
+
+            generation = self._cache.generation(request)
+
+        started_at = time.perf_counter()
+
+        diversify = (
+            request.mmr_lambda is not None
+            and query_vector.dense is not None
+        )
+
+        # MMR needs a wider pool and the stored vectors to compare.
+        query_results = await self._hybrid_searcher.search(
+            request=request,
+            query_vector=query_vector,
+            top_k=(
+                request.top_k * self._mmr_selector.over_fetch
+                if diversify
+                else None
+            ),
+            include_values=diversify,
+        )
+
+        logger.info(
+            f"Retrieved {len(query_results)} chunks from vector database."
+        )
+
+        if diversify:
+            query_results = self._mmr_selector.select(
+                query_vector=query_vector.dense.values,
+                candidates=query_results,
+                top_k=request.top_k,
+                lambda_mult=request.mmr_lambda,
+            )
+
+        retrieval_results = self._retrieval_result_mapper.map_many(
+            query_results
+        )
+
+        reranked_results = await self._reranker.rerank(
+            query=normalized_query,
+            results=retrieval_results,
+        )
+
+        # Children are ranked first, so the parent takes the best
+        # child's position.
+        if self._parent_resolver is not None:
+            reranked_results = await self._parent_resolver.resolve(
+                reranked_results,
             )
-            raise
\ No newline at end of file
+
+        logger.success(
+            f"Returning {len(reranked_results)} chunks after reranking."
+        )
+
+        retrieval_context = RetrievalContext(
+            results=reranked_results,
+            total_results=len(reranked_results),
+        )
+
+        if self._cache is not None:
+            self._cache.put(
+                request=request,
+                normalized_query=normalized_query,
+                dense_vector=query_vector.dense.values,
+                context=retrieval_context,
+                elapsed_seconds=time.perf_counter() - started_at,
+                generation=generation,
+            )
+
+        return retrieval_context
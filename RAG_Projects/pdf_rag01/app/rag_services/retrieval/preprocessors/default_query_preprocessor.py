@@ -65,7 +65,7 @@ class DefaultQueryPreprocessor(QueryPreprocessor):
 
             return normalized_query
 
-        except ValidationException:
+        except ValidationError:
             raise
 
         except Exception as exc:
@@ -0,0 +1,172 @@
+"""
+Cross-encoder reranker.
+
+Responsibilities:
+- Score every (query, chunk) pair in one batched model call.
+- Cache pair scores by (query hash, chunk_id) so repeated queries only
+  score chunks they have not seen.
+- Reorder results by cross-encoder score.
+- Fall back to vector order when scoring exceeds the latency budget.
+
+A scoring call that overruns the budget is left to finish in the
+background and still fills the cache for the next request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
+import numpy as np
+from loguru import logger
+
+from app.infrastructure.rerankers.interfaces.cross_encoder import (
+    CrossEncoder,
+)
+from app.rag_services.retrieval.interfaces.reranker import (
+    Reranker,
+)
+from app.rag_services.retrieval.models.retrieval_result import (
+    RetrievalResult,
+)
+
+
+class CrossEncoderReranker(Reranker):
+    """
+    Reranks retrieval results with a cross-encoder.
+    """
+
+    def __init__(
+        self,
+        cross_encoder: CrossEncoder,
+        latency_budget_ms: float | None = None,
+        cache_max_entries: int = 10_000,
+    ) -> None:
+        self._cross_encoder = cross_encoder
+        self._latency_budget = (
+            latency_budget_ms / 1000
+            if latency_budget_ms is not None
+            else None
+        )
+        self._cache_max_entries = cache_max_entries
+
+        self._scores: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    async def rerank(
+        self,
+        query: str,
+        results: list[RetrievalResult],
+    ) -> list[RetrievalResult]:
+
+        logger.info(
+            f"CrossEncoderReranker received {len(results)} retrieval results."
+        )
+
+        if not results:
+            logger.warning(
+                "No retrieval results available for reranking."
+            )
+            return results
+
+        started_at = time.perf_counter()
+
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+        scores = np.empty(len(results), dtype=np.float32)
+        missing: list[int] = []
+
+        for position, result in enumerate(results):
+            cached = self._scores.get((query_hash, result.chunk_id))
+
+            if cached is None:
+                missing.append(position)
+            else:
+                self._scores.move_to_end((query_hash, result.chunk_id))
+                scores[position] = cached
+
+        if missing:
+            missing_scores = await self._score(
+                query=query,
+                query_hash=query_hash,
+                results=[results[position] for position in missing],
+            )
+
+            if missing_scores is None:
+                logger.warning(
+                    "Cross-encoder exceeded the latency budget; "
+                    "keeping vector order."
+                )
+                return results
+
+            scores[missing] = missing_scores
+
+        # Stable sort keeps vector order between equal scores.
+        order = np.argsort(-scores, kind="stable")
+
+        reranked = [
+            results[position].model_copy(
+                update={
+                    "score": float(scores[position]),
+                    "metadata": {
+                        **results[position].metadata,
+                        "vector_score": results[position].score,
+                    },
+                }
+            )
+            for position in order
+        ]
+
+        logger.success(
+            f"Reranked {len(results)} results ({len(missing)} scored, "
+            f"{len(results) - len(missing)} cached) in "
+            f"{(time.perf_counter() - started_at) * 1000:.1f} ms."
+        )
+
+        return reranked
+
+    async def _score(
+        self,
+        query: str,
+        query_hash: str,
+        results: list[RetrievalResult],
+    ) -> np.ndarray | None:
+
+        task = asyncio.ensure_future(
+            self._cross_encoder.score(
+                query,
+                [result.text for result in results],
+            )
+        )
+
+        # Whatever finishes, early or late, goes into the cache.
+        task.add_done_callback(
+            lambda done: self._store(query_hash, results, done)
+        )
+
+        if self._latency_budget is None:
+            return await task
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(task),
+                timeout=self._latency_budget,
+            )
+        except TimeoutError:
+            return None
+
+    def _store(
+        self,
+        query_hash: str,
+        results: list[RetrievalResult],
+        task: asyncio.Future,
+    ) -> None:
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        for result, score in zip(results, task.result(), strict=True):
+            self._scores[(query_hash, result.chunk_id)] = float(score)
+
+        while len(self._scores) > self._cache_max_entries:
+            self._scores.popitem(last=False)
@@ -13,8 +13,17 @@ class ChunkMetadata(BaseModel):
 
     token_count: int | None = None
 
+    # Encoding `token_count` was computed with; counts are only reused
+    # under the same encoding.
+    token_encoding: str | None = None
+
     character_count: int | None = None
 
     element_count: int | None = None
 
+    # Near-duplicate chunks collapsed into this one before embedding.
+    duplicate_chunk_ids: list[str] | None = None
+
+    duplicate_page_numbers: list[int] | None = None
+
     # extra_metadata: dict[str, Any] = Field(default_factory=dict)
\ No newline at end of file
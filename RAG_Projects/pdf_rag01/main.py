@@ -1,12 +1,15 @@
 from fastapi import FastAPI
 from loguru import logger
 from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 from app.core.config import get_settings
 from app.domains.ingestion.router import router as ingestion_router
 from app.domains.retrieval.router import (
     router as retrieval_router,
 )
+from app.domains.generation.router import router as generation_router
 
 
 from app.infrastructure.vector_db.pinecone_manager import (
@@ -15,6 +18,9 @@ from app.infrastructure.vector_db.pinecone_manager import (
 from app.infrastructure.vector_db.pinecone_repository import (
     PineconeRepository
 )
+from app.infrastructure.vector_db.local_repository import (
+    LocalVectorRepository,
+)
 
 from app.infrastructure.embeddings.dense.sentence_transformer import (
     SentenceTransformerDenseEmbedder,
@@ -22,7 +28,45 @@ from app.infrastructure.embeddings.dense.sentence_transformer import (
 from app.infrastructure.embeddings.sparse.fastembed_sparse import (
     FastEmbedSparseEmbedder,
 )
+from app.infrastructure.embeddings.cache.embedding_cache import (
+    EmbeddingCache,
+)
+from app.infrastructure.embeddings.cache.cached_embedders import (
+    CachedDenseEmbedder,
+    CachedSparseEmbedder,
+)
+from app.infrastructure.embeddings.batching.batching_embedders import (
+    BatchingDenseEmbedder,
+    BatchingSparseEmbedder,
+)
 from app.infrastructure.embeddings.providers import state
+from app.infrastructure.rerankers.sentence_transformer_cross_encoder import (
+    SentenceTransformerCrossEncoder,
+)
+from app.rag_services.retrieval.rerankers.cross_encoder_reranker import (
+    CrossEncoderReranker,
+)
+from app.rag_services.retrieval.cache.retrieval_cache import RetrievalCache
+from app.rag_services.retrieval.cache.invalidating_repository import (
+    CacheInvalidatingRepository,
+)
+from app.domains.ingestion.services import get_document_ingestion_pipeline
+from app.rag_services.ingestion.jobs.ingestion_job_queue import (
+    IngestionJobQueue,
+)
+from app.rag_services.ingestion.jobs.in_memory_job_store import (
+    InMemoryJobStore,
+)
+from app.rag_services.ingestion.jobs.sqlite_job_store import SqliteJobStore
+from app.rag_services.ingestion.registry.sqlite_document_registry import (
+    SqliteDocumentRegistry,
+)
+from app.rag_services.ingestion.registry.sqlite_parent_chunk_store import (
+    SqliteParentChunkStore,
+)
+from app.infrastructure.prompts.in_memory_registry import InMemoryPromptRegistry
+from app.infrastructure.prompts.startup_register import register_prompts
+from app.infrastructure.llm.grok_client import GrokClient
 
 
 @asynccontextmanager
@@ -33,12 +77,117 @@ async def lifespan(app: FastAPI):
     state.dense_embedder = SentenceTransformerDenseEmbedder()
     state.sparse_embedder = FastEmbedSparseEmbedder()
 
-    manager = PineconeManager()
+    if settings.embedding_cache_enabled:
+        state.embedding_cache = EmbeddingCache(
+            max_memory_entries=settings.embedding_cache_max_entries,
+            sqlite_path=(
+                Path(settings.embedding_cache_path)
+                if settings.embedding_cache_path
+                else None
+            ),
+        )
+        state.dense_embedder = CachedDenseEmbedder(
+            state.dense_embedder,
+            state.embedding_cache,
+        )
+        state.sparse_embedder = CachedSparseEmbedder(
+            state.sparse_embedder,
+            state.embedding_cache,
+        )
+
+    # Outermost, so a coalesced batch is still served from the cache.
+    if settings.embedding_micro_batching_enabled:
+        state.dense_embedder = BatchingDenseEmbedder(
+            state.dense_embedder,
+            max_batch_size=settings.embedding_micro_batch_max_size,
+            max_wait_ms=settings.embedding_micro_batch_max_wait_ms,
+            max_queue_size=settings.embedding_micro_batch_max_queue,
+        )
+        state.sparse_embedder = BatchingSparseEmbedder(
+            state.sparse_embedder,
+            max_batch_size=settings.embedding_micro_batch_max_size,
+            max_wait_ms=settings.embedding_micro_batch_max_wait_ms,
+            max_queue_size=settings.embedding_micro_batch_max_queue,
+        )
+
+    if settings.reranker == "cross_encoder":
+        state.reranker = CrossEncoderReranker(
+            SentenceTransformerCrossEncoder(),
+            latency_budget_ms=settings.reranker_latency_budget_ms,
+            cache_max_entries=settings.reranker_cache_max_entries,
+        )
+
+    if settings.document_loader_workers > 1:
+        state.partition_executor = ProcessPoolExecutor(
+            max_workers=settings.document_loader_workers,
+        )
+
+    if settings.vector_store == "local":
+        repository = LocalVectorRepository(
+            storage_path=(
+                Path(settings.local_vector_store_path)
+                if settings.local_vector_store_path
+                else None
+            ),
+            ivf_min_vectors=settings.local_vector_store_ivf_min_vectors,
+            ivf_probes=settings.local_vector_store_ivf_probes,
+            autosave_seconds=settings.local_vector_store_autosave_seconds,
+        )
+    else:
+        manager = PineconeManager()
+
+        await manager.create_index()
+        await manager.wait_until_ready()
+
+        repository = PineconeRepository()
+
+    state.vector_repository = repository
 
-    await manager.create_index()
-    await manager.wait_until_ready()
+    # Writes go through the wrapper so cached retrievals of the changed
+    # namespace are dropped.
+    if settings.retrieval_cache_enabled:
+        state.retrieval_cache = RetrievalCache(
+            max_entries=settings.retrieval_cache_max_entries,
+            ttl_seconds=settings.retrieval_cache_ttl_seconds,
+            similarity_threshold=settings.retrieval_cache_similarity_threshold,
+        )
+        state.vector_repository = CacheInvalidatingRepository(
+            repository,
+            state.retrieval_cache,
+        )
 
-    state.vector_repository = PineconeRepository()
+    if settings.document_registry_path:
+        state.document_registry = SqliteDocumentRegistry(
+            Path(settings.document_registry_path),
+        )
+
+    # Opened even with hierarchical chunking off, so parents of
+    # documents ingested earlier still resolve.
+    if settings.parent_chunk_store_path:
+        state.parent_chunk_store = SqliteParentChunkStore(
+            Path(settings.parent_chunk_store_path),
+        )
+
+    state.prompt_registry = InMemoryPromptRegistry()
+    await register_prompts(state.prompt_registry)
+
+    # Without a key /query answers 500; ingestion and retrieval still work.
+    if settings.grok_api_key:
+        state.llm_client = GrokClient()
+    else:
+        logger.warning("GROK_API_KEY is not set; generation is disabled.")
+
+    state.ingestion_jobs = IngestionJobQueue(
+        store=(
+            SqliteJobStore(Path(settings.ingestion_job_store_path))
+            if settings.ingestion_job_store_path
+            else InMemoryJobStore()
+        ),
+        pipeline_factory=get_document_ingestion_pipeline,
+        concurrency=settings.ingestion_job_workers,
+    )
+
+    await state.ingestion_jobs.start()
 
     logger.success("Application resources initialized.")
 
@@ -46,6 +195,26 @@ async def lifespan(app: FastAPI):
 
     logger.info("Shutting down application.")
 
+    await state.ingestion_jobs.stop()
+
+    if state.document_registry is not None:
+        state.document_registry.close()
+
+    if state.parent_chunk_store is not None:
+        state.parent_chunk_store.close()
+
+    repository.close()
+
+    for embedder in (state.dense_embedder, state.sparse_embedder):
+        if isinstance(embedder, BatchingDenseEmbedder | BatchingSparseEmbedder):
+            await embedder.close()
+
+    if state.embedding_cache is not None:
+        state.embedding_cache.close()
+
+    if state.partition_executor is not None:
+        state.partition_executor.shutdown(cancel_futures=True)
+
 settings = get_settings()
 
 app = FastAPI(
@@ -61,6 +230,9 @@ app.include_router(
 app.include_router(
     retrieval_router
 )
+app.include_router(
+    generation_router,
+)
 
 
 
@@ -68,8 +240,23 @@ app.include_router(
 async def health_check() -> dict:
     logger.info("Health check endpoint called.")
 
-    return {
+    response = {
         "status": "healthy",
         "application": settings.APP_NAME,
         "version": settings.APP_VERSION,
-    }
\ No newline at end of file
+    }
+
+    if state.embedding_cache is not None:
+        response["embedding_cache"] = state.embedding_cache.stats().model_dump()
+
+    if state.retrieval_cache is not None:
+        response["retrieval_cache"] = state.retrieval_cache.stats().model_dump()
+
+    for key, embedder in (
+        ("dense_embedding_batcher", state.dense_embedder),
+        ("sparse_embedding_batcher", state.sparse_embedder),
+    ):
+        if isinstance(embedder, BatchingDenseEmbedder | BatchingSparseEmbedder):
+            response[key] = embedder.stats().model_dump()
+
+    return response
\ No newline at end of file
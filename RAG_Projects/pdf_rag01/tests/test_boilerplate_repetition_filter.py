@@ -0,0 +1,117 @@
+import asyncio
+
+from app.rag_services.ingestion.filters.boilerplate_repetition_filter import (
+    BoilerplateRepetitionFilter,
+)
+from app.schemas.document import (
+    Document,
+    DocumentElement,
+    DocumentElementType,
+    DocumentMetadata,
+)
+
+
+def _element(
+    page_number: int,
+    slot: int,
+    text: str,
+    element_type: DocumentElementType = DocumentElementType.NARRATIVE_TEXT,
+) -> DocumentElement:
+    return DocumentElement(
+        element_id=f"{page_number}-{slot}",
+        element_type=element_type,
+        text=text,
+        page_number=page_number,
+    )
+
+
+def _document(pages: list[list[DocumentElement]]) -> Document:
+    return Document(
+        document_id="book",
+        filename="book.pdf",
+        elements=[element for page in pages for element in page],
+        metadata=DocumentMetadata(
+            parser="test",
+            filename="book.pdf",
+            file_size_bytes=0,
+            page_count=len(pages),
+            checksum="0",
+        ),
+    )
+
+
+def _book() -> Document:
+    """
+    Ten chapters of three pages each. Every page carries a running head
+    and a copyright line; every chapter opens with a numbered heading
+    and closes with "Summary" and "Exercises" titles.
+    """
+
+    pages = []
+
+    for chapter in range(1, 11):
+        for page in range(3):
+            page_number = (chapter - 1) * 3 + page + 1
+
+            elements = [
+                _element(page_number, 0, f"Chapter {chapter} · {page_number}"),
+            ]
+
+            if page == 0:
+                elements.append(
+                    _element(
+                        page_number,
+                        1,
+                        f"Chapter {chapter}",
+                        DocumentElementType.TITLE,
+                    )
+                )
+
+            elements += [
+                _element(page_number, 2, f"Body of page {page_number}, part one."),
+                _element(page_number, 3, "See figure 1."),
+                _element(page_number, 4, f"Body of page {page_number}, part two."),
+            ]
+
+            if page == 2:
+                elements += [
+                    _element(page_number, 5, "Summary", DocumentElementType.TITLE),
+                    _element(page_number, 6, "Exercises", DocumentElementType.TITLE),
+                ]
+
+            elements.append(
+                _element(page_number, 7, "© 2024 Example Press. All rights reserved.")
+            )
+
+            pages.append(elements)
+
+    return _document(pages)
+
+
+def _texts(document: Document) -> list[str]:
+    return [element.text for element in document.elements]
+
+
+def test_chapter_headings_survive():
+    document = asyncio.run(BoilerplateRepetitionFilter().filter(_book()))
+    texts = _texts(document)
+
+    assert [text for text in texts if text.startswith("Chapter ") and "·" not in text] == [
+        f"Chapter {chapter}" for chapter in range(1, 11)
+    ]
+    assert texts.count("Summary") == 10
+    assert texts.count("Exercises") == 10
+
+
+def test_repeated_page_edges_are_dropped():
+    document = asyncio.run(BoilerplateRepetitionFilter().filter(_book()))
+    texts = _texts(document)
+
+    assert not any("·" in text for text in texts)
+    assert not any(text.startswith("©") for text in texts)
+
+
+def test_repeats_in_the_middle_of_a_page_are_kept():
+    document = asyncio.run(BoilerplateRepetitionFilter().filter(_book()))
+
+    assert _texts(document).count("See figure 1.") == 30